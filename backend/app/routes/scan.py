@@ -133,7 +133,7 @@ async def get_scan_report(scan_id: str):
         if 'cluster_map' in scan_status and scan_status['cluster_map']:
             cluster_file = scan_status['cluster_map']
             if os.path.exists(cluster_file):
-                with open(cluster_file, 'r') as f:
+                with open(cluster_file, 'r', encoding='utf-8') as f:
                     cluster_data = json.load(f)
                     report_data['type'] = 'cluster'
                     report_data['data'] = cluster_data
@@ -149,7 +149,7 @@ async def get_scan_report(scan_id: str):
         if 'health_report' in scan_status and scan_status['health_report']:
             health_file = scan_status['health_report']
             if os.path.exists(health_file):
-                with open(health_file, 'r') as f:
+                with open(health_file, 'r', encoding='utf-8') as f:
                     health_data = json.load(f)
                     report_data['type'] = 'health'
                     report_data['data'] = health_data
@@ -13,13 +13,23 @@ Enhanced with:
 import os
 import io
 import json
+import re
+import ssl
 import struct
+import time
+import array
+import bisect
+import zlib
 import hashlib
 import logging
 import platform
+import subprocess
+import threading
 import mmap
-from typing import List, Dict, Optional, BinaryIO, Callable
+import multiprocessing
+from typing import List, Dict, Optional, BinaryIO, Callable, Tuple
 from datetime import datetime
+from collections import OrderedDict, deque
 import asyncio
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import concurrent.futures
@@ -46,8 +56,62 @@ try:
 except ImportError:
     PYTSK3_AVAILABLE = False
 
+# Optional Aho-Corasick automaton for single-pass multi-signature scanning
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Optional BLAKE3 (SIMD) for duplicate-detection keys
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+# Optional orjson for fast manifest serialization (falls back to json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional NumPy + Numba for the JIT-compiled signature scan kernel
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit, types as nb_types
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Resolved once at import instead of per call in the I/O paths
+IS_WINDOWS = platform.system() == 'Windows'
+_SUBPROC_FLAGS = subprocess.CREATE_NO_WINDOW if IS_WINDOWS else 0  # No console window for smartctl
+
+# pywin32 for raw device access on Windows
+if IS_WINDOWS:
+    try:
+        import win32file
+        import pywintypes
+        WIN32_AVAILABLE = True
+        _WIN32_MOVE_METHODS = {
+            0: win32file.FILE_BEGIN,      # Absolute position
+            1: win32file.FILE_CURRENT,    # Relative to current
+            2: win32file.FILE_END         # Relative to end
+        }
+    except ImportError:
+        WIN32_AVAILABLE = False
+else:
+    WIN32_AVAILABLE = False
+
 
 class Win32FileWrapper:
     """Wrapper for Windows file handles to provide file-like interface"""
@@ -69,15 +133,8 @@ class Win32FileWrapper:
             raise ValueError("I/O operation on closed file")
         
         try:
-            import win32file
-            import pywintypes
-            
             # Map whence to Windows constants
-            move_method = {
-                0: win32file.FILE_BEGIN,      # Absolute position
-                1: win32file.FILE_CURRENT,    # Relative to current
-                2: win32file.FILE_END         # Relative to end
-            }.get(whence, win32file.FILE_BEGIN)
+            move_method = _WIN32_MOVE_METHODS.get(whence, _WIN32_MOVE_METHODS[0])
             
             # For large offsets, split into high and low 32-bit values
             # This is required for raw disk access with files > 4GB
@@ -133,8 +190,6 @@ class Win32FileWrapper:
             raise ValueError("I/O operation on closed file")
         
         try:
-            import win32file
-            
             if size == -1:
                 size = 1024 * 1024  # Default 1MB
             
@@ -146,11 +201,60 @@ class Win32FileWrapper:
             logger.error(f"Error reading from handle: {e}")
             return b''
     
+    def readinto(self, buffer) -> int:
+        """Read into a pre-allocated writable buffer (avoids a new bytes object per read)
+        
+        Args:
+            buffer: Writable buffer (bytearray or memoryview); its length is the read size
+            
+        Returns:
+            Number of bytes read
+        """
+        if self.closed:
+            raise ValueError("I/O operation on closed file")
+        
+        try:
+            # ReadFile fills a passed-in buffer and returns the part that was read
+            hr, data = win32file.ReadFile(self.handle, buffer, None)
+            count = len(data)
+            self.position += count
+            return count
+        except Exception as e:
+            logger.error(f"Error reading from handle: {e}")
+            return 0
+    
+    def pread(self, size: int, offset: int) -> bytes:
+        """Read size bytes at offset without moving the file position (like os.pread)
+        
+        A synchronous handle given an OVERLAPPED reads at the offset it carries, so
+        this is one ReadFile call instead of SetFilePointer + ReadFile, and several
+        threads can use the handle at once.
+        
+        Args:
+            size: Number of bytes to read
+            offset: Absolute byte offset
+            
+        Returns:
+            The bytes read (empty on error or past the end)
+        """
+        if self.closed:
+            raise ValueError("I/O operation on closed file")
+        
+        try:
+            overlapped = pywintypes.OVERLAPPED()
+            overlapped.Offset = offset & 0xFFFFFFFF
+            overlapped.OffsetHigh = offset >> 32
+            hr, buffer = win32file.ReadFile(self.handle, size, overlapped)
+            count = win32file.GetOverlappedResult(self.handle, overlapped, True)
+            return bytes(buffer[:count])
+        except Exception as e:
+            logger.error(f"Error reading from handle at offset {offset}: {e}")
+            return b''
+    
     def close(self):
         """Close the file handle"""
         if not self.closed:
             try:
-                import win32file
                 win32file.CloseHandle(self.handle)
                 self.closed = True
                 logger.debug("File handle closed successfully")
@@ -255,12 +359,795 @@ class FileSignature:
     }
 
 
+# NTFS boot sector: bytes per sector (0x0B), sectors per cluster (0x0D), MFT start cluster (0x30)
+_NTFS_BPB = struct.Struct('<11xHB34xQ')
+
+# MFT entry header: signature (0x00), first attribute offset (0x14), flags (0x16)
+_MFT_ENTRY_HEADER = struct.Struct('<4s16xHH')
+# MFT attribute header: type (0x00), length (0x04); resident value length (0x10) and
+# offset (0x14); non-resident data runs offset (0x20) and real stream size (0x30)
+_MFT_ATTR_HEADER = struct.Struct('<II')
+_MFT_RESIDENT_VALUE = struct.Struct('<IH')
+_MFT_NONRESIDENT_RUNS = struct.Struct('<H')
+_MFT_NONRESIDENT_SIZE = struct.Struct('<Q')
+_MFT_BATCH_ENTRIES = 4096  # MFT entries read and screened per batch (4 MB)
+_MFT_YIELD_INTERVAL = 100  # Deleted-entry candidates parsed between event-loop yields
+
+if NUMPY_AVAILABLE:
+    # The same header fields as a structured dtype spanning a whole 1 KB record
+    _MFT_RECORD_DTYPE = np.dtype({
+        'names': ['magic', 'first_attr', 'flags'],
+        'formats': ['S4', '<u2', '<u2'],
+        'offsets': [0x00, 0x14, 0x16],
+        'itemsize': 1024,
+    })
+
+
+# Runs of printable 7-bit text (plus TAB/CR/LF) long enough to carve as txt/csv.
+# Header-less types are found by this second pass instead of the signature scanner.
+_TEXT_MIN_RUN = 4096
+# The lookbehind only lets a match start at the beginning of a run, so a short run
+# is rejected once instead of being rescanned from every byte inside it
+_TEXT_RUN_RE = re.compile(rb'(?<![\t\n\r\x20-\x7e])[\t\n\r\x20-\x7e]{%d,}' % _TEXT_MIN_RUN)
+# Printable continuation of a run that crosses a window boundary
+_TEXT_TAIL_RE = re.compile(rb'[\t\n\r\x20-\x7e]*')
+_TEXT_MAX_SIZE = {'txt': 512 * 1024, 'csv': 1024 * 1024}  # Same caps as _extract_file
+
+# Characters not allowed in Windows file names -> '_'
+_FILENAME_TRANS = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+# PNG chunk header (length, type) and JPEG segment marker + length, for structural checks
+_PNG_CHUNK_HEADER = struct.Struct('>I4s')
+_JPEG_SEGMENT_HEADER = struct.Struct('>BBH')
+# JPEG start-of-frame markers (baseline, extended, progressive, lossless, ...) - not DHT/JPG/DAC
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+_IMAGE_MODE_PROBE = 128 * 1024  # Bytes handed to Image.open for the mode (covers APPn/EXIF before SOF)
+# Pillow mode names derived from the headers: PNG IHDR colour type, JPEG SOF component count
+_PNG_IHDR = struct.Struct('>IIBB')  # Width, height, bit depth, colour type
+_PNG_COLOR_MODES = {0: 'L', 2: 'RGB', 3: 'P', 4: 'LA', 6: 'RGBA'}
+_JPEG_COMPONENT_MODES = {1: 'L', 3: 'RGB', 4: 'CMYK'}
+
+# Extraction of types without a signature footer: ext -> (end marker, search start past the
+# header, bytes kept from the marker start, what is missing if the marker isn't found)
+_END_MARKER_RULES = {
+    'jpg': (b'\xff\xd9', 2, 2, 'no EOI marker found'),
+    'jpeg': (b'\xff\xd9', 2, 2, 'no EOI marker found'),
+    'png': (b'\x00\x00\x00\x00IEND\xae\x42\x60\x82', 8, 12, 'no IEND chunk found'),
+    # End of central directory record is 22 bytes
+    'docx': (b'PK\x05\x06', 100, 22, 'no ZIP end marker found'),
+    'xlsx': (b'PK\x05\x06', 100, 22, 'no ZIP end marker found'),
+    'pptx': (b'PK\x05\x06', 100, 22, 'no ZIP end marker found'),
+    'zip': (b'PK\x05\x06', 100, 22, 'no ZIP end marker found'),
+    'pdf': (b'%%EOF', 10, 5, 'no %%EOF marker found'),
+}
+# ...and size caps for the rest (CONSERVATIVE: short clips, typical songs, small databases)
+_CAPPED_EXTRACT_SIZES = {
+    'mp3': 5 * 1024 * 1024,
+    'wav': 5 * 1024 * 1024,
+    'mp4': 10 * 1024 * 1024,
+    'mov': 10 * 1024 * 1024,
+    'avi': 10 * 1024 * 1024,
+    'txt': 512 * 1024,
+    'rar': 5 * 1024 * 1024,  # RAR end markers are not reliable
+    'sqlite': 5 * 1024 * 1024,
+    'db': 5 * 1024 * 1024,
+    'sqlite3': 5 * 1024 * 1024,
+    'csv': 1 * 1024 * 1024,
+}
+# MPEG audio Layer III frame header: 11-bit sync, MPEG 1/2/2.5 (not the reserved
+# version), then a usable bitrate index (not free/bad) and sample rate (not reserved)
+_MP3_FRAME_HEADER = re.compile(
+    b'\xFF[\xE2\xE3\xF2\xF3\xFA\xFB]['
+    + b''.join(re.escape(bytes([b])) for b in range(256)
+               if 0 < b >> 4 < 15 and b & 0x0C != 0x0C)
+    + b']')
+
+# RIFF container header (WAV/AVI): 'RIFF', chunk size, form type
+_RIFF_HDR = struct.Struct('<4sI4s')
+# ID3v2 tag size: four syncsafe bytes (7 bits each) at offset 6, read as one big-endian word
+_ID3_SIZE = struct.Struct('>6xI')
+
+# ISO base media brands accepted by the MP4/MOV validator
+_MP4_BRANDS = frozenset({b'mp41', b'mp42', b'isom', b'qt  ', b'M4V ', b'M4A '})
+
+# Cluster previews: printable ASCII kept, every other byte shown as '.'
+_ASCII_PREVIEW = bytes(b if 32 <= b < 127 else 0x2E for b in range(256))
+
+# Office Open XML: ext -> (application folder, main part) near the start of the ZIP
+_OFFICE_PARTS = {
+    'docx': (b'word/', b'document.xml'),
+    'xlsx': (b'xl/', b'workbook.xml'),
+    'pptx': (b'ppt/', b'presentation.xml'),
+}
+
+# MIME types libmagic must report for a validation bonus
+_EXPECTED_MIMES = {
+    'jpg': 'image/jpeg',
+    'jpeg': 'image/jpeg',
+    'png': 'image/png',
+    'pdf': 'application/pdf',
+    'zip': 'application/zip',
+    'mp4': 'video/mp4',
+    'mp3': 'audio/mpeg',
+}
+# Completeness scoring: ext -> (end marker, tail it must appear in)
+_COMPLETENESS_TAILS = {
+    'jpg': (b'\xFF\xD9', 10),
+    'jpeg': (b'\xFF\xD9', 10),
+    'png': (b'IEND\xae\x42\x60\x82', 8),  # i.e. endswith
+    'pdf': (b'%%EOF', 100),
+    'docx': (b'PK\x05\x06', 1000),
+    'xlsx': (b'PK\x05\x06', 1000),
+    'pptx': (b'PK\x05\x06', 1000),
+    'zip': (b'PK\x05\x06', 1000),
+}
+
+# SMART counters that cost health points:
+# attribute -> (penalty cap, points per unit, recommendation, check name, check status, check details)
+_SMART_COUNTER_RULES = (
+    ('Reallocated_Sector_Count', 20, 1, "⚠️ {:,} reallocated sectors",
+     'Reallocated Sectors', 'warning', "{:,} sectors have been reallocated"),
+    ('Current_Pending_Sector', 15, 2, "⚠️ {:,} pending sectors",
+     'Pending Sectors', 'fail', "{:,} sectors are pending reallocation"),
+    ('Media_Errors', 30, 10, "⚠️ {} media errors detected",
+     'Media Errors', 'fail', "{} media errors detected on NVMe drive"),
+)
+
+# Footer lookups for the carver: signature name -> (footer, footer length, header length)
+_FOOTER_TABLE = {
+    name: (sig['footer'], len(sig['footer']), len(sig['header']))
+    for name, sig in FileSignature.SIGNATURES.items()
+    if sig.get('footer') and sig.get('header')
+}
+
+
+if NUMBA_AVAILABLE:
+    _NB_BYTES = nb_types.Array(nb_types.uint8, 1, 'C', readonly=True)
+    _NB_INTS = nb_types.Array(nb_types.int64, 1, 'C')
+    # (data, start, end, patterns, pattern offsets, pattern lengths, pattern anchors,
+    #  anchor-byte bucket starts, bucket pattern ids, out positions, out pattern ids) -> hit count
+    _NB_SCAN_SIGNATURE = nb_types.int64(_NB_BYTES, nb_types.int64, nb_types.int64, _NB_BYTES,
+                                        _NB_INTS, _NB_INTS, _NB_INTS, _NB_INTS, _NB_INTS,
+                                        _NB_INTS, _NB_INTS)
+
+    @njit(cache=True, nogil=True, boundscheck=False)
+    def _nb_scan_headers(data, start, end, patterns, pat_offsets, pat_lengths, pat_anchors,
+                         bucket_starts, bucket_ids, out_pos, out_ids):
+        """
+        Single pass over data[start:end] matching every header
+        
+        Headers are bucketed by their first non-zero byte (the anchor), so zero-filled
+        sectors never enter the inner loop even for headers like \x00\x00\x00\x18ftyp.
+        """
+        n_out = 0
+        for i in range(start, end):
+            b = data[i]
+            for j in range(bucket_starts[b], bucket_starts[b + 1]):
+                p = bucket_ids[j]
+                pos = i - pat_anchors[p]
+                plen = pat_lengths[p]
+                if pos < start or pos + plen > end:
+                    continue
+                off = pat_offsets[p]
+                k = 0
+                while k < plen and data[pos + k] == patterns[off + k]:
+                    k += 1
+                if k == plen:
+                    if n_out < out_pos.shape[0]:
+                        out_pos[n_out] = pos
+                        out_ids[n_out] = p
+                    n_out += 1
+        return n_out
+
+# Set once the scan kernel is compiled (see _warm_up_scan_kernels)
+_NUMBA_SCAN_READY = False
+_NUMBA_MIN_SCAN = 8 * 1024  # Below this, the fallback search is cheaper than the kernel call overhead
+_scan_table_cache = {}
+_header_group_cache = {}
+_automaton_cache = {}
+_NVME_UNIT_TB = (512 * 1000) / (1024 ** 4)  # NVMe data units (1000 x 512 bytes) -> TB
+_SURFACE_QUEUE_DEPTH = 16  # Surface-scan sector reads kept in flight
+_SMARTCTL_SCAN_TTL = 30  # Seconds a `smartctl --scan` device list (or a failed smartctl lookup) is reused
+_PYSMART_GRACE = 2.0  # Seconds smartctl runs alone before the pySMART fallback is started beside it
+_MAX_PENDING_FILES = 16  # Carved files queued on the I/O pool before the scan waits for them
+_VALIDATE_MEMO_SIZE = 4096  # Validation verdicts remembered per service (oldest evicted first)
+
+# Hashing and file writes release the GIL - carved files are hashed/stored on this pool
+# while the scan loop continues. Shared by all service instances (threads start lazily).
+_IO_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='recovery-io')
+
+# Carving scans write files here first (project root/backend/recovered_files);
+# they are copied to the final output path on recovery
+_TEMP_RECOVERY_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'backend', 'recovered_files')
+
+
+def _warm_up_scan_kernels():
+    """
+    Compile the Numba scan kernel for its explicit signature ahead of the first scan
+    
+    The first call to a JIT function otherwise pays a multi-second compile in the
+    middle of a scan. cache=True persists the machine code in __pycache__, so later
+    runs only load it.
+    """
+    global _NUMBA_SCAN_READY
+    if _NUMBA_SCAN_READY or not NUMBA_AVAILABLE:
+        return
+    try:
+        _nb_scan_headers.compile(_NB_SCAN_SIGNATURE)
+        _NUMBA_SCAN_READY = True
+        logger.info("⚡ Numba signature scan kernel ready")
+    except Exception as e:
+        logger.warning(f"Numba scan kernel unavailable, using bytes.find: {e}")
+
+
+_SHA256_PROBE_SIZE = 8 * 1024 * 1024
+_SHA256_MIN_MBPS = 500  # Well below SHA-NI / ARMv8 SHA2 throughput, well above the scalar path
+_sha256_probed = False
+
+
+def _probe_sha256_backend():
+    """
+    Check once per process that SHA-256 runs on hardware-accelerated code
+    
+    hashlib uses OpenSSL, which dispatches to the Intel SHA extensions or ARMv8 SHA2
+    instructions when the CPU has them. Builds against an old OpenSSL (or one with
+    those paths disabled via OPENSSL_ia32cap) silently fall back to scalar code
+    that makes hashing, not the drive, the bottleneck of a carving scan.
+    """
+    global _sha256_probed
+    if _sha256_probed:
+        return
+    _sha256_probed = True
+    
+    data = bytes(_SHA256_PROBE_SIZE)
+    started = time.perf_counter()
+    hashlib.sha256(data).digest()
+    elapsed = time.perf_counter() - started
+    mb_per_sec = _SHA256_PROBE_SIZE / (1024 * 1024) / max(elapsed, 1e-9)
+    
+    logger.info(f"🔐 SHA-256 via {ssl.OPENSSL_VERSION}: {mb_per_sec:.0f} MB/s")
+    if platform.machine().lower() in ('x86_64', 'amd64', 'aarch64', 'arm64') and mb_per_sec < _SHA256_MIN_MBPS:
+        logger.warning(f"⚠️ SHA-256 is running at {mb_per_sec:.0f} MB/s - OpenSSL does not appear to use "
+                       f"the CPU's SHA instructions. Use a Python linked against OpenSSL 1.1.1+ "
+                       f"for faster hashing of recovered files")
+
+
+def _get_scan_table(signatures: Dict) -> tuple:
+    """Flatten signature headers into the arrays consumed by _nb_scan_headers (cached per signature set)"""
+    key = tuple(signatures)
+    table = _scan_table_cache.get(key)
+    if table is None:
+        names = list(signatures)
+        headers = [signatures[name]['header'] for name in names]
+        lengths = np.array([len(h) for h in headers], dtype=np.int64)
+        offsets = np.zeros(len(headers), dtype=np.int64)
+        offsets[1:] = np.cumsum(lengths)[:-1]
+        
+        # Anchor each header on its first non-zero byte
+        anchors = np.array([len(h) - len(h.lstrip(b'\x00')) if h.strip(b'\x00') else 0
+                            for h in headers], dtype=np.int64)
+        anchor_bytes = np.array([h[a] for h, a in zip(headers, anchors.tolist())], dtype=np.int64)
+        
+        # CSR buckets: pattern ids grouped by anchor byte, in signature order
+        bucket_ids = np.argsort(anchor_bytes, kind='stable').astype(np.int64)
+        bucket_starts = np.zeros(257, dtype=np.int64)
+        bucket_starts[1:] = np.cumsum(np.bincount(anchor_bytes, minlength=256))
+        
+        patterns = np.frombuffer(b''.join(headers), dtype=np.uint8)
+        
+        # Hit post-filter fields, indexed by pattern id like the arrays above
+        header_offsets = [signatures[name].get('offset', 0) for name in names]
+        checks = [signatures[name].get('check') for name in names]
+        table = (names, patterns, offsets, lengths, anchors, bucket_starts, bucket_ids,
+                 header_offsets, checks)
+        _scan_table_cache[key] = table
+    return table
+
+
+def _find_signature_hits_numba(data, start: int, end: int, signatures: Dict) -> List[Tuple[str, int]]:
+    """Numba variant of _find_signature_hits: one pass over the data for all headers"""
+    (names, patterns, offsets, lengths, anchors, bucket_starts, bucket_ids,
+     header_offsets, checks) = _get_scan_table(signatures)
+    view = np.frombuffer(data, dtype=np.uint8)
+    # bytearray/mmap give writable arrays - present them read-only so every call
+    # matches the single signature compiled at startup instead of JIT-ing a second one
+    view.flags.writeable = False
+    
+    capacity = (end - start) // 256 + 1024
+    while True:
+        out_pos = np.empty(capacity, dtype=np.int64)
+        out_ids = np.empty(capacity, dtype=np.int64)
+        count = _nb_scan_headers(view, start, end, patterns, offsets, lengths, anchors,
+                                 bucket_starts, bucket_ids, out_pos, out_ids)
+        if count <= capacity:
+            break
+        capacity = count
+    
+    # Anchored matches come out slightly out of order - restore position order
+    order = np.argsort(out_pos[:count], kind='stable')
+    
+    hits = []
+    for pos, sig_id in zip(out_pos[order].tolist(), out_ids[order].tolist()):
+        actual_pos = pos - header_offsets[sig_id]
+        check_bytes = checks[sig_id]
+        if actual_pos >= 0 and (check_bytes is None or
+                                data.find(check_bytes, actual_pos, actual_pos + 1000) != -1):
+            hits.append((names[sig_id], pos))
+    return hits
+
+
+def _get_header_groups(signatures: Dict) -> Dict[bytes, tuple]:
+    """
+    Group signatures by header bytes (cached per signature set)
+    
+    Signatures sharing a header (ZIP/DOCX/XLSX, ...) are matched by one search;
+    each group lists (name, header offset, check bytes) in signature order.
+    """
+    key = tuple(signatures)
+    groups = _header_group_cache.get(key)
+    if groups is None:
+        groups = {}
+        for name, info in signatures.items():
+            groups.setdefault(info['header'], []).append(
+                (name, info.get('offset', 0), info.get('check')))
+        groups = {header: tuple(entries) for header, entries in groups.items()}
+        _header_group_cache[key] = groups
+    return groups
+
+
+def _get_signature_automaton(signatures: Dict):
+    """
+    Build an Aho-Corasick automaton over all signature headers (cached per signature set)
+    
+    pyahocorasick's default build matches str, so headers are mapped byte-for-byte
+    to code points via latin-1. Each header group from _get_header_groups is one word.
+    """
+    key = tuple(signatures)
+    automaton = _automaton_cache.get(key)
+    if automaton is None:
+        automaton = ahocorasick.Automaton()
+        for header, entries in _get_header_groups(signatures).items():
+            automaton.add_word(header.decode('latin-1'), (len(header) - 1, entries))
+        automaton.make_automaton()
+        _automaton_cache[key] = automaton
+    return automaton
+
+
+def _find_signature_hits_ac(data, start: int, end: int, signatures: Dict) -> List[Tuple[str, int]]:
+    """Aho-Corasick variant of _find_signature_hits: one pass over the data for all headers"""
+    automaton = _get_signature_automaton(signatures)
+    text = str(data[start:end], 'latin-1')
+    
+    hits = []
+    for end_idx, (span, entries) in automaton.iter(text):
+        pos = start + end_idx - span
+        for sig_name, header_offset, check_bytes in entries:
+            actual_pos = pos - header_offset
+            if actual_pos >= 0 and (check_bytes is None or
+                                    data.find(check_bytes, actual_pos, actual_pos + 1000) != -1):
+                hits.append((sig_name, pos))
+    
+    # Matches are reported by end position - restore header position order
+    hits.sort(key=lambda hit: hit[1])
+    return hits
+
+
+def _find_signature_hits(data, start: int, end: int, signatures: Dict) -> List[Tuple[str, int]]:
+    """
+    Find signature headers lying entirely inside data[start:end]
+
+    Works on bytes and mmap objects alike, so the same code serves in-process
+    chunks and worker processes scanning their own mapping of the drive.
+
+    Args:
+        data: bytes-like object (bytes, bytearray or mmap) to search
+        start: First position to search
+        end: End of the search window (exclusive)
+        signatures: Dictionary of signatures to search for
+
+    Returns:
+        List of (signature name, header position) tuples
+    """
+    if _NUMBA_SCAN_READY and end - start >= _NUMBA_MIN_SCAN:
+        return _find_signature_hits_numba(data, start, end, signatures)
+    if AHOCORASICK_AVAILABLE:
+        return _find_signature_hits_ac(data, start, end, signatures)
+    
+    # One find() pass per distinct header, not per signature
+    hits = []
+    for header, entries in _get_header_groups(signatures).items():
+        pos = data.find(header, start, end)
+        while pos != -1:
+            for sig_name, header_offset, check_bytes in entries:
+                actual_pos = pos - header_offset
+                if actual_pos >= 0 and (check_bytes is None or
+                                        data.find(check_bytes, actual_pos, actual_pos + 1000) != -1):
+                    hits.append((sig_name, pos))
+            pos = data.find(header, pos + 1, end)
+    
+    # Same position order as the single-pass backends
+    hits.sort(key=lambda hit: hit[1])
+    return hits
+
+
+# Per-process state for parallel signature scanning. Each worker maps the drive
+# itself, so chunks are handed over as (offset, length) and never pickled.
+_worker_drive_view = None
+_worker_signatures = None
+
+
+def _init_scan_worker(drive_path: str, signatures: Dict):
+    """ProcessPoolExecutor initializer: map the drive read-only once per worker"""
+    global _worker_drive_view, _worker_signatures
+
+    fd = os.open(drive_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        # Block devices report st_size 0, so take the size from the end offset
+        size = os.lseek(fd, 0, os.SEEK_END)
+        _worker_drive_view = mmap.mmap(fd, size, access=mmap.ACCESS_READ)
+    finally:
+        os.close(fd)
+    _worker_signatures = signatures
+    _warm_up_scan_kernels()
+
+
+def _scan_region_worker(chunk_id: int, offset: int, length: int) -> Tuple[int, List[Tuple[str, int]]]:
+    """Scan drive[offset:offset + length] in a worker process, returning only hit offsets"""
+    end = min(offset + length, len(_worker_drive_view))
+    if hasattr(mmap, 'MADV_WILLNEED') and end > offset:
+        # Read the whole window ahead in large requests instead of page fault by page fault;
+        # the pages stay cached for the main process's own read of this window
+        start = offset - offset % mmap.PAGESIZE
+        try:
+            _worker_drive_view.madvise(mmap.MADV_WILLNEED, start, end - start)
+        except OSError:
+            pass
+    return chunk_id, _find_signature_hits(_worker_drive_view, offset, end, _worker_signatures)
+
+
+def _count_at_least(data, sub: bytes, n: int) -> bool:
+    """
+    data.count(sub) >= n, stopping at the n-th match instead of walking all of data
+    
+    Validators only compare counts against small thresholds, so for real files the
+    answer is known after the first few hundred bytes.
+    """
+    pos = 0
+    step = len(sub)
+    for _ in range(n):
+        pos = data.find(sub, pos)
+        if pos == -1:
+            return False
+        pos += step
+    return True
+
+
+_END_PROBE_WINDOW = 16384  # Bytes at each end of a file probed before searching all of it
+
+
+def _contains_near_ends(data, sub: bytes) -> bool:
+    """
+    sub in data, probing the first and last _END_PROBE_WINDOW bytes first
+    
+    Structures such as the PDF xref/trailer, the ZIP central directory and a
+    camera MP4's moov box sit at the end of the file, so a plain forward search
+    walks the whole body before finding them. The answer is the same either way.
+    """
+    return (data.find(sub, 0, _END_PROBE_WINDOW) != -1
+            or data.find(sub, -_END_PROBE_WINDOW) != -1
+            or sub in data)
+
+
+# One ATA SMART attribute record: id, flags, current, worst, 6-byte raw value
+_SMART_ATTR = struct.Struct('>BHBB6s')
+
+# Common SMART attribute IDs, indexed by ID (None for IDs not reported)
+_SMART_ATTR_NAMES = tuple({
+    1: 'Read_Error_Rate',
+    5: 'Reallocated_Sector_Count',
+    9: 'Power_On_Hours',
+    12: 'Power_Cycle_Count',
+    187: 'Reported_Uncorrectable_Errors',
+    188: 'Command_Timeout',
+    194: 'Temperature_Celsius',
+    196: 'Reallocation_Event_Count',
+    197: 'Current_Pending_Sector',
+    198: 'Offline_Uncorrectable',
+    199: 'UDMA_CRC_Error_Count',
+    200: 'Write_Error_Rate'
+}.get(attr_id) for attr_id in range(256))
+
+
+def _parse_smart_vendor_specific(vendor_specific) -> Dict[str, Dict]:
+    """
+    Decode the ATA SMART attribute table from WMI's VendorSpecific buffer
+    
+    Args:
+        vendor_specific: MSStorageDriver_ATAPISmartData.VendorSpecific (362+ bytes)
+        
+    Returns:
+        Dict of attribute name -> {'id', 'current', 'worst', 'value', 'raw', 'flags'}
+        for the attribute IDs the health report knows about
+    """
+    # SMART attributes start at offset 2 in vendor specific data
+    # Each attribute is 12 bytes
+    attributes = {}
+    buf = bytes(vendor_specific)  # WMI hands over a tuple of ints
+    
+    # Parse SMART attributes
+    for i in range(2, min(len(buf), 362), 12):
+        if i + 11 < len(buf):
+            attr_id = buf[i]
+            # Unused slots (0, 0xFF) and IDs the report does not show map to None
+            attr_name = _SMART_ATTR_NAMES[attr_id]
+            if attr_name is None:
+                continue
+            
+            try:
+                # Parse attribute data (raw value is 6 bytes little-endian)
+                _, flags, current, worst, raw_bytes = _SMART_ATTR.unpack_from(buf, i)
+                raw_value = int.from_bytes(raw_bytes, 'little')
+                
+                # Special handling for temperature
+                display_value = raw_value
+                if attr_id == 194:  # Temperature
+                    # Temperature is usually in the lower byte
+                    display_value = raw_value & 0xFF
+                    if display_value > 100:  # Sanity check
+                        display_value = raw_value & 0xFFFF
+                
+                attributes[attr_name] = {
+                    'id': attr_id,
+                    'current': current,
+                    'worst': worst,
+                    'value': display_value,
+                    'raw': raw_value,
+                    'flags': flags
+                }
+            except Exception as attr_parse_error:
+                logger.debug(f"Error parsing attribute {attr_id}: {attr_parse_error}")
+                continue
+    
+    return attributes
+
+
+# smartctl attribute names -> report keys ('G-Sense Error Rate' -> 'G_Sense_Error_Rate')
+_NAME_TRANS = str.maketrans({' ': '_', '-': '_'})
+
+# Decoration stripped from SMART attribute strings ('1,024', '40°C', '5%') in one pass
+_SMART_STRIP = str.maketrans('', '', ',°C% ')
+
+
+def _parse_smart_int(value) -> Optional[int]:
+    """Integer from a SMART attribute string such as '1,024' or '40°C', or None if it isn't one"""
+    try:
+        return int(value.translate(_SMART_STRIP))
+    except (ValueError, AttributeError):
+        return None
+
+
+def _elapsed_since_start(stats: Dict) -> float:
+    """Seconds since the scan started (monotonic when the scan recorded a monotonic start)"""
+    started = stats.get('start_time_monotonic')
+    if started is not None:
+        return time.monotonic() - started
+    return (datetime.now() - datetime.fromisoformat(stats['start_time'])).total_seconds()
+
+
+_DIRECT_IO_ALIGN = 4096  # O_DIRECT offset/length/buffer alignment (covers 512e and 4Kn drives)
+_direct_io_buffers = threading.local()  # Page-aligned read buffer per worker thread
+
+
+def _pread_direct(fd: int, length: int, offset: int) -> bytes:
+    """
+    os.pread for a descriptor opened with O_DIRECT
+    
+    O_DIRECT transfers must be block aligned in offset, length and buffer
+    address, so the covering aligned span is read into a page-aligned (mmap)
+    buffer owned by the calling thread and the requested bytes are sliced out.
+    
+    Returns:
+        The bytes read (shorter or empty past the end, like os.pread)
+    """
+    start = offset & ~(_DIRECT_IO_ALIGN - 1)
+    span = (offset + length - start + _DIRECT_IO_ALIGN - 1) & ~(_DIRECT_IO_ALIGN - 1)
+    buffer = getattr(_direct_io_buffers, 'buffer', None)
+    if buffer is None or len(buffer) < span:
+        buffer = _direct_io_buffers.buffer = mmap.mmap(-1, span)
+    count = os.preadv(fd, [buffer], start)
+    return buffer[offset - start:max(offset - start, min(count, offset - start + length))]
+
+
+_PREALLOCATE_MIN = 1024 * 1024  # Smaller files go out in a single write - fallocate would only add a syscall
+
+
+def _preallocate(fd: int, length: int):
+    """Reserve length bytes for a file about to be written in one go (best effort)"""
+    if length > 0 and hasattr(os, 'posix_fallocate'):
+        try:
+            os.posix_fallocate(fd, 0, length)
+        except OSError:
+            pass  # EOPNOTSUPP on tmpfs/FAT and friends - the write extends the file anyway
+
+
+def _write_preallocated(path: str, data) -> None:
+    """
+    Write data as a new file, reserving its full extent up front
+    
+    One fallocate lets the filesystem place the file contiguously and update its
+    metadata once, instead of extending it write by write. Files below
+    _PREALLOCATE_MIN are written with a single write already, so they skip it
+    (open + write + close is the whole cost of a small carved fragment).
+    
+    Args:
+        path: Destination file path (created or truncated)
+        data: Bytes-like object to write
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        view = memoryview(data)
+        if len(view) >= _PREALLOCATE_MIN:
+            _preallocate(fd, len(view))
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+_READ_AHEAD_DEPTH = 4  # Chunk reads kept in flight ahead of the carving scan
+
+
+class _ReadAheadReader:
+    """
+    Sequential drive reader that keeps several positioned reads in flight
+    
+    Plays the role of an io_uring submission queue: up to `depth` preadv calls
+    run on worker threads (the GIL is released during the syscall) into a ring of
+    preallocated buffers, so the disk is busy while the scanner works on the
+    previous chunk. A returned chunk stays valid until the next call.
+    
+    The kernel is told the access is sequential (larger readahead), and pages
+    the scan has moved well past are dropped from the page cache, so carving a
+    whole drive does not evict everything else cached on the machine.
+    """
+    
+    def __init__(self, fd: int, start: int, end: Optional[int], chunk_size: int,
+                 depth: int = _READ_AHEAD_DEPTH):
+        self._fd = fd
+        self._next_offset = start
+        self._end = end
+        self._chunk_size = chunk_size
+        self._buffers = [memoryview(bytearray(chunk_size)) for _ in range(depth + 1)]
+        self._free = list(range(depth + 1))
+        self._in_flight = deque()
+        self._current = None
+        self._eof = False
+        self._fadvise = getattr(os, 'posix_fadvise', None)
+        self._returned = deque()  # Start offsets of the chunks handed out, newest last
+        if self._fadvise is not None:
+            try:
+                self._fadvise(fd, start, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                self._fadvise = None
+        self._pool = ThreadPoolExecutor(max_workers=depth, thread_name_prefix='read-ahead')
+        for _ in range(depth):
+            self._submit()
+    
+    def _submit(self):
+        """Queue the next sequential read if a buffer is free"""
+        if self._eof or not self._free:
+            return
+        length = self._chunk_size
+        if self._end is not None:
+            length = min(length, self._end - self._next_offset)
+            if length <= 0:
+                return
+        index = self._free.pop()
+        view = self._buffers[index][:length]
+        future = self._pool.submit(os.preadv, self._fd, [view], self._next_offset)
+        self._in_flight.append((index, view, future, self._next_offset))
+        self._next_offset += length
+    
+    def _drop_consumed(self, keep_from: int):
+        """Drop cached pages below keep_from - the carve window never reaches back that far"""
+        if self._fadvise is None or not self._returned or self._returned[0] >= keep_from:
+            return
+        start = self._returned.popleft()
+        try:
+            self._fadvise(self._fd, start, keep_from - start, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            self._fadvise = None
+    
+    async def next_chunk(self) -> memoryview:
+        """Return the next chunk in drive order (empty at the end of the drive)"""
+        if self._current is not None:
+            self._free.append(self._current)
+            self._current = None
+        self._submit()
+        if not self._in_flight:
+            return memoryview(b'')
+        
+        index, view, future, chunk_offset = self._in_flight.popleft()
+        count = await asyncio.wrap_future(future)
+        self._current = index
+        
+        # The carve window holds this chunk plus a 100KB tail of the previous one,
+        # so everything before the previous chunk is done with
+        self._returned.append(chunk_offset)
+        if len(self._returned) > 2:
+            self._drop_consumed(self._returned[-2])
+        if count < len(view):
+            self._eof = True  # Short read - nothing useful lies beyond this point
+        return view[:count]
+    
+    def close(self):
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+
 class PythonRecoveryService:
     """Python-based file recovery service"""
     
     def __init__(self, temp_dir: str = None):
         self.temp_dir = temp_dir or os.path.join(os.getcwd(), 'temp')
         self.signatures = FileSignature.SIGNATURES
+        # Header-less types (txt, csv) cannot be matched by the signature scanner -
+        # they are carved by a separate text-run pass over the unclaimed gaps
+        self._binary_sigs = {k: v for k, v in self.signatures.items() if v.get('header') is not None}
+        self._text_sigs = {k: v for k, v in self.signatures.items() if v.get('header') is None}
+        # Signature sets for the fixed scan modes, built once instead of per scan
+        self._sigs_by_mode = {
+            'quick': {k: v for k, v in self.signatures.items()
+                      if v.get('important', False) and
+                      v['extension'] in ('jpg', 'png', 'pdf', 'docx', 'xlsx', 'mp4', 'mp3')},
+            'deep': self._binary_sigs,
+            'normal': {k: v for k, v in self._binary_sigs.items() if v.get('important', True)},
+        }
+        # Carving selections (tuple of signature keys) -> (binary sigs, text sigs)
+        self._carving_sig_cache = {}
+        # Compile JIT scan kernels now rather than on the first chunk of a scan
+        _warm_up_scan_kernels()
+        _probe_sha256_backend()
+        # Extension lookups, precomputed once instead of iterating all signatures per query
+        self._ext_to_sig = {}
+        for sig_info in self.signatures.values():
+            ext = sig_info.get('extension')
+            if ext and sig_info.get('important', False) and ext not in self._ext_to_sig:
+                self._ext_to_sig[ext] = sig_info
+        self._all_extensions = frozenset(v['extension'] for v in self.signatures.values())
+        # Drive fds on which copy_file_range failed (reset per carving scan)
+        self._copy_range_failed = set()
+        # (signature, content key) -> validation result, bounded FIFO
+        self._validate_memo = OrderedDict()
+        # libmagic handles, created on first MIME check
+        self._magic_mime = None
+        self._magic_desc = None
+        # Type-specific STRICT checks used by _validate_file (other types: header check only)
+        self._validators = {
+            'jpg': self._validate_jpeg,
+            'jpeg': self._validate_jpeg,
+            'png': self._validate_png,
+            'pdf': self._validate_pdf,
+            'docx': self._validate_office,
+            'xlsx': self._validate_office,
+            'pptx': self._validate_office,
+            'zip': self._validate_zip,
+            'rar': self._validate_rar,
+            'mp3': self._validate_mp3,
+            'wav': self._validate_wav,
+            'mp4': self._validate_mp4,
+            'mov': self._validate_mp4,
+            'avi': self._validate_avi,
+            'sqlite': self._validate_sqlite,
+        }
+        # drive path -> result of _get_physical_drive
+        self._physical_drive_cache = {}
+        # (time.monotonic() resolved, path or None) of the smartctl executable
+        self._smartctl_path = None
+        # (time.monotonic() taken, smartctl path, `smartctl --scan` lines) of the last device scan
+        self._smartctl_scan_cache = None
+        # drive path -> (smartctl device, device type) that smartctl last accepted
+        self._smartctl_devices = {}
     
     @staticmethod
     def cleanup_temp_files():
@@ -351,6 +1238,7 @@ class PythonRecoveryService:
                 'bytes_scanned': 0,
                 'total_size': drive_size,
                 'start_time': datetime.now().isoformat(),
+                'start_time_monotonic': time.monotonic(),  # For elapsed time; start_time is for display
                 'sectors_scanned': 0,
                 'total_sectors': total_sectors,
             }
@@ -406,7 +1294,8 @@ class PythonRecoveryService:
                 logger.info("   • Finds deleted, overwritten, and fragmented files")
                 logger.info("=" * 70)
                 
-                # Deep scan uses all file types by default
+                # Deep scan uses all file types by default (its carving phase scans header
+                # signatures only, so txt/csv text runs are not carved by deep scan)
                 if not options.get('fileTypes'):
                     options['fileTypes'] = {
                         'images': True,
@@ -464,7 +1353,8 @@ class PythonRecoveryService:
             
             end_time_dt = datetime.now()
             stats['end_time'] = end_time_dt.isoformat()
-            stats['duration'] = (end_time_dt - datetime.fromisoformat(stats['start_time'])).total_seconds()
+            stats['duration'] = _elapsed_since_start(stats)
+            stats.pop('start_time_monotonic', None)  # Process-local clock - not meaningful in saved/returned stats
             stats['files_found'] = len(recovered_files)
             
             logger.info(f"Scan completed: {stats['files_found']} files found")
@@ -510,17 +1400,23 @@ class PythonRecoveryService:
             return 4 * 1024 * 1024 * 1024
     
     def _get_physical_drive(self, drive_path: str) -> str:
-        """Convert drive letter to physical drive path"""
+        """Convert drive letter to physical drive path (memoized - every scan type asks repeatedly)"""
+        physical_drive = self._physical_drive_cache.get(drive_path)
+        if physical_drive is None:
+            physical_drive = self._physical_drive_cache[drive_path] = self._map_physical_drive(drive_path)
+        return physical_drive
+    
+    def _map_physical_drive(self, drive_path: str) -> str:
+        """Uncached _get_physical_drive"""
         # If already a physical drive path (\.\\PHYSICALDRIVE...), return as-is
         if drive_path and drive_path.upper().startswith('\\\\.\\'):
             return drive_path
 
         # On Windows, for drive letters, return the simple drive letter (e.g., 'E:')
         # Let _open_drive create the correct raw device path (\\.\E:) when needed
-        if platform.system() == 'Windows' and ':' in drive_path:
+        if IS_WINDOWS and ':' in drive_path:
             try:
                 # Extract a letter followed by ':' (handles 'E:' and '\\.\\E:')
-                import re
                 m = re.search(r'([A-Za-z]):', drive_path)
                 if m:
                     drive_letter = m.group(1).upper() + ':'
@@ -540,10 +1436,9 @@ class PythonRecoveryService:
     def _get_drive_size(self, drive_path: str) -> int:
         """Get the size of a drive in bytes"""
         try:
-            if platform.system() == 'Windows':
+            if IS_WINDOWS:
                 import psutil
                 # Extract drive letter robustly (handle 'E:' and '\\.\\E:')
-                import re
                 m = re.search(r'([A-Za-z]):', drive_path)
                 if m:
                     drive_letter = m.group(1).upper() + ':'
@@ -560,7 +1455,8 @@ class PythonRecoveryService:
                 
                 # If not found via psutil, try win32file on the physical/volume path
                 try:
-                    import win32file
+                    if not WIN32_AVAILABLE:
+                        raise ImportError("pywin32 is not installed")
                     physical_drive = self._get_physical_drive(drive_path)
                     # If _get_physical_drive returned a drive letter like 'E:', convert to raw path
                     if re.match(r'^[A-Z]:$', physical_drive):
@@ -597,25 +1493,32 @@ class PythonRecoveryService:
         # Default fallback (assume 500GB)
         return 500 * 1024 * 1024 * 1024
     
-    def _open_drive(self, physical_drive: str) -> BinaryIO:
-        """Open physical drive for reading"""
+    def _open_drive(self, physical_drive: str, random_access: bool = False) -> BinaryIO:
+        """
+        Open physical drive for reading
+        
+        Args:
+            physical_drive: Drive or image path
+            random_access: Reads will be scattered (sampling) - tell the OS not to read ahead
+        """
         logger.info(f"Attempting to open drive: {physical_drive}")
         
-        if platform.system() == 'Windows':
+        if IS_WINDOWS:
             # On Windows, handle two cases:
             # 1) a simple drive letter like 'E:' -> use raw path \\.\E: for low-level access
             # 2) an already raw path like '\\.\PHYSICALDRIVE1' -> use as-is
             if physical_drive.startswith('\\\\.\\'):
                 logger.info(f"Opening raw device path: {physical_drive}")
                 try:
-                    import win32file
+                    if not WIN32_AVAILABLE:
+                        raise ImportError("pywin32 is not installed")
                     handle = win32file.CreateFile(
                         physical_drive,
                         win32file.GENERIC_READ,
                         win32file.FILE_SHARE_READ | win32file.FILE_SHARE_WRITE,
                         None,
                         win32file.OPEN_EXISTING,
-                        0,
+                        win32file.FILE_FLAG_RANDOM_ACCESS if random_access else 0,
                         None
                     )
                     logger.info("✅ Successfully opened raw device")
@@ -628,7 +1531,8 @@ class PythonRecoveryService:
                 logger.info(f"Opening mounted volume (drive letter): {physical_drive}")
                 try:
                     # Try direct file access first (requires admin) using raw path \\.\
-                    import win32file
+                    if not WIN32_AVAILABLE:
+                        raise ImportError("pywin32 is not installed")
                     raw_path = f'\\\\.\\{physical_drive}'
                     logger.info("Attempting low-level disk access (requires admin)...")
                     handle = win32file.CreateFile(
@@ -637,7 +1541,7 @@ class PythonRecoveryService:
                         win32file.FILE_SHARE_READ | win32file.FILE_SHARE_WRITE,
                         None,
                         win32file.OPEN_EXISTING,
-                        0,
+                        win32file.FILE_FLAG_RANDOM_ACCESS if random_access else 0,
                         None
                     )
                     logger.info("✅ Successfully opened drive with low-level access (admin mode)")
@@ -658,8 +1562,107 @@ class PythonRecoveryService:
         else:
             # On Unix-like systems
             logger.info(f"Opening drive on Unix-like system: {physical_drive}")
-            return open(physical_drive, 'rb', buffering=1024*1024)
+            drive_handle = open(physical_drive, 'rb', buffering=1024*1024)
+            if random_access and hasattr(os, 'posix_fadvise'):
+                try:
+                    os.posix_fadvise(drive_handle.fileno(), 0, 0, os.POSIX_FADV_RANDOM)
+                except OSError:
+                    pass  # Advisory only
+            return drive_handle
+
+    def _hash_sha256(self, data: bytes) -> str:
+        """
+        Compute the SHA-256 recorded for a recovered file
+        
+        SHA-256 is the only content digest kept in file records and the manifest:
+        OpenSSL runs it on the CPU's SHA instructions, and a second (MD5) digest
+        would double the bytes hashed per file for no extra integrity.
+        
+        Args:
+            data: Bytes-like object to hash
+            
+        Returns:
+            SHA-256 hex digest
+        """
+        return hashlib.sha256(data).hexdigest()
     
+    def _dedup_key(self, data: bytes) -> bytes:
+        """
+        Compute a compact key for duplicate detection
+        
+        Only used to recognise content already recovered in this scan, so a fast
+        non-cryptographic-grade digest is enough: BLAKE3 when installed, BLAKE2b
+        from hashlib otherwise. SHA-256 is kept for the user-visible record.
+        
+        Args:
+            data: File content
+            
+        Returns:
+            16-byte digest
+        """
+        if BLAKE3_AVAILABLE:
+            return blake3.blake3(data).digest(16)
+        return hashlib.blake2b(data, digest_size=16).digest()
+    
+    def _get_drive_fd(self, drive_handle: BinaryIO) -> Optional[int]:
+        """Return the OS file descriptor behind a drive handle (None for raw Win32 handles)"""
+        try:
+            return drive_handle.fileno()
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            return None
+
+    def _zero_copy_emit(self, src_fd: int, start: int, length: int, dst_path: str) -> bool:
+        """
+        Copy a carved region from the drive to dst_path without a userspace copy
+
+        Uses copy_file_range (Linux 4.5+) and falls back to sendfile. The source
+        file position is never moved, so the sequential carving read is unaffected.
+
+        Args:
+            src_fd: File descriptor of the opened drive
+            start: Absolute offset of the region on the drive
+            length: Number of bytes to copy
+            dst_path: Destination file path
+
+        Returns:
+            True if the whole region was copied, False if the caller must write the data itself
+        """
+        copy_range = getattr(os, 'copy_file_range', None)
+        if src_fd in self._copy_range_failed:
+            copy_range = None
+        sendfile = getattr(os, 'sendfile', None)
+        if copy_range is None and sendfile is None:
+            return False
+
+        copied = 0
+        dst_fd = os.open(dst_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            if length >= _PREALLOCATE_MIN:
+                _preallocate(dst_fd, length)
+            while copied < length:
+                if copy_range is not None:
+                    try:
+                        n = copy_range(src_fd, dst_fd, length - copied, offset_src=start + copied)
+                    except OSError:
+                        # EXDEV/EINVAL on older kernels and some block devices - use sendfile instead,
+                        # and skip copy_file_range for this source for the rest of the scan
+                        self._copy_range_failed.add(src_fd)
+                        copy_range = None
+                        continue
+                elif sendfile is not None:
+                    n = sendfile(dst_fd, src_fd, start + copied, length - copied)
+                else:
+                    break
+                if n <= 0:
+                    break
+                copied += n
+        except OSError as e:
+            logger.debug(f"Zero-copy emit failed for {dst_path}: {e}")
+        finally:
+            os.close(dst_fd)
+
+        return copied == length
+
     async def _metadata_first_recovery(self, drive_handle: BinaryIO, output_dir: str,
                                       stats: Dict, options: Optional[Dict] = None,
                                       progress_callback: Optional[Callable] = None) -> List[Dict]:
@@ -752,6 +1755,7 @@ class PythonRecoveryService:
             List of recoverable deleted files with original names
         """
         recovered_files = []
+        pending_hashes = deque()  # (record, future) - SHA-256 computed on the I/O pool
         
         try:
             # Read NTFS boot sector
@@ -759,9 +1763,7 @@ class PythonRecoveryService:
             boot_sector = drive_handle.read(512)
             
             # Parse NTFS BPB
-            bytes_per_sector = int.from_bytes(boot_sector[0x0B:0x0D], 'little')
-            sectors_per_cluster = boot_sector[0x0D]
-            mft_cluster = int.from_bytes(boot_sector[0x30:0x38], 'little')
+            bytes_per_sector, sectors_per_cluster, mft_cluster = _NTFS_BPB.unpack_from(boot_sector)
             
             bytes_per_cluster = bytes_per_sector * sectors_per_cluster
             mft_offset = mft_cluster * bytes_per_cluster
@@ -779,50 +1781,33 @@ class PythonRecoveryService:
             logger.info(f"🔎 Scanning MFT for deleted files (up to {estimated_entries:,} entries)...")
             logger.info(f"   Looking for files with original names and metadata...")
             
-            # Seek to MFT
-            drive_handle.seek(mft_offset)
-            
             # Track statistics
-            entries_scanned = 0
-            deleted_found = 0
             files_with_names = 0
             files_recoverable = 0
             
-            # Scan MFT entries
+            # Scan MFT entries in batches: one read per 4 MB, deleted-file screening vectorized
             mft_entry_size = 1024
+            mft_counters = {}
             
-            for entry_num in range(estimated_entries):
-                try:
-                    # Read MFT entry
-                    mft_entry = drive_handle.read(mft_entry_size)
-                    if len(mft_entry) < mft_entry_size:
-                        break  # Reached end of MFT
-                    
-                    entries_scanned += 1
-                    
-                    # Check for cancellation every 100 entries
-                    if entry_num % 100 == 0:
-                        await asyncio.sleep(0)
-                        is_cancelled = options.get('is_cancelled') if options else None
-                        if is_cancelled and callable(is_cancelled) and is_cancelled():
-                            logger.warning(f"⚠️ Scan cancelled at entry {entry_num}")
-                            break
-                    
-                    # Check signature (must be "FILE")
-                    if mft_entry[0:4] != b'FILE':
-                        continue
-                    
-                    # Check flags
-                    flags = int.from_bytes(mft_entry[0x16:0x18], 'little')
-                    is_in_use = bool(flags & 0x01)
-                    is_directory = bool(flags & 0x02)
-                    
-                    # Only process DELETED FILES (not in use, not directory)
-                    if is_in_use or is_directory:
-                        continue
-                    
-                    deleted_found += 1
+            # Progress update once per batch
+            async def report_mft_progress(entries_scanned: int):
+                if progress_callback:
+                    progress = min((entries_scanned / estimated_entries) * 100, 99)
+                    sectors_scanned = (entries_scanned * mft_entry_size) // 512
+                    total_sectors = (estimated_entries * mft_entry_size) // 512
                     
+                    await progress_callback({
+                        'progress': progress,
+                        'files_found': len(recovered_files),
+                        'sectors_scanned': sectors_scanned,
+                        'total_sectors': total_sectors,
+                        'phase': 'mft_scan',
+                        'message': f'MFT: {entries_scanned:,}/{estimated_entries:,} entries | {len(recovered_files)} files found'
+                    })
+            
+            async for entry_num, mft_entry in self._iter_deleted_mft_entries(
+                    drive_handle, mft_offset, estimated_entries, options, mft_counters, report_mft_progress):
+                try:
                     # Parse the entry to extract filename and file info
                     file_info = self._parse_ntfs_entry_improved(
                         mft_entry, entry_num, drive_handle, bytes_per_cluster
@@ -847,28 +1832,22 @@ class PythonRecoveryService:
                     files_recoverable += 1
                     
                     # Extract extension
-                    file_ext = filename.split('.')[-1].lower() if '.' in filename else 'dat'
-                    
-                    # Calculate hashes
-                    import hashlib
-                    file_md5 = hashlib.md5(file_data).hexdigest()
-                    file_sha256 = hashlib.sha256(file_data).hexdigest()
+                    file_ext = filename.rpartition('.')[2].lower() if '.' in filename else 'dat'
                     
-                    # Create file record
+                    # Create file record (hashes are filled in by the I/O pool)
                     safe_filename = self._sanitize_filename(filename)
                     file_path = os.path.join(output_dir, safe_filename)
                     
-                    recovered_files.append({
+                    file_record = {
                         'name': safe_filename,
                         'path': file_path,
                         'size': len(file_data),
                         'type': file_ext.upper(),
                         'extension': file_ext,
                         'offset': mft_offset + (entry_num * mft_entry_size),
-                        'md5': file_md5,
-                        'sha256': file_sha256,
-                        'hash': file_sha256,
-                        'file_hash': file_sha256,
+                        'sha256': None,
+                        'hash': None,
+                        'file_hash': None,
                         'validation_score': 100,
                         'is_partial': False,
                         'method': 'normal_scan_mft',
@@ -879,29 +1858,19 @@ class PythonRecoveryService:
                         'original_filename': filename,
                         'declared_size': file_size,
                         'actual_size': len(file_data)
-                    })
+                    }
+                    recovered_files.append(file_record)
+                    await self._queue_record_hash(pending_hashes, file_record, file_data)
                     
                     logger.info(f"✅ Found: {safe_filename} ({len(file_data)/1024:.1f} KB)")
-                    
-                    # Progress update every 1000 entries
-                    if entries_scanned % 1000 == 0 and progress_callback:
-                        progress = min((entries_scanned / estimated_entries) * 100, 99)
-                        sectors_scanned = (entries_scanned * mft_entry_size) // 512
-                        total_sectors = (estimated_entries * mft_entry_size) // 512
-                        
-                        await progress_callback({
-                            'progress': progress,
-                            'files_found': len(recovered_files),
-                            'sectors_scanned': sectors_scanned,
-                            'total_sectors': total_sectors,
-                            'phase': 'mft_scan',
-                            'message': f'MFT: {entries_scanned:,}/{estimated_entries:,} entries | {len(recovered_files)} files found'
-                        })
                 
                 except Exception as e:
                     logger.debug(f"Error processing MFT entry {entry_num}: {e}")
                     continue
             
+            entries_scanned = mft_counters['entries_scanned']
+            deleted_found = mft_counters['deleted_found']
+            
             # Final statistics
             logger.info(f"")
             logger.info(f"📊 Normal Scan Complete:")
@@ -934,8 +1903,93 @@ class PythonRecoveryService:
         except Exception as e:
             logger.error(f"Error in Normal scan NTFS recovery: {e}", exc_info=True)
         
+        await self._drain_record_hashes(pending_hashes)
         return recovered_files
     
+    async def _iter_deleted_mft_entries(self, drive_handle: BinaryIO, mft_offset: int, max_entries: int,
+                                        options: Optional[Dict], counters: Dict,
+                                        on_batch: Optional[Callable] = None):
+        """
+        Yield (entry number, raw entry) for every deleted file record in the MFT
+        
+        Entries are read 4 MB at a time and screened by _bulk_screen_mft, so only
+        deleted, non-directory FILE records reach the caller's parser. Every batch
+        seeks explicitly, because parsers reading non-resident data runs move the
+        drive handle. Control is yielded and cancellation checked every
+        _MFT_YIELD_INTERVAL candidates, since parsing a candidate may read the drive.
+        
+        Args:
+            drive_handle: Open file handle to the drive
+            mft_offset: Byte offset of the MFT
+            max_entries: Maximum number of entries to scan
+            options: Scan options (for 'is_cancelled')
+            counters: Updated in place with 'entries_scanned', 'deleted_found' and 'cancelled'
+            on_batch: Optional async callable, awaited with entries scanned after each batch
+        """
+        mft_entry_size = 1024
+        counters.update(entries_scanned=0, deleted_found=0, cancelled=False)
+        is_cancelled = options.get('is_cancelled') if options else None
+        if not callable(is_cancelled):
+            is_cancelled = None
+        
+        for batch_start in range(0, max_entries, _MFT_BATCH_ENTRIES):
+            batch_size = min(_MFT_BATCH_ENTRIES, max_entries - batch_start)
+            drive_handle.seek(mft_offset + batch_start * mft_entry_size)
+            block = drive_handle.read(batch_size * mft_entry_size)
+            entries_in_block = len(block) // mft_entry_size
+            counters['entries_scanned'] += entries_in_block
+            
+            candidates = self._bulk_screen_mft(block, entries_in_block)
+            counters['deleted_found'] += len(candidates)
+            
+            for processed, index in enumerate(candidates):
+                if processed % _MFT_YIELD_INTERVAL == 0:
+                    await asyncio.sleep(0)
+                    if is_cancelled and is_cancelled():
+                        counters['cancelled'] = True
+                        logger.warning(f"⚠️ MFT scan cancelled at entry {batch_start + index}")
+                        return
+                yield batch_start + index, block[index * mft_entry_size:(index + 1) * mft_entry_size]
+            
+            await asyncio.sleep(0)
+            if is_cancelled and is_cancelled():
+                counters['cancelled'] = True
+                logger.warning(f"⚠️ MFT scan cancelled at entry {batch_start + entries_in_block}")
+                return
+            
+            if on_batch:
+                await on_batch(counters['entries_scanned'])
+            
+            if entries_in_block < batch_size:
+                break  # Reached end of MFT
+    
+    def _bulk_screen_mft(self, block: bytes, count: int) -> List[int]:
+        """
+        Find deleted-file records in a block of consecutive 1 KB MFT entries
+        
+        With NumPy the block is viewed as a structured array and screened with one
+        vectorized mask; otherwise each header is unpacked with a precompiled Struct.
+        
+        Args:
+            block: Raw MFT data (count * 1024 bytes)
+            count: Number of complete entries in the block
+            
+        Returns:
+            Indices (within the block) of FILE records with in-use and directory flags clear
+        """
+        if NUMPY_AVAILABLE:
+            records = np.frombuffer(block, dtype=_MFT_RECORD_DTYPE, count=count)
+            mask = (records['magic'] == b'FILE') & ((records['flags'] & 0x03) == 0)
+            return np.flatnonzero(mask).tolist()
+        
+        unpack_from = _MFT_ENTRY_HEADER.unpack_from
+        candidates = []
+        for index in range(count):
+            signature, _, flags = unpack_from(block, index * 1024)
+            if signature == b'FILE' and not flags & 0x03:
+                candidates.append(index)
+        return candidates
+    
     def _parse_ntfs_entry_improved(self, mft_entry: bytes, entry_num: int,
                                    drive_handle: BinaryIO, bytes_per_cluster: int) -> Optional[Dict]:
         """
@@ -949,7 +2003,7 @@ class PythonRecoveryService:
         """
         try:
             # Get first attribute offset
-            first_attr_offset = int.from_bytes(mft_entry[0x14:0x16], 'little')
+            first_attr_offset = _MFT_ENTRY_HEADER.unpack_from(mft_entry)[1]
             if first_attr_offset >= len(mft_entry) or first_attr_offset == 0:
                 return None
             
@@ -961,18 +2015,15 @@ class PythonRecoveryService:
             offset = first_attr_offset
             
             while offset < len(mft_entry) - 4:
-                # Read attribute type
-                attr_type = int.from_bytes(mft_entry[offset:offset+4], 'little')
+                # Read attribute type and length
+                if offset + 8 > len(mft_entry):
+                    break
+                attr_type, attr_length = _MFT_ATTR_HEADER.unpack_from(mft_entry, offset)
                 
                 # End of attributes
                 if attr_type == 0xFFFFFFFF:
                     break
                 
-                # Read attribute length
-                if offset + 8 > len(mft_entry):
-                    break
-                attr_length = int.from_bytes(mft_entry[offset+4:offset+8], 'little')
-                
                 if attr_length == 0 or attr_length > 1024 or offset + attr_length > len(mft_entry):
                     break
                 
@@ -983,8 +2034,7 @@ class PythonRecoveryService:
                         non_resident = mft_entry[offset + 8]
                         if non_resident == 0:
                             # Get attribute content offset and length
-                            attr_content_offset = int.from_bytes(mft_entry[offset+0x14:offset+0x16], 'little')
-                            attr_content_len = int.from_bytes(mft_entry[offset+0x10:offset+0x14], 'little')
+                            attr_content_len, attr_content_offset = _MFT_RESIDENT_VALUE.unpack_from(mft_entry, offset + 0x10)
                             
                             if attr_content_len < 0x42:
                                 continue
@@ -1036,16 +2086,15 @@ class PythonRecoveryService:
                         
                         if non_resident == 0:
                             # Resident data (small files)
-                            data_offset = int.from_bytes(mft_entry[offset+0x14:offset+0x16], 'little')
-                            data_length = int.from_bytes(mft_entry[offset+0x10:offset+0x14], 'little')
+                            data_length, data_offset = _MFT_RESIDENT_VALUE.unpack_from(mft_entry, offset + 0x10)
                             
                             if data_length > 0 and offset + data_offset + data_length <= len(mft_entry):
                                 file_data = mft_entry[offset + data_offset:offset + data_offset + data_length]
                                 file_size = data_length
                         else:
                             # Non-resident data (large files)
-                            file_size = int.from_bytes(mft_entry[offset+0x30:offset+0x38], 'little')
-                            data_runs_offset = int.from_bytes(mft_entry[offset+0x20:offset+0x22], 'little')
+                            file_size = _MFT_NONRESIDENT_SIZE.unpack_from(mft_entry, offset + 0x30)[0]
+                            data_runs_offset = _MFT_NONRESIDENT_RUNS.unpack_from(mft_entry, offset + 0x20)[0]
                             
                             if file_size > 0 and file_size <= 100 * 1024 * 1024:  # Limit to 100MB
                                 if data_runs_offset > 0 and offset + data_runs_offset < len(mft_entry):
@@ -1220,6 +2269,7 @@ class PythonRecoveryService:
             List of recovered files with metadata
         """
         recovered_files = []
+        pending_hashes = deque()  # (record, future) - SHA-256 computed on the I/O pool
         
         try:
             # Read NTFS boot sector
@@ -1227,9 +2277,7 @@ class PythonRecoveryService:
             boot_sector = drive_handle.read(512)
             
             # Parse NTFS BPB (BIOS Parameter Block)
-            bytes_per_sector = int.from_bytes(boot_sector[0x0B:0x0D], 'little')
-            sectors_per_cluster = boot_sector[0x0D]
-            mft_cluster = int.from_bytes(boot_sector[0x30:0x38], 'little')
+            bytes_per_sector, sectors_per_cluster, mft_cluster = _NTFS_BPB.unpack_from(boot_sector)
             
             bytes_per_cluster = bytes_per_sector * sectors_per_cluster
             mft_offset = mft_cluster * bytes_per_cluster
@@ -1249,24 +2297,20 @@ class PythonRecoveryService:
             # We trust MFT metadata, so recover ALL file types found, not just "important" ones
             if scan_type == 'normal' and not file_type_options:
                 # Get ALL extensions we can detect (not just important ones)
-                interested_extensions = set()
-                for sig_name, sig_info in self.signatures.items():
-                    interested_extensions.add(sig_info['extension'])
                 # Also add common extensions that might not have signatures
-                interested_extensions.update(['txt', 'log', 'ini', 'cfg', 'xml', 'json', 
-                                             'html', 'css', 'js', 'py', 'java', 'cpp', 'h'])
+                interested_extensions = self._all_extensions.union(
+                    ['txt', 'log', 'ini', 'cfg', 'xml', 'json',
+                     'html', 'css', 'js', 'py', 'java', 'cpp', 'h'])
                 logger.info(f"🎯 Normal scan (MFT): Recovering ALL file types from filesystem metadata")
             else:
-                interested_extensions = self._get_interested_extensions(file_type_options)
+                interested_extensions = frozenset(self._get_interested_extensions(file_type_options))
             
             logger.info(f"🎯 Target extensions: {', '.join(sorted(interested_extensions)[:30])}{'...' if len(interested_extensions) > 30 else ''}")
             
             # Parse MFT entries
-            drive_handle.seek(mft_offset)
             mft_entry_size = 1024  # Standard MFT entry size
-            entries_parsed = 0
-            deleted_files_found = 0
             max_entries = 100000  # Limit to first 100k entries for performance
+            mft_counters = {}
             
             # Statistics tracking
             files_checked = 0
@@ -1276,48 +2320,33 @@ class PythonRecoveryService:
             
             logger.info(f"🔎 Parsing MFT entries (analyzing up to {max_entries} entries)...")
             
-            for entry_num in range(max_entries):
-                # Check for cancellation
-                is_cancelled = options.get('is_cancelled') if options else None
-                if is_cancelled and callable(is_cancelled) and is_cancelled():
-                    logger.warning("⚠️ MFT parsing cancelled by user")
-                    logger.info(f"📋 Returning partial results: {len(recovered_files)} files indexed so far")
-                    break
-                
-                # Read MFT entry
-                mft_entry = drive_handle.read(mft_entry_size)
-                if len(mft_entry) < mft_entry_size:
-                    break
-                
-                # Yield control to event loop after every read to allow cancellation
-                if entry_num % 100 == 0:
-                    await asyncio.sleep(0)
-                
-                entries_parsed += 1
-                
-                # Check MFT signature (FILE or BAAD)
-                signature = mft_entry[0:4]
-                if signature != b'FILE':
-                    continue
-                
-                # Check if file is deleted (bit 0 of flags at offset 0x16)
-                flags = int.from_bytes(mft_entry[0x16:0x18], 'little')
-                is_in_use = flags & 0x01
-                is_directory = flags & 0x02
-                
-                # Only process deleted files (not in use, not directory)
-                if is_in_use or is_directory:
-                    continue
-                
-                deleted_files_found += 1
-                
+            # Update progress once per batch
+            async def report_mft_progress(entries_parsed: int):
+                if progress_callback:
+                    progress = min((entries_parsed / max_entries) * 100, 99)
+                    expected_time = self._calculate_expected_time(
+                        _elapsed_since_start(stats),
+                        progress
+                    )
+                    await progress_callback({
+                        'progress': progress,
+                        'files_found': len(recovered_files),
+                        'sectors_scanned': entries_parsed,
+                        'total_sectors': max_entries,
+                        'expected_time': expected_time,
+                        'current_pass': 1
+                    })
+            
+            # Only deleted, non-directory FILE records are handed out by the batch screen
+            async for entry_num, mft_entry in self._iter_deleted_mft_entries(
+                    drive_handle, mft_offset, max_entries, options, mft_counters, report_mft_progress):
                 # Try to extract filename and data
                 try:
                     file_info = self._parse_mft_entry(mft_entry, entry_num, drive_handle, bytes_per_cluster)
                     
                     if file_info and file_info.get('filename'):
                         filename = file_info['filename']
-                        file_ext = filename.split('.')[-1].lower() if '.' in filename else ''
+                        file_ext = filename.rpartition('.')[2].lower() if '.' in filename else ''
                         
                         # For metadata recovery, check extension OR accept if we have filename
                         # (more permissive than signature carving)
@@ -1350,22 +2379,17 @@ class PythonRecoveryService:
                             safe_filename = self._sanitize_filename(filename)
                             file_path = os.path.join(output_dir, f"mft_{entry_num}_{safe_filename}")
                             
-                            # Calculate hashes for indexing
-                            file_md5 = hashlib.md5(file_data).hexdigest()
-                            file_sha256 = hashlib.sha256(file_data).hexdigest()
-                            
-                            # INDEX FILE (NO DISK WRITE)
-                            recovered_files.append({
+                            # INDEX FILE (NO DISK WRITE) - hashes are filled in by the I/O pool
+                            file_record = {
                                 'name': safe_filename,
                                 'path': file_path,  # Proposed path (not created yet)
                                 'size': len(file_data),
                                 'type': file_ext.upper() if file_ext else 'DAT',
                                 'extension': file_ext if file_ext else 'dat',
                                 'offset': mft_offset + (entry_num * mft_entry_size),
-                                'md5': file_md5,
-                                'sha256': file_sha256,
-                                'hash': file_sha256,  # Alias
-                                'file_hash': file_sha256,  # Another alias
+                                'sha256': None,
+                                'hash': None,  # Alias
+                                'file_hash': None,  # Another alias
                                 'validation_score': 100,  # Trust MFT metadata
                                 'is_partial': False,  # MFT tells us the complete file
                                 'method': 'mft_metadata',
@@ -1373,29 +2397,21 @@ class PythonRecoveryService:
                                 'indexed_at': datetime.now().isoformat(),
                                 'drive_path': stats.get('drive_path', 'unknown'),
                                 'mft_entry': entry_num
-                            })
+                            }
+                            recovered_files.append(file_record)
+                            await self._queue_record_hash(pending_hashes, file_record, file_data)
                             
                             logger.info(f"✅ MFT: Indexed {safe_filename} ({len(file_data)/1024:.1f} KB)")
                 
                 except Exception as e:
                     logger.debug(f"Error parsing MFT entry {entry_num}: {e}")
                     continue
-                
-                # Update progress every 1000 entries
-                if entries_parsed % 1000 == 0 and progress_callback:
-                    progress = min((entries_parsed / max_entries) * 100, 99)
-                    expected_time = self._calculate_expected_time(
-                        (datetime.now() - datetime.fromisoformat(stats['start_time'])).total_seconds(),
-                        progress
-                    )
-                    await progress_callback({
-                        'progress': progress,
-                        'files_found': len(recovered_files),
-                        'sectors_scanned': entries_parsed,
-                        'total_sectors': max_entries,
-                        'expected_time': expected_time,
-                        'current_pass': 1
-                    })
+            
+            entries_parsed = mft_counters['entries_scanned']
+            deleted_files_found = mft_counters['deleted_found']
+            if mft_counters['cancelled']:
+                logger.warning("⚠️ MFT parsing cancelled by user")
+                logger.info(f"📋 Returning partial results: {len(recovered_files)} files indexed so far")
             
             # Print comprehensive statistics
             logger.info(f"📂 MFT Analysis Complete:")
@@ -1427,6 +2443,7 @@ class PythonRecoveryService:
         except Exception as e:
             logger.error(f"Error parsing NTFS MFT: {e}", exc_info=True)
         
+        await self._drain_record_hashes(pending_hashes)
         return recovered_files
     
     def _parse_mft_entry(self, mft_entry: bytes, entry_num: int, drive_handle: BinaryIO, 
@@ -1438,7 +2455,7 @@ class PythonRecoveryService:
         """
         try:
             # Get first attribute offset
-            first_attr_offset = int.from_bytes(mft_entry[0x14:0x16], 'little')
+            first_attr_offset = _MFT_ENTRY_HEADER.unpack_from(mft_entry)[1]
             
             filename = None
             file_data = None
@@ -1447,13 +2464,12 @@ class PythonRecoveryService:
             # Parse attributes
             offset = first_attr_offset
             while offset < len(mft_entry) - 16:
-                attr_type = int.from_bytes(mft_entry[offset:offset+4], 'little')
+                attr_type, attr_length = _MFT_ATTR_HEADER.unpack_from(mft_entry, offset)
                 
                 # End marker
                 if attr_type == 0xFFFFFFFF:
                     break
                 
-                attr_length = int.from_bytes(mft_entry[offset+4:offset+8], 'little')
                 if attr_length == 0 or offset + attr_length > len(mft_entry):
                     break
                 
@@ -1466,8 +2482,7 @@ class PythonRecoveryService:
                             # For FILE_NAME attribute structure:
                             # Offset 0x14: Attribute content offset
                             # Offset 0x10: Attribute content length
-                            content_offset = int.from_bytes(mft_entry[offset+0x14:offset+0x16], 'little')
-                            content_length = int.from_bytes(mft_entry[offset+0x10:offset+0x14], 'little')
+                            content_length, content_offset = _MFT_RESIDENT_VALUE.unpack_from(mft_entry, offset + 0x10)
                             
                             if content_length >= 0x42:  # Minimum FILE_NAME attribute size
                                 # Filename starts at offset 0x42 in the FILE_NAME content
@@ -1487,8 +2502,7 @@ class PythonRecoveryService:
                     if non_resident == 0:
                         # Resident data (small files stored in MFT)
                         try:
-                            data_offset = int.from_bytes(mft_entry[offset+0x14:offset+0x16], 'little')
-                            data_length = int.from_bytes(mft_entry[offset+0x10:offset+0x14], 'little')
+                            data_length, data_offset = _MFT_RESIDENT_VALUE.unpack_from(mft_entry, offset + 0x10)
                             
                             if data_length > 0 and offset + data_offset + data_length <= len(mft_entry):
                                 file_data = mft_entry[offset + data_offset:offset + data_offset + data_length]
@@ -1499,10 +2513,10 @@ class PythonRecoveryService:
                         # Non-resident data (large files - stored in clusters)
                         try:
                             # Extract file size
-                            file_size = int.from_bytes(mft_entry[offset+0x30:offset+0x38], 'little')
+                            file_size = _MFT_NONRESIDENT_SIZE.unpack_from(mft_entry, offset + 0x30)[0]
                             
                             # Data runs start offset
-                            data_runs_offset = int.from_bytes(mft_entry[offset+0x20:offset+0x22], 'little')
+                            data_runs_offset = _MFT_NONRESIDENT_RUNS.unpack_from(mft_entry, offset + 0x20)[0]
                             
                             if data_runs_offset > 0 and offset + data_runs_offset < len(mft_entry):
                                 # Parse data runs
@@ -1656,6 +2670,7 @@ class PythonRecoveryService:
             List of recovered files with metadata
         """
         recovered_files = []
+        pending_hashes = deque()  # (record, future) - SHA-256 computed on the I/O pool
         
         try:
             # Read FAT32 boot sector to get parameters
@@ -1690,13 +2705,10 @@ class PythonRecoveryService:
             scan_type = options.get('scan_type', 'normal') if options else 'normal'
             
             if scan_type == 'normal' and not file_type_options:
-                interested_extensions = set()
-                for sig_name, sig_info in self.signatures.items():
-                    interested_extensions.add(sig_info['extension'])
-                interested_extensions.update(['txt', 'log', 'ini', 'cfg', 'xml', 'json'])
+                interested_extensions = self._all_extensions.union(['txt', 'log', 'ini', 'cfg', 'xml', 'json'])
                 logger.info(f"🎯 Normal scan (FAT32): Recovering ALL file types from directory entries")
             else:
-                interested_extensions = self._get_interested_extensions(file_type_options)
+                interested_extensions = frozenset(self._get_interested_extensions(file_type_options))
             
             logger.info(f"🎯 Target extensions: {', '.join(sorted(interested_extensions)[:30])}{'...' if len(interested_extensions) > 30 else ''}")
             
@@ -1815,22 +2827,17 @@ class PythonRecoveryService:
                             safe_filename = self._sanitize_filename(filename)
                             file_path = os.path.join(output_dir, f"fat_{cluster_num}_{safe_filename}")
                             
-                            # Calculate hashes for indexing
-                            file_md5 = hashlib.md5(file_data).hexdigest()
-                            file_sha256 = hashlib.sha256(file_data).hexdigest()
-                            
-                            # INDEX FILE (NO DISK WRITE)
-                            recovered_files.append({
+                            # INDEX FILE (NO DISK WRITE) - hashes are filled in by the I/O pool
+                            file_record = {
                                 'name': safe_filename,
                                 'path': file_path,  # Proposed path (not created yet)
                                 'size': len(file_data),
                                 'type': file_ext.upper() if file_ext else 'DAT',
                                 'extension': file_ext if file_ext else 'dat',
                                 'offset': cluster_offset + entry_offset,
-                                'md5': file_md5,
-                                'sha256': file_sha256,
-                                'hash': file_sha256,  # Alias
-                                'file_hash': file_sha256,  # Another alias
+                                'sha256': None,
+                                'hash': None,  # Alias
+                                'file_hash': None,  # Another alias
                                 'validation_score': 100,
                                 'is_partial': len(file_data) < file_size,
                                 'method': 'fat32_directory',
@@ -1840,7 +2847,9 @@ class PythonRecoveryService:
                                 'start_cluster': start_cluster,
                                 'declared_size': file_size,
                                 'actual_size': len(file_data)
-                            })
+                            }
+                            recovered_files.append(file_record)
+                            await self._queue_record_hash(pending_hashes, file_record, file_data)
                             
                             logger.info(f"✅ FAT32: Indexed {safe_filename} ({len(file_data)/1024:.1f} KB)")
                             
@@ -1856,7 +2865,7 @@ class PythonRecoveryService:
                 if cluster_num % 100 == 0 and progress_callback:
                     progress = min((cluster_num / max_clusters) * 100, 99)
                     expected_time = self._calculate_expected_time(
-                        (datetime.now() - datetime.fromisoformat(stats['start_time'])).total_seconds(),
+                        _elapsed_since_start(stats),
                         progress
                     )
                     await progress_callback({
@@ -1897,6 +2906,7 @@ class PythonRecoveryService:
         except Exception as e:
             logger.error(f"Error parsing FAT32: {e}", exc_info=True)
         
+        await self._drain_record_hashes(pending_hashes)
         return recovered_files
     
     def _read_fat_clusters(self, drive_handle: BinaryIO, start_cluster: int,
@@ -1974,28 +2984,109 @@ class PythonRecoveryService:
     
     def _get_signature_for_extension(self, extension: str) -> Optional[Dict]:
         """Get signature info for a file extension"""
-        for sig_name, sig_info in self.signatures.items():
-            if sig_info.get('extension') == extension and sig_info.get('important', False):
-                return sig_info
-        return None
+        return self._ext_to_sig.get(extension)
     
     def _sanitize_filename(self, filename: str) -> str:
         """Sanitize filename for safe file system use"""
-        # Remove invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, '_')
+        # Remove invalid characters (single C-level pass)
+        filename = filename.translate(_FILENAME_TRANS)
         # Limit length
         if len(filename) > 200:
             name, ext = os.path.splitext(filename)
             filename = name[:200-len(ext)] + ext
         return filename
     
+    def _start_scan_pool(self, drive_path: Optional[str], signatures: Dict) -> Optional[ProcessPoolExecutor]:
+        """
+        Start worker processes that scan drive regions for signature headers
+        
+        Each worker maps the drive read-only in its initializer, so windows are
+        dispatched as (chunk_id, offset, length) and no data is pickled.
+        
+        Args:
+            drive_path: Path of the drive or image being carved
+            signatures: Signatures to search for
+            
+        Returns:
+            ProcessPoolExecutor, or None if the drive cannot be mapped by path (Windows devices)
+        """
+        if IS_WINDOWS or not drive_path or not os.path.exists(drive_path):
+            logger.info("Parallel scan unavailable for this drive - scanning in-process")
+            return None
+        
+        workers = os.cpu_count() or 1
+        try:
+            # The server already runs reader/executor threads here - forking it could leave a
+            # worker stuck on a lock one of them held, so workers come from a clean forkserver
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_scan_worker,
+                                       initargs=(drive_path, signatures),
+                                       mp_context=multiprocessing.get_context('forkserver'))
+        except Exception as e:
+            logger.warning(f"Could not start scan workers, scanning in-process: {e}")
+            return None
+        
+        logger.info(f"⚡ Parallel signature scan: {workers} worker process(es)")
+        return pool
+    
+    async def _scan_window_in_pool(self, scan_pool: ProcessPoolExecutor, scan_queue: deque,
+                                   offset: int, length: int, chunk_size: int,
+                                   scan_end: Optional[int]) -> Optional[List[Tuple[str, int]]]:
+        """
+        Scan drive[offset:offset + length] on the worker pool, keeping later windows queued
+        
+        After the first window, carving windows are consecutive chunk_size regions, so
+        the next ones are submitted ahead (2 per worker) while the caller extracts and
+        validates this window's files. A window that does not match the queued
+        prediction drops the queue and is scanned on its own.
+        
+        Args:
+            scan_pool: Pool from _start_scan_pool
+            scan_queue: (offset, length, future) windows already submitted, in drive order
+            offset: Absolute start of the window
+            length: Window length
+            chunk_size: Carving chunk size (length of the following windows)
+            scan_end: Absolute offset no window extends past, or None if unknown
+        
+        Returns:
+            (signature name, position relative to offset) hits, or None if the pool failed
+        """
+        try:
+            if scan_queue and scan_queue[0][:2] != (offset, length):
+                for _, _, future in scan_queue:
+                    future.cancel()
+                scan_queue.clear()
+            if not scan_queue:
+                scan_queue.append((offset, length,
+                                   scan_pool.submit(_scan_region_worker, offset, offset, length)))
+            
+            # Top up the queue with the predicted following windows
+            depth = 2 * (os.cpu_count() or 1)
+            next_offset = scan_queue[-1][0] + scan_queue[-1][1]
+            while len(scan_queue) <= depth:
+                next_length = chunk_size
+                if scan_end is not None:
+                    next_length = min(next_length, scan_end - next_offset)
+                if next_length <= 0:
+                    break
+                scan_queue.append((next_offset, next_length,
+                                   scan_pool.submit(_scan_region_worker, next_offset, next_offset, next_length)))
+                next_offset += next_length
+            
+            _, _, future = scan_queue.popleft()
+            _, hits = await asyncio.wrap_future(future)
+        except Exception as e:
+            logger.warning(f"Scan worker failed, continuing in-process: {e}")
+            return None
+        return [(sig_name, pos - offset) for sig_name, pos in hits]
+    
     def _scan_chunk_for_signatures(self, chunk_data: bytes, chunk_offset: int, 
                                    signatures_to_scan: Dict, max_file_size: int) -> List[Dict]:
         """
         Scan a chunk of data for file signatures (for parallel processing)
         
+        Matches only carry offsets - callers slice file data from their own
+        buffer (or drive mapping) instead of shipping the chunk around.
+        
         Args:
             chunk_data: Chunk of data to scan
             chunk_offset: Absolute offset of this chunk on drive
@@ -2007,50 +3098,46 @@ class PythonRecoveryService:
         """
         matches = []
         
-        for sig_name, sig_info in signatures_to_scan.items():
-            header = sig_info['header']
-            sig_offset = sig_info.get('offset', 0)
-            
-            # Search for signature in chunk
-            search_start = 0
-            while True:
-                pos = chunk_data.find(header, search_start)
-                if pos == -1:
-                    break
-                
-                # Calculate absolute offset
-                absolute_pos = chunk_offset + pos
-                
-                # Validate offset if specified
-                if sig_offset > 0:
-                    if pos < sig_offset:
-                        search_start = pos + 1
-                        continue
-                    actual_pos = pos - sig_offset
-                else:
-                    actual_pos = pos
-                
-                # Additional validation for specific file types
-                if 'check' in sig_info:
-                    check_bytes = sig_info['check']
-                    if check_bytes not in chunk_data[actual_pos:actual_pos + 1000]:
-                        search_start = pos + 1
-                        continue
-                
-                # Store match information
-                matches.append({
-                    'sig_name': sig_name,
-                    'sig_info': sig_info,
-                    'chunk_offset': chunk_offset,
-                    'local_pos': actual_pos,
-                    'absolute_pos': absolute_pos,
-                    'chunk_data': chunk_data,
-                })
-                
-                search_start = pos + 1
+        for sig_name, pos in _find_signature_hits(chunk_data, 0, len(chunk_data), signatures_to_scan):
+            sig_info = signatures_to_scan[sig_name]
+            matches.append({
+                'sig_name': sig_name,
+                'sig_info': sig_info,
+                'chunk_offset': chunk_offset,
+                'local_pos': pos - sig_info.get('offset', 0),
+                'absolute_pos': chunk_offset + pos,
+            })
         
         return matches
     
+    def _select_carving_signatures(self, signature_keys: List[str]) -> Tuple[Dict, Dict]:
+        """
+        Split the selected signature keys into header and text-run signatures
+        
+        Only signatures with a header can be found by the signature scan; header-less
+        ones (txt, csv) go to the text-run pass. Results are cached per selection.
+        
+        Args:
+            signature_keys: Selected signature keys, deduplicated, in scan order
+            
+        Returns:
+            Tuple of (header signatures, text signatures)
+        """
+        cache_key = tuple(signature_keys)
+        selection = self._carving_sig_cache.get(cache_key)
+        if selection is None:
+            binary_sigs = {}
+            text_sigs = {}
+            for k in signature_keys:
+                if k in self._binary_sigs:
+                    binary_sigs[k] = self._binary_sigs[k]
+                elif k in self._text_sigs:
+                    logger.debug(f"'{k}' has no signature header - detected by text-run pass")
+                    text_sigs[k] = self._text_sigs[k]
+            selection = (binary_sigs, text_sigs)
+            self._carving_sig_cache[cache_key] = selection
+        return selection
+    
     async def _carve_files(self, drive_handle: BinaryIO, output_dir: str, 
                           stats: Dict, options: Optional[Dict] = None,
                           progress_callback: Optional[Callable] = None) -> List[Dict]:
@@ -2068,6 +3155,9 @@ class PythonRecoveryService:
             List of recovered file dictionaries
         """
         recovered_files = []
+        # Header-less types handled by the text-run pass - only set by File Carving scans
+        # with documents/email selected (quick/deep/normal use header signatures only)
+        text_sigs_to_scan = {}
         
         # Get scan type from options (default to 'normal')
         scan_type = options.get('scan_type', 'normal') if options else 'normal'
@@ -2076,9 +3166,7 @@ class PythonRecoveryService:
         if scan_type == 'quick':
             # Quick scan: Only most common important files
             chunk_size = 2 * 1024 * 1024  # 2MB chunks for faster scanning
-            signatures_to_scan = {k: v for k, v in self.signatures.items() 
-                                 if v.get('important', False) and 
-                                 v['extension'] in ['jpg', 'png', 'pdf', 'docx', 'xlsx', 'mp4', 'mp3']}
+            signatures_to_scan = self._sigs_by_mode['quick']
             max_file_size = 10 * 1024 * 1024  # CONSERVATIVE: 10MB max per file
             logger.info("Quick scan mode: Scanning for common important files only")
             
@@ -2092,10 +3180,8 @@ class PythonRecoveryService:
             logger.info(f"💾 Memory optimization: {available_memory / (1024**3):.2f} GB available, using {chunk_size / (1024**2):.2f} MB chunks")
             
             # Deep scan: Use ALL file signatures (including system files)
-            signatures_to_scan = self.signatures.copy()
-            
-            # Filter to only signatures with headers (can be detected)
-            signatures_to_scan = {k: v for k, v in signatures_to_scan.items() if v.get('header') is not None}
+            # Only signatures with headers (can be detected)
+            signatures_to_scan = self._sigs_by_mode['deep']
             
             max_file_size = 20 * 1024 * 1024  # 20MB max per file for deep scan
             
@@ -2148,7 +3234,10 @@ class PythonRecoveryService:
             
             # If no specific types selected, scan ONLY important file types (not system files)
             if not signature_keys_to_scan:
-                signature_keys_to_scan = [k for k, v in self.signatures.items() if v.get('important', False)]
+                # No header-less text types here: the text-run pass only runs when a File
+                # Carving scan selects documents/email, otherwise every log, XML or source
+                # file would be written out
+                signature_keys_to_scan = [k for k, v in self._binary_sigs.items() if v.get('important', False)]
                 selected_categories = ['all important']
                 logger.info(f"No types selected, using all important: {len(signature_keys_to_scan)} signatures")
             
@@ -2156,23 +3245,13 @@ class PythonRecoveryService:
             signature_keys_to_scan = list(dict.fromkeys(signature_keys_to_scan))
             
             # Filter signatures based on selected signature keys
-            # IMPORTANT: Only include signatures that have a header (can be detected)
-            signatures_to_scan = {}
-            for k in signature_keys_to_scan:
-                if k in self.signatures:
-                    sig = self.signatures[k]
-                    # Skip signatures without headers (txt, csv) - can't be detected by carving
-                    if sig.get('header') is None:
-                        logger.debug(f"Skipping '{k}' - no signature header for detection")
-                        continue
-                    signatures_to_scan[k] = sig
+            signatures_to_scan, text_sigs_to_scan = self._select_carving_signatures(signature_keys_to_scan)
             
-            logger.info(f"📊 Total signatures after filtering: {len(signatures_to_scan)}")
+            logger.info(f"📊 Total signatures after filtering: {len(signatures_to_scan)} (+{len(text_sigs_to_scan)} text types)")
             
             # Ensure we have signatures to scan
-            if not signatures_to_scan:
+            if not signatures_to_scan and not text_sigs_to_scan:
                 logger.warning("⚠️ No valid signatures found for selected file types!")
-                logger.warning("   Note: TXT and CSV files cannot be detected by signature scanning")
                 return []
             
             max_file_size = 10 * 1024 * 1024  # CONSERVATIVE: 10MB max per file
@@ -2190,27 +3269,39 @@ class PythonRecoveryService:
             # Normal scan should not reach here (handled separately)
             # But if it does, use important files only
             chunk_size = 1024 * 1024  # 1MB chunks
-            signatures_to_scan = {k: v for k, v in self.signatures.items() 
-                                 if v.get('important', True)}  # Only important files
+            signatures_to_scan = self._sigs_by_mode['normal']  # Only important files
             max_file_size = 10 * 1024 * 1024  # CONSERVATIVE: 10MB max per file
             logger.info("Default scan mode: Scanning for important user files (excluding system files)")
         
         logger.info(f"Scanning for {len(signatures_to_scan)} file types out of {len(self.signatures)} total")
         
         # Final check: ensure we have signatures to scan
-        if not signatures_to_scan:
+        if not signatures_to_scan and not text_sigs_to_scan:
             logger.error("❌ No signatures available for scanning! Aborting.")
             return []
         
-        buffer = b''
+        # Carved file paths are built as prefix + name (deep scan paths only reference output_dir)
+        if scan_type == 'deep':
+            out_prefix = os.path.join(output_dir, '')
+        else:
+            os.makedirs(_TEMP_RECOVERY_DIR, exist_ok=True)
+            out_prefix = os.path.join(_TEMP_RECOVERY_DIR, '')
+        
+        buffer = bytearray()  # Rolling window: chunks appended in place, consumed prefix dropped
         offset = 0
         file_counter = 0
-        last_progress_time = datetime.now()
-        found_hashes = set()  # Track file hashes to prevent duplicates
-        found_offsets = set()  # Track file start offsets to prevent overlaps
+        last_progress_time = time.monotonic()
+        window_time = datetime.now().isoformat()  # Timestamp shared by files carved from the current window
+        footer_memo = {}  # Footer searches already done in buffer (kept across window slides)
+        found_hashes = set()  # Track content dedup keys to prevent duplicates
+        pending_files = deque()  # Futures of files being hashed/written on the I/O pool
+        found_offsets = array.array('Q')  # Sorted file start offsets (8 bytes each), to prevent overlaps
+        claimed_ranges = []  # (start, end) of carved files, so text runs skip their data
         skipped_corrupted = 0  # Track corrupted files skipped
         total_recovered_size = 0  # Track total size of recovered files
-        
+        drive_fd = self._get_drive_fd(drive_handle)  # For in-kernel copies of carved ranges
+        self._copy_range_failed.clear()
+
         # SAFETY: Maximum total recovered size (prevent filling up C: drive)
         # For indexing mode (deep scan), no limit needed since we're not writing files
         # For other modes (carving, quick), limit to 2x drive size or 20GB
@@ -2228,6 +3319,32 @@ class PythonRecoveryService:
         logger.info(f"File validation enabled (integrity check)")
         logger.info(f"Chunk size: {chunk_size / 1024:.0f} KB")
         
+        # Scan windows for headers in worker processes that map the drive themselves
+        # (on by default with more than one CPU; options['parallel_scan'] overrides)
+        scan_pool = None
+        scan_queue = deque()
+        scan_end = None
+        parallel_scan = (options or {}).get('parallel_scan', (os.cpu_count() or 1) > 1)
+        if parallel_scan and signatures_to_scan:
+            scan_pool = self._start_scan_pool(stats.get('physical_drive', stats.get('drive_path')),
+                                              signatures_to_scan)
+            if stats.get('total_size') and stats['total_size'] > 0:
+                # The last 100KB of the drive stays in the carry-over and is never a window
+                scan_end = offset + max(int(stats['total_size'] - stats['bytes_scanned']), 0) - 100000
+        
+        # POSIX: keep several chunk reads in flight ahead of the scan (io_uring-style queue).
+        # Elsewhere: one reusable read buffer instead of a fresh bytes object per read - each
+        # chunk is appended to the carving buffer right away, so a single buffer suffices
+        reader = None
+        if drive_fd is not None and hasattr(os, 'preadv'):
+            read_start = drive_handle.tell()
+            read_end = None
+            if stats.get('total_size') and stats['total_size'] > 0:
+                read_end = read_start + max(int(stats['total_size'] - stats['bytes_scanned']), 0)
+            reader = _ReadAheadReader(drive_fd, read_start, read_end, chunk_size)
+        readinto = getattr(drive_handle, 'readinto', None)
+        read_buffer = memoryview(bytearray(chunk_size)) if readinto and reader is None else None
+        
         chunks_read = 0
         try:
             while True:
@@ -2235,7 +3352,7 @@ class PythonRecoveryService:
                 is_cancelled = options.get('is_cancelled') if options else None
                 if is_cancelled and callable(is_cancelled) and is_cancelled():
                     logger.warning("⚠️ Scan cancelled by user")
-                    logger.info(f"📋 Carving cancelled - returning {len(recovered_files)} partial results found so far")
+                    logger.info(f"📋 Carving cancelled - returning {len(recovered_files) + len(pending_files)} partial results found so far")
                     logger.info(f"💾 Partial scan size: {total_recovered_size / (1024**3):.2f} GB indexed")
                     break
                 
@@ -2248,7 +3365,13 @@ class PythonRecoveryService:
                         break
                     to_read = min(chunk_size, int(remaining))
 
-                chunk = drive_handle.read(to_read)
+                if reader is not None:
+                    chunk = await reader.next_chunk()
+                elif read_buffer is not None:
+                    read_view = read_buffer[:to_read]
+                    chunk = read_view[:readinto(read_view)]
+                else:
+                    chunk = drive_handle.read(to_read)
                 if not chunk:
                     break
                 
@@ -2258,6 +3381,7 @@ class PythonRecoveryService:
                 chunks_read += 1
                 
                 buffer += chunk
+                window_time = datetime.now().isoformat()
                 stats['bytes_scanned'] += len(chunk)
                 stats['sectors_scanned'] = stats['bytes_scanned'] // 512
                 
@@ -2268,223 +3392,205 @@ class PythonRecoveryService:
                     progress_pct = 0
                 
                 # Broadcast progress every second
-                current_time = datetime.now()
-                if (current_time - last_progress_time).total_seconds() >= 1.0:
+                current_time = time.monotonic()
+                if current_time - last_progress_time >= 1.0:
                     if progress_callback:
-                        elapsed = (current_time - datetime.fromisoformat(stats['start_time'])).total_seconds()
+                        elapsed = _elapsed_since_start(stats)
                         expected_time = self._calculate_expected_time(elapsed, progress_pct)
                         await progress_callback({
                             'progress': min(progress_pct, 99.9),  # Never show 100% until complete
                             'sectors_scanned': stats['sectors_scanned'],
                             'total_sectors': stats['total_sectors'],
-                            'files_found': len(recovered_files),
+                            'files_found': len(recovered_files) + len(pending_files),
                             'expected_time': expected_time,
                             'current_pass': 1
                         })
                     last_progress_time = current_time
                 
-                # Search for file signatures in buffer (only filtered signatures)
-                for sig_name, sig_info in signatures_to_scan.items():
-                    header = sig_info['header']
-                    sig_offset = sig_info.get('offset', 0)
+                # Search for file signatures in buffer (only filtered signatures):
+                # one pass over the window reports every header hit in position order,
+                # with the signature offset and 'check' bytes already verified
+                search_limit = max(len(buffer) - 100000, 0)  # Keep some buffer
+                hits = None
+                if scan_pool is not None:
+                    hits = await self._scan_window_in_pool(scan_pool, scan_queue, offset, search_limit,
+                                                           chunk_size, scan_end)
+                    if hits is None:
+                        scan_pool.shutdown(wait=False, cancel_futures=True)
+                        scan_pool = None
+                if hits is None:
+                    hits = _find_signature_hits(buffer, 0, search_limit, signatures_to_scan)
+                
+                for sig_name, pos in hits:
+                    # Check for cancellation during intensive signature search
+                    is_cancelled = options.get('is_cancelled') if options else None
+                    if is_cancelled and callable(is_cancelled) and is_cancelled():
+                        logger.info("🛑 Cancellation detected during signature search")
+                        break
                     
-                    # Search for signature in buffer
-                    search_start = 0
-                    while True:
-                        # Check for cancellation during intensive signature search
-                        is_cancelled = options.get('is_cancelled') if options else None
-                        if is_cancelled and callable(is_cancelled) and is_cancelled():
-                            logger.info("🛑 Cancellation detected during signature search")
-                            break
+                    sig_info = signatures_to_scan[sig_name]
+                    
+                    # Calculate absolute offset
+                    absolute_pos = offset + pos
+                    
+                    # Skip if we already found a file starting near this offset
+                    # Allow 512 byte tolerance for alignment issues (only the sorted neighbours can be that close)
+                    idx = bisect.bisect_left(found_offsets, absolute_pos)
+                    if ((idx < len(found_offsets) and found_offsets[idx] - absolute_pos < 512) or
+                            (idx > 0 and absolute_pos - found_offsets[idx - 1] < 512)):
+                        continue
+                    
+                    actual_pos = pos - sig_info.get('offset', 0)
+                    
+                    # Extract file
+                    try:
+                        file_data = self._extract_file(
+                            buffer,
+                            actual_pos,
+                            sig_info,
+                            drive_handle,
+                            offset + actual_pos,
+                            max_file_size,
+                            sig_name,
+                            footer_memo
+                        )
+                        
+                        # Filter out very small files (likely corrupted or fragments)
+                        # STRICT: Minimum 4KB for all file types (reject tiny fragments)
+                        min_size = 4096
                         
-                        pos = buffer.find(header, search_start, len(buffer) - 100000)  # Keep some buffer
-                        if pos == -1:
+                        if file_data and len(file_data) >= min_size:
+                            # Content key first - it drives both the validation memo and dedup
+                            dedup_key = self._dedup_key(file_data)
+                            
+                            # Copies of content already recovered skip validation entirely
+                            if dedup_key in found_hashes:
+                                logger.debug(f"Skipped duplicate file at offset {absolute_pos} (key: {dedup_key.hex()[:8]}...)")
+                                continue
+                            
+                            # Validate file integrity and get validation score
+                            validation_result = self._validate_cached(file_data, sig_info, sig_name, dedup_key)
+                            if not validation_result['is_valid']:
+                                logger.debug(f"Skipped corrupted/invalid file at offset {absolute_pos}")
+                                skipped_corrupted += 1
+                                continue
+                            
+                            # STRICT: Only save files with GOOD validation scores (>= 70)
+                            validation_score = validation_result.get('score', 0)
+                            if validation_score < 70:
+                                logger.debug(f"Skipped low-quality file at offset {absolute_pos} (score: {validation_score})")
+                                skipped_corrupted += 1
+                                continue
+                            
+                            # Determine if file is fragmented/partial
+                            is_partial = validation_result.get('is_partial', False)
+                            file_ext = sig_info['extension']
+                            if is_partial:
+                                file_ext = f"partial.{file_ext}"
+                            
+                            # Track this file
+                            file_counter += 1
+                            found_hashes.add(dedup_key)
+                            bisect.insort(found_offsets, absolute_pos)
+                            
+                            # Calculate recovered size
+                            total_recovered_size += len(file_data)
+                            
+                            # SAFETY CHECK: Only for non-deep scans (deep scan has no limit)
+                            if scan_type != 'deep' and total_recovered_size > max_total_recovery_size:
+                                logger.warning("⚠️ SCAN LIMIT REACHED!")
+                                logger.warning(f"   Total found: {total_recovered_size / (1024**3):.2f} GB")
+                                logger.warning(f"   Limit: {max_total_recovery_size / (1024**3):.2f} GB")
+                                logger.warning("   Stopping scan to prevent excessive recovery!")
+                                break  # Stop scanning
+                            
+                            # Generate filename and path
+                            file_name = f"f{absolute_pos:08d}.{file_ext}"
+                            
+                            # DEEP SCAN: Index-only mode (read-only, no file writing)
+                            # CARVING SCAN: Write files immediately to TEMP directory
+                            # Hashing and writing run on the I/O pool; results are collected in order
+                            await self._submit_carved_file(
+                                pending_files, recovered_files,
+                                file_data, file_name, sig_name, sig_info,
+                                absolute_pos, offset + actual_pos, validation_result,
+                                scan_type, out_prefix, stats, drive_fd, window_time
+                            )
+                            if text_sigs_to_scan:
+                                claimed_ranges.append((offset + actual_pos, offset + actual_pos + len(file_data)))
+                            
+                            # Yield control after processing each file to allow cancellation
+                            await asyncio.sleep(0)
+                        else:
+                            logger.debug(f"Skipped small/corrupted file at offset {absolute_pos}: {len(file_data) if file_data else 0} bytes")
+                            
+                    except Exception as e:
+                        logger.debug(f"Failed to extract file at offset {absolute_pos}: {e}")
+                
+                # Second pass: carve header-less types (txt, csv) from long printable
+                # runs in the gaps between the binary files found above
+                if text_sigs_to_scan and len(buffer) > 100000:
+                    window_end = len(buffer) - 100000
+                    claimed_ranges = [r for r in claimed_ranges if r[1] > offset]
+                    
+                    for match in _TEXT_RUN_RE.finditer(buffer):
+                        run_start, run_end = match.span()
+                        if run_start >= window_end:
                             break
                         
-                        # Calculate absolute offset
-                        absolute_pos = offset + pos
+                        absolute_pos = offset + run_start
+                        if any(start < offset + run_end and absolute_pos < end for start, end in claimed_ranges):
+                            continue
+                        
+                        run_data = buffer[run_start:run_end]
+                        if run_end == len(buffer):
+                            # The run continues past this window - read its tail from the drive so
+                            # the file is not carved truncated at the chunk boundary
+                            run_data += self._read_text_tail(drive_handle, drive_fd, offset + run_end,
+                                                             max(_TEXT_MAX_SIZE.values()) - len(run_data))
                         
-                        # Skip if we already found a file starting near this offset
-                        # Allow 512 byte tolerance for alignment issues
-                        if any(abs(absolute_pos - found_offset) < 512 for found_offset in found_offsets):
-                            search_start = pos + 1
+                        sig_name = self._classify_text_run(run_data)
+                        if sig_name not in text_sigs_to_scan:
                             continue
+                        sig_info = text_sigs_to_scan[sig_name]
+                        file_data = run_data[:_TEXT_MAX_SIZE[sig_name]]
                         
-                        # Validate offset if specified
-                        if sig_offset > 0:
-                            if pos < sig_offset:
-                                search_start = pos + 1
-                                continue
-                            actual_pos = pos - sig_offset
-                        else:
-                            actual_pos = pos
+                        dedup_key = self._dedup_key(file_data)
+                        if dedup_key in found_hashes:
+                            continue
                         
-                        # Additional validation for specific file types
-                        if 'check' in sig_info:
-                            check_bytes = sig_info['check']
-                            if check_bytes not in buffer[actual_pos:actual_pos + 1000]:
-                                search_start = pos + 1
-                                continue
+                        validation_result = self._validate_cached(file_data, sig_info, sig_name, dedup_key)
+                        if not validation_result['is_valid'] or validation_result.get('score', 0) < 70:
+                            skipped_corrupted += 1
+                            continue
                         
-                        # Extract file
-                        try:
-                            file_data = self._extract_file(
-                                buffer,
-                                actual_pos,
-                                sig_info,
-                                drive_handle,
-                                offset + actual_pos,
-                                max_file_size
-                            )
-                            
-                            # Filter out very small files (likely corrupted or fragments)
-                            # STRICT: Minimum 4KB for all file types (reject tiny fragments)
-                            min_size = 4096
-                            
-                            if file_data and len(file_data) >= min_size:
-                                # Validate file integrity and get validation score
-                                validation_result = self._validate_file_with_score(file_data, sig_info)
-                                if not validation_result['is_valid']:
-                                    logger.debug(f"Skipped corrupted/invalid file at offset {absolute_pos}")
-                                    skipped_corrupted += 1
-                                    search_start = pos + 1
-                                    continue
-                                
-                                # STRICT: Only save files with GOOD validation scores (>= 70)
-                                validation_score = validation_result.get('score', 0)
-                                if validation_score < 70:
-                                    logger.debug(f"Skipped low-quality file at offset {absolute_pos} (score: {validation_score})")
-                                    skipped_corrupted += 1
-                                    search_start = pos + 1
-                                    continue
-                                
-                                # Check for duplicate content using MD5 (fast) and SHA256 (secure)
-                                file_md5 = hashlib.md5(file_data).hexdigest()
-                                file_sha256 = hashlib.sha256(file_data).hexdigest()
-                                
-                                if file_md5 in found_hashes:
-                                    logger.debug(f"Skipped duplicate file at offset {absolute_pos} (MD5: {file_md5[:8]}...)")
-                                    search_start = pos + 1
-                                    continue
-                                
-                                # Determine if file is fragmented/partial
-                                is_partial = validation_result.get('is_partial', False)
-                                file_ext = sig_info['extension']
-                                if is_partial:
-                                    file_ext = f"partial.{file_ext}"
-                                
-                                # Track this file
-                                file_counter += 1
-                                found_hashes.add(file_md5)
-                                found_offsets.add(absolute_pos)
-                                
-                                # Calculate recovered size
-                                total_recovered_size += len(file_data)
-                                
-                                # SAFETY CHECK: Only for non-deep scans (deep scan has no limit)
-                                if scan_type != 'deep' and total_recovered_size > max_total_recovery_size:
-                                    logger.warning("⚠️ SCAN LIMIT REACHED!")
-                                    logger.warning(f"   Total found: {total_recovered_size / (1024**3):.2f} GB")
-                                    logger.warning(f"   Limit: {max_total_recovery_size / (1024**3):.2f} GB")
-                                    logger.warning("   Stopping scan to prevent excessive recovery!")
-                                    break  # Stop scanning
-                                
-                                # Generate filename and path
-                                file_name = f"f{absolute_pos:08d}.{file_ext}"
-                                
-                                # DEEP SCAN: Index-only mode (read-only, no file writing)
-                                # CARVING SCAN: Write files immediately to TEMP directory
-                                if scan_type == 'deep':
-                                    # Use original output_dir for path reference (not actually written)
-                                    file_path = os.path.join(output_dir, file_name)
-                                    
-                                    # DEEP SCAN: Only create index entry (no file written)
-                                    partial_marker = " [PARTIAL]" if is_partial else ""
-                                    logger.debug(f"📋 Indexed: {file_name} ({len(file_data)} bytes, SHA256: {file_sha256[:16]}...){partial_marker}")
-                                    
-                                    # Create file catalog entry (NO FILE WRITTEN TO DISK)
-                                    file_info = {
-                                        'name': file_name,
-                                        'path': file_path,
-                                        'size': len(file_data),
-                                        'type': sig_info['extension'].upper(),
-                                        'extension': sig_info['extension'],
-                                        'offset': absolute_pos,
-                                        'md5': file_md5,
-                                        'sha256': file_sha256,
-                                        'hash': file_sha256,  # Alias for compatibility
-                                        'file_hash': file_sha256,  # Another alias
-                                        'validation_score': validation_result.get('score', 0),
-                                        'is_partial': is_partial,
-                                        'method': 'deep_scan_index',
-                                        'status': 'indexed',  # Not yet recovered - user must select
-                                        'indexed_at': datetime.now().isoformat(),
-                                        'drive_path': stats.get('physical_drive', stats.get('drive_path', 'unknown')),  # Store physical drive for recovery
-                                        'signature': sig_name  # Store signature type for validation
-                                    }
-                                else:
-                                    # CARVING SCAN: Write file to TEMPORARY directory (recovered_files in project root)
-                                    # These files will be copied to final output path on recovery
-                                    try:
-                                        # Get project root (parent of backend directory)
-                                        project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-                                        temp_recovery_dir = os.path.join(project_root, 'backend', 'recovered_files')
-                                        
-                                        # Ensure temp directory exists
-                                        os.makedirs(temp_recovery_dir, exist_ok=True)
-                                        
-                                        # Write to temp location
-                                        temp_file_path = os.path.join(temp_recovery_dir, file_name)
-                                        
-                                        with open(temp_file_path, 'wb') as f:
-                                            f.write(file_data)
-                                        
-                                        partial_marker = " [PARTIAL]" if is_partial else ""
-                                        logger.debug(f"✅ Temporarily stored: {file_name} ({len(file_data)} bytes, SHA256: {file_sha256[:16]}...){partial_marker}")
-                                        
-                                        # Create file info entry with 'recovered' status
-                                        # Path points to TEMP location, will be copied to final location on recovery
-                                        file_info = {
-                                            'name': file_name,
-                                            'path': temp_file_path,  # Point to temp location
-                                            'size': len(file_data),
-                                            'type': sig_info['extension'].upper(),
-                                            'extension': sig_info['extension'],
-                                            'offset': absolute_pos,
-                                            'md5': file_md5,
-                                            'sha256': file_sha256,
-                                            'hash': file_sha256,  # Alias for compatibility
-                                            'file_hash': file_sha256,  # Another alias
-                                            'validation_score': validation_result.get('score', 0),
-                                            'is_partial': is_partial,
-                                            'method': 'signature_carving',
-                                            'status': 'recovered',  # File has been written to TEMP disk
-                                            'recovered_at': datetime.now().isoformat(),
-                                            'signature': sig_name  # Store signature type for validation
-                                        }
-                                        
-                                    except Exception as write_error:
-                                        logger.error(f"Failed to write file {file_name}: {write_error}")
-                                        # Skip this file if we can't write it
-                                        search_start = pos + 1
-                                        continue
-                                
-                                # Yield control after processing each file to allow cancellation
-                                await asyncio.sleep(0)
-                                
-                                recovered_files.append(file_info)
-                            else:
-                                logger.debug(f"Skipped small/corrupted file at offset {absolute_pos}: {len(file_data) if file_data else 0} bytes")
-                                
-                        except Exception as e:
-                            logger.debug(f"Failed to extract file at offset {absolute_pos}: {e}")
+                        file_counter += 1
+                        found_hashes.add(dedup_key)
+                        bisect.insort(found_offsets, absolute_pos)
+                        total_recovered_size += len(file_data)
                         
-                        search_start = pos + 1
+                        if scan_type != 'deep' and total_recovered_size > max_total_recovery_size:
+                            logger.warning("⚠️ SCAN LIMIT REACHED!")
+                            logger.warning(f"   Total found: {total_recovered_size / (1024**3):.2f} GB")
+                            logger.warning(f"   Limit: {max_total_recovery_size / (1024**3):.2f} GB")
+                            logger.warning("   Stopping scan to prevent excessive recovery!")
+                            break
+                        
+                        file_name = f"f{absolute_pos:08d}.{sig_info['extension']}"
+                        await self._submit_carved_file(
+                            pending_files, recovered_files,
+                            file_data, file_name, sig_name, sig_info,
+                            absolute_pos, absolute_pos, validation_result,
+                            scan_type, out_prefix, stats, drive_fd, window_time
+                        )
+                        claimed_ranges.append((absolute_pos, absolute_pos + len(file_data)))
                 
                 # Keep last 100KB of buffer for signatures that span chunks
                 if len(buffer) > 100000:
-                    offset += len(buffer) - 100000
-                    buffer = buffer[-100000:]
+                    dropped = len(buffer) - 100000
+                    offset += dropped
+                    del buffer[:-100000]  # Drops the prefix in place - no new object per chunk
+                    self._slide_footer_memo(footer_memo, dropped)
                 
                 # Allow other tasks to run
                 await asyncio.sleep(0)
@@ -2492,8 +3598,16 @@ class PythonRecoveryService:
         except Exception as e:
             logger.error(f"Error during file carving: {e}", exc_info=True)
         
-        # Calculate total recovered size
-        total_recovered_size_actual = sum(f['size'] for f in recovered_files)
+        if scan_pool is not None:
+            scan_pool.shutdown(wait=False, cancel_futures=True)
+        if reader is not None:
+            reader.close()
+        
+        # Collect the remaining files hashed/written on the I/O pool (in discovery order)
+        await self._drain_pending_files(pending_files, recovered_files)
+        
+        # Calculate total recovered size (stored files only - the in-loop total also counts failed writes)
+        total_recovered_size_actual, partial_count = self._sum_file_totals(recovered_files)
         total_recovered_mb = total_recovered_size_actual / (1024 * 1024)
         
         # Check if scan was cancelled
@@ -2540,7 +3654,7 @@ class PythonRecoveryService:
         
         # Send final progress update
         if progress_callback:
-            elapsed = (datetime.now() - datetime.fromisoformat(stats['start_time'])).total_seconds()
+            elapsed = _elapsed_since_start(stats)
             await progress_callback({
                 'progress': 100.0,
                 'sectors_scanned': stats['sectors_scanned'],
@@ -2553,7 +3667,8 @@ class PythonRecoveryService:
             })
         
         # Generate manifest (index or recovery based on scan type)
-        self._generate_index_manifest(recovered_files, output_dir, stats, scan_type)
+        self._generate_index_manifest(recovered_files, output_dir, stats, scan_type,
+                                      totals=(total_recovered_size_actual, partial_count))
         
         if scan_type == 'deep':
             logger.info(f"✅ File indexing completed: {len(recovered_files)} files cataloged")
@@ -2561,7 +3676,229 @@ class PythonRecoveryService:
             logger.info(f"✅ File recovery completed: {len(recovered_files)} files saved to disk")
         return recovered_files
     
-    def _generate_index_manifest(self, recovered_files: List[Dict], output_dir: str, stats: Dict, scan_type: str = 'carving'):
+    def _read_text_tail(self, drive_handle: BinaryIO, drive_fd: Optional[int], at: int, limit: int) -> bytes:
+        """
+        Read the printable continuation of a text run that reaches the end of the window
+        
+        Args:
+            drive_handle: Drive handle (its position is left unchanged)
+            drive_fd: Drive file descriptor for positional reads, or None
+            at: Absolute offset just past the end of the window
+            limit: Maximum number of bytes to read
+            
+        Returns:
+            The leading printable bytes at `at` (empty if nothing could be read)
+        """
+        if limit <= 0:
+            return b''
+        try:
+            if drive_fd is not None and hasattr(os, 'pread'):
+                tail = os.pread(drive_fd, limit, at)
+            elif isinstance(drive_handle, Win32FileWrapper):
+                # Raw Windows devices only accept sector-aligned reads
+                skip = at % 512
+                tail = drive_handle.pread(-(-(skip + limit) // 512) * 512, at - skip)[skip:skip + limit]
+            else:
+                position = drive_handle.tell()
+                try:
+                    drive_handle.seek(at)
+                    tail = drive_handle.read(limit)
+                finally:
+                    drive_handle.seek(position)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Could not read text run tail at {at}: {e}")
+            return b''
+        return _TEXT_TAIL_RE.match(tail).group()
+    
+    def _classify_text_run(self, text: bytes) -> str:
+        """Tell CSV from plain text by the number of commas per line"""
+        lines = text.count(b'\n')
+        if lines >= 5 and lines <= text.count(b',') <= lines * 50:
+            return 'csv'
+        return 'txt'
+    
+    async def _submit_carved_file(self, pending_files: deque, recovered_files: List[Dict], *store_args):
+        """
+        Queue one carved file for hashing/storing on the shared I/O pool
+        
+        Once _MAX_PENDING_FILES are in flight the oldest are awaited first, so the
+        file data held by queued work stays bounded when the output disk is slow.
+        
+        Args:
+            pending_files: Futures of queued files, oldest first
+            recovered_files: Results list that completed files are appended to
+            store_args: Arguments for _persist_and_hash
+        """
+        await self._drain_pending_files(pending_files, recovered_files, _MAX_PENDING_FILES - 1)
+        pending_files.append(_IO_POOL.submit(self._persist_and_hash, *store_args))
+    
+    async def _drain_pending_files(self, pending_files: deque, recovered_files: List[Dict], limit: int = 0):
+        """
+        Await queued hash/store work oldest first until at most `limit` items remain
+        
+        Futures are awaited via asyncio.wrap_future, so the event loop keeps
+        serving progress updates and API calls while files are written.
+        """
+        while len(pending_files) > limit:
+            future = pending_files.popleft()
+            try:
+                file_info = await asyncio.wrap_future(future)
+            except Exception as e:
+                logger.debug(f"Failed to store carved file: {e}")
+                continue
+            if file_info is not None:
+                recovered_files.append(file_info)
+    
+    async def _queue_record_hash(self, pending_hashes: deque, record: Dict, file_data: bytes):
+        """
+        Hash file_data on the I/O pool and fill in the record's SHA-256 fields later
+        
+        Metadata walkers index many files back to back; hashing them on the shared
+        pool keeps several digests running at once (OpenSSL releases the GIL) and
+        keeps the event loop free. At most _MAX_PENDING_FILES hashes are in flight.
+        
+        Args:
+            pending_hashes: Queue of (record, future) pairs owned by the caller
+            record: File record whose 'sha256'/'hash'/'file_hash' fields are filled in
+            file_data: File content to hash
+        """
+        await self._drain_record_hashes(pending_hashes, _MAX_PENDING_FILES - 1)
+        pending_hashes.append((record, _IO_POOL.submit(self._hash_sha256, file_data)))
+    
+    async def _drain_record_hashes(self, pending_hashes: deque, limit: int = 0):
+        """Await queued record hashes oldest first until at most `limit` remain"""
+        while len(pending_hashes) > limit:
+            record, future = pending_hashes.popleft()
+            file_sha256 = await asyncio.wrap_future(future)
+            record['sha256'] = record['hash'] = record['file_hash'] = file_sha256
+    
+    def _persist_and_hash(self, file_data: bytes, file_name: str, sig_name: str, sig_info: Dict,
+                          absolute_pos: int, src_offset: int, validation_result: Dict,
+                          scan_type: str, out_prefix: str, stats: Dict,
+                          drive_fd: Optional[int], found_at: str) -> Optional[Dict]:
+        """
+        Hash and store one carved file (runs on the I/O thread pool)
+        
+        Returns:
+            File info dictionary from _store_carved_file, or None if it could not be written
+        """
+        file_sha256 = self._hash_sha256(file_data)
+        return self._store_carved_file(
+            file_data, file_name, sig_name, sig_info, absolute_pos, src_offset,
+            validation_result, file_sha256, scan_type, out_prefix, stats, drive_fd, found_at
+        )
+    
+    def _store_carved_file(self, file_data: bytes, file_name: str, sig_name: str, sig_info: Dict,
+                           absolute_pos: int, src_offset: int, validation_result: Dict,
+                           file_sha256: str, scan_type: str, out_prefix: str,
+                           stats: Dict, drive_fd: Optional[int], found_at: str) -> Optional[Dict]:
+        """
+        Index (deep scan) or write (carving) one validated carved file
+        
+        Args:
+            file_data: Carved file bytes
+            file_name: Generated file name
+            sig_name: Signature key that matched
+            sig_info: Signature information dictionary
+            absolute_pos: Offset the file is reported at
+            src_offset: Absolute drive offset of file_data (for in-kernel copies)
+            validation_result: Result of _validate_file_with_score
+            file_sha256: SHA256 hex digest of file_data
+            scan_type: Scan type ('deep' indexes only)
+            out_prefix: Directory (with trailing separator) the file is written/reported under
+            stats: Scan statistics dictionary
+            drive_fd: Drive file descriptor, or None
+            found_at: ISO timestamp of the scan window the file was carved from
+            
+        Returns:
+            File info dictionary, or None if the file could not be written
+        """
+        if scan_type == 'deep':
+            # Use original output_dir for path reference (not actually written)
+            file_path = out_prefix + file_name
+
+            # DEEP SCAN: Only create index entry (no file written)
+            partial_marker = " [PARTIAL]" if validation_result.get('is_partial', False) else ""
+            logger.debug(f"📋 Indexed: {file_name} ({len(file_data)} bytes, SHA256: {file_sha256[:16]}...){partial_marker}")
+
+            # Create file catalog entry (NO FILE WRITTEN TO DISK)
+            file_info = {
+                'name': file_name,
+                'path': file_path,
+                'size': len(file_data),
+                'type': sig_info['extension'].upper(),
+                'extension': sig_info['extension'],
+                'offset': absolute_pos,
+                'sha256': file_sha256,
+                'hash': file_sha256,  # Alias for compatibility
+                'file_hash': file_sha256,  # Another alias
+                'validation_score': validation_result.get('score', 0),
+                'is_partial': validation_result.get('is_partial', False),
+                'method': 'deep_scan_index',
+                'status': 'indexed',  # Not yet recovered - user must select
+                'indexed_at': found_at,
+                'drive_path': stats.get('physical_drive', stats.get('drive_path', 'unknown')),  # Store physical drive for recovery
+                'signature': sig_name  # Store signature type for validation
+            }
+        else:
+            # CARVING SCAN: Write file to TEMPORARY directory (recovered_files in project root)
+            # These files will be copied to final output path on recovery
+            try:
+                # Write to temp location (_TEMP_RECOVERY_DIR, created by _carve_files)
+                temp_file_path = out_prefix + file_name
+
+                # Copy the carved range drive -> file inside the kernel when possible
+                if drive_fd is None or not self._zero_copy_emit(
+                        drive_fd, src_offset, len(file_data), temp_file_path):
+                    _write_preallocated(temp_file_path, file_data)
+
+                partial_marker = " [PARTIAL]" if validation_result.get('is_partial', False) else ""
+                logger.debug(f"✅ Temporarily stored: {file_name} ({len(file_data)} bytes, SHA256: {file_sha256[:16]}...){partial_marker}")
+
+                # Create file info entry with 'recovered' status
+                # Path points to TEMP location, will be copied to final location on recovery
+                file_info = {
+                    'name': file_name,
+                    'path': temp_file_path,  # Point to temp location
+                    'size': len(file_data),
+                    'type': sig_info['extension'].upper(),
+                    'extension': sig_info['extension'],
+                    'offset': absolute_pos,
+                    'sha256': file_sha256,
+                    'hash': file_sha256,  # Alias for compatibility
+                    'file_hash': file_sha256,  # Another alias
+                    'validation_score': validation_result.get('score', 0),
+                    'is_partial': validation_result.get('is_partial', False),
+                    'method': 'signature_carving',
+                    'status': 'recovered',  # File has been written to TEMP disk
+                    'recovered_at': found_at,
+                    'signature': sig_name  # Store signature type for validation
+                }
+
+            except Exception as write_error:
+                logger.error(f"Failed to write file {file_name}: {write_error}")
+                return None
+
+        return file_info
+    
+    @staticmethod
+    def _sum_file_totals(recovered_files: List[Dict]) -> Tuple[int, int]:
+        """
+        Total size and partial-file count of file records, in one pass
+        
+        Returns:
+            Tuple of (total size in bytes, number of partial files)
+        """
+        total_size = 0
+        partial_count = 0
+        for file_info in recovered_files:
+            total_size += file_info['size']
+            if file_info.get('is_partial', False):
+                partial_count += 1
+        return total_size, partial_count
+    
+    def _generate_index_manifest(self, recovered_files: List[Dict], output_dir: str, stats: Dict,
+                                 scan_type: str = 'carving', totals: Optional[Tuple[int, int]] = None):
         """
         Generate index/recovery manifest with file metadata
         
@@ -2570,8 +3907,11 @@ class PythonRecoveryService:
             output_dir: Directory where manifest is saved
             stats: Scan statistics dictionary
             scan_type: Type of scan ('deep' for indexing, 'carving' for recovery)
+            totals: (total size, partial count) if the caller already computed them
         """
         try:
+            total_size, partial_count = totals if totals is not None else self._sum_file_totals(recovered_files)
+            
             # Different manifest names and content based on scan type
             if scan_type == 'deep':
                 manifest_path = os.path.join(output_dir, 'scan_index.json')
@@ -2595,21 +3935,22 @@ class PythonRecoveryService:
                     'timestamp': datetime.now().isoformat(),
                     'drive_path': stats.get('drive_path', 'unknown'),
                     'total_sectors_scanned': stats.get('sectors_scanned', 0),
-                    'scan_duration_seconds': (datetime.now() - datetime.fromisoformat(stats['start_time'])).total_seconds(),
+                    'scan_duration_seconds': _elapsed_since_start(stats),
                     'recovery_method': method_label
                 },
                 'statistics': {
                     count_label: len(recovered_files),
                     'unique_files': len(recovered_files),  # Already deduplicated
-                    'total_size_bytes': sum(f['size'] for f in recovered_files),
-                    'partial_files': sum(1 for f in recovered_files if f.get('is_partial', False)),
-                    'disk_space_used': sum(f['size'] for f in recovered_files) if scan_type != 'deep' else 0,  # Only carving uses disk space
+                    'total_size_bytes': total_size,
+                    'partial_files': partial_count,
+                    'disk_space_used': total_size if scan_type != 'deep' else 0,  # Only carving uses disk space
                     'recovery_status': 'indexed' if scan_type == 'deep' else 'completed'
                 },
                 files_label: []
             }
             
             # Add detailed file information for each file
+            generated_at = manifest['scan_info']['timestamp']
             for file_info in recovered_files:
                 file_entry = {
                     'filename': file_info.get('name', 'unknown'),
@@ -2618,13 +3959,12 @@ class PythonRecoveryService:
                     'offset': file_info.get('offset', 0),  # Original location on drive
                     'file_type': file_info.get('type', 'unknown'),
                     'extension': file_info.get('extension', 'unknown'),
-                    'md5': file_info.get('md5', ''),
                     'sha256': file_info.get('sha256', ''),
                     'validation_score': file_info.get('validation_score', 0),
                     'is_partial': file_info.get('is_partial', False),
                     'status': status_label,  # 'indexed' or 'recovered'
                     'method': file_info.get('method', method_label),
-                    'recovered_at': file_info.get('recovered_at', datetime.now().isoformat()),
+                    'recovered_at': file_info.get('recovered_at', generated_at),
                     'signature': file_info.get('signature', 'unknown')
                 }
                 
@@ -2634,9 +3974,13 @@ class PythonRecoveryService:
                 
                 manifest[files_label].append(file_entry)
             
-            # Write manifest file
-            with open(manifest_path, 'w', encoding='utf-8') as f:
-                json.dump(manifest, f, indent=2)
+            # Write manifest file (orjson emits UTF-8 bytes directly)
+            if ORJSON_AVAILABLE:
+                with open(manifest_path, 'wb') as f:
+                    f.write(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+            else:
+                with open(manifest_path, 'w', encoding='utf-8') as f:
+                    json.dump(manifest, f, indent=2)
             
             # Mode-specific logging
             if scan_type == 'deep':
@@ -2687,8 +4031,69 @@ class PythonRecoveryService:
         
         return self._format_time(remaining_seconds)
     
+    def _find_footer(self, buffer: bytes, footer: bytes, start: int, footer_memo: Optional[Dict]) -> int:
+        """
+        buffer.find(footer, start), remembering the last answer per footer
+        
+        Candidates are extracted in position order, so consecutive lookups for the
+        same footer usually land in the range already searched: if the previous
+        search from s0 returned r0, there is no footer in [s0, r0) and every start
+        in [s0, r0] has the same answer. A footer missing from the buffer is only
+        searched for again in the bytes appended since (see _slide_footer_memo).
+        
+        Args:
+            buffer: Carving buffer (only appended to / slid since footer_memo was created)
+            footer: Footer bytes to look for
+            start: First position to search
+            footer_memo: Dict of footer -> (start, result, buffer length searched), or None
+            
+        Returns:
+            Position of the footer, or -1 if it does not occur at or after start
+        """
+        if footer_memo is None:
+            return buffer.find(footer, start)
+        
+        previous = footer_memo.get(footer)
+        if previous is not None:
+            searched_from, found, searched_to = previous
+            if searched_from <= start:
+                if found != -1:
+                    if start <= found:
+                        return found
+                elif searched_to == len(buffer):
+                    return -1
+                else:
+                    # Not in [searched_from, searched_to) - only the appended bytes are new
+                    resume = max(searched_to - len(footer) + 1, searched_from)
+                    if start > resume:
+                        searched_from = resume = start  # [resume, start) is not covered by this search
+                    found = buffer.find(footer, resume)
+                    footer_memo[footer] = (searched_from, found, len(buffer))
+                    return found
+        
+        found = buffer.find(footer, start)
+        footer_memo[footer] = (start, found, len(buffer))
+        return found
+    
+    @staticmethod
+    def _slide_footer_memo(footer_memo: Dict, dropped: int):
+        """
+        Re-base footer_memo after the first `dropped` bytes of the carving buffer are removed
+        
+        Answers that pointed into the dropped prefix are forgotten; the rest move
+        with the buffer, so the next window only searches its new bytes.
+        """
+        for footer, (searched_from, found, searched_to) in list(footer_memo.items()):
+            if (found != -1 and found < dropped) or searched_to <= dropped:
+                del footer_memo[footer]
+            else:
+                footer_memo[footer] = (max(searched_from - dropped, 0),
+                                       found - dropped if found != -1 else -1,
+                                       searched_to - dropped)
+    
     def _extract_file(self, buffer: bytes, start_pos: int, sig_info: Dict,
-                     drive_handle: BinaryIO, absolute_offset: int, max_file_size: int = 100 * 1024 * 1024) -> Optional[bytes]:
+                     drive_handle: BinaryIO, absolute_offset: int, max_file_size: int = 100 * 1024 * 1024,
+                     sig_name: Optional[str] = None, footer_memo: Optional[Dict] = None) -> Optional[bytes]:
         """
         Extract file data from buffer
         
@@ -2699,18 +4104,25 @@ class PythonRecoveryService:
             drive_handle: Drive handle for reading more data if needed
             absolute_offset: Absolute offset on drive
             max_file_size: Maximum file size to extract
+            sig_name: Signature key, used to look up the precompiled footer
+            footer_memo: Footer lookup memo for buffer (see _find_footer)
             
         Returns:
             File data as bytes or None if extraction failed
         """
-        footer = sig_info.get('footer')
+        if sig_name is not None:
+            footer_entry = _FOOTER_TABLE.get(sig_name)
+        elif sig_info.get('footer'):
+            footer_entry = (sig_info['footer'], len(sig_info['footer']), len(sig_info['header']))
+        else:
+            footer_entry = None
         
-        if footer:
+        if footer_entry:
             # Look for footer in buffer
-            end_pos = buffer.find(footer, start_pos + len(sig_info['header']))
+            footer, footer_len, header_len = footer_entry
+            end_pos = self._find_footer(buffer, footer, start_pos + header_len, footer_memo)
             if end_pos != -1:
-                end_pos += len(footer)
-                return buffer[start_pos:end_pos]
+                return buffer[start_pos:end_pos + footer_len]
             else:
                 # STRICT: If footer is defined but not found, REJECT the file
                 # Don't recover partial/incomplete files
@@ -2718,106 +4130,112 @@ class PythonRecoveryService:
                 logger.debug(f"Rejecting {file_ext} at {absolute_offset} - footer not found")
                 return None
         else:
-            # No footer - try to determine size from file header
+            # No footer - the end is found from a type-specific end marker or a size cap
             file_ext = sig_info['extension']
             
-            # Use smart size detection based on file type (CONSERVATIVE LIMITS)
-            if file_ext in ['jpg', 'jpeg']:
-                # JPEG: MUST find EOI marker (FF D9) - STRICT MODE
-                eoi = b'\xff\xd9'
-                end_pos = buffer.find(eoi, start_pos + 2)
-                if end_pos != -1:
-                    return buffer[start_pos:end_pos + 2]
-                else:
-                    # STRICT: No EOI marker found = corrupted/incomplete JPEG
-                    logger.debug(f"Rejecting JPEG at {absolute_offset} - no EOI marker found")
-                    return None
-            
-            elif file_ext == 'png':
-                # PNG: MUST find IEND chunk - STRICT MODE
-                iend = b'\x00\x00\x00\x00IEND\xae\x42\x60\x82'
-                end_pos = buffer.find(iend, start_pos + 8)
+            marker_rule = _END_MARKER_RULES.get(file_ext)
+            if marker_rule is not None:
+                # STRICT MODE: the end marker MUST be found, else the file is corrupted/incomplete
+                marker, search_skip, kept_len, missing = marker_rule
+                end_pos = self._find_footer(buffer, marker, start_pos + search_skip, footer_memo)
                 if end_pos != -1:
-                    return buffer[start_pos:end_pos + 12]
-                else:
-                    # STRICT: No IEND chunk = corrupted/incomplete PNG
-                    logger.debug(f"Rejecting PNG at {absolute_offset} - no IEND chunk found")
-                    return None
+                    return buffer[start_pos:end_pos + kept_len]
+                logger.debug(f"Rejecting {file_ext} at {absolute_offset} - {missing}")
+                return None
             
-            elif file_ext == 'mp3':
-                # CONSERVATIVE: Audio files - limit to 5MB (typical song)
-                end_pos = min(start_pos + 5 * 1024 * 1024, len(buffer))
-                return buffer[start_pos:end_pos]
-            
-            elif file_ext == 'wav':
-                # CONSERVATIVE: WAV - 5MB limit (short audio)
-                end_pos = min(start_pos + 5 * 1024 * 1024, len(buffer))
-                return buffer[start_pos:end_pos]
-            
-            elif file_ext in ['mp4', 'mov']:
-                # CONSERVATIVE: Video files - limit to 10MB (very short clips)
-                end_pos = min(start_pos + 10 * 1024 * 1024, len(buffer))
-                return buffer[start_pos:end_pos]
-            
-            elif file_ext == 'avi':
-                # CONSERVATIVE: AVI video format - 10MB limit
-                end_pos = min(start_pos + 10 * 1024 * 1024, len(buffer))
-                return buffer[start_pos:end_pos]
-            
-            elif file_ext in ['docx', 'xlsx', 'pptx', 'zip']:
-                # Office files and ZIP: MUST find end of central directory - STRICT MODE
-                # Look for PK\x05\x06 (end of central directory)
-                eocd = b'PK\x05\x06'
-                end_pos = buffer.find(eocd, start_pos + 100)
-                if end_pos != -1:
-                    # Found EOCD, include it plus the 22 bytes of EOCD record
-                    return buffer[start_pos:end_pos + 22]
-                else:
-                    # STRICT: No EOCD = incomplete ZIP/Office file
-                    logger.debug(f"Rejecting {file_ext} at {absolute_offset} - no ZIP end marker found")
-                    return None
-            
-            elif file_ext == 'txt':
-                # CONSERVATIVE: Text files - 500KB limit
-                end_pos = min(start_pos + 512 * 1024, len(buffer))
-                return buffer[start_pos:end_pos]
-            
-            elif file_ext == 'pdf':
-                # PDF: MUST find %%EOF marker - STRICT MODE
-                eof = b'%%EOF'
-                end_pos = buffer.find(eof, start_pos + 10)
-                if end_pos != -1:
-                    return buffer[start_pos:end_pos + 5]
+            # CONSERVATIVE: size-capped types (unknown types get 1MB)
+            end_pos = min(start_pos + _CAPPED_EXTRACT_SIZES.get(file_ext, 1024 * 1024), len(buffer))
+            return buffer[start_pos:end_pos]
+    
+    def _quick_verify_png(self, file_data: bytes) -> Optional[Tuple[int, int, Optional[str]]]:
+        """
+        Walk PNG chunks up to IEND, checking every chunk CRC (no pixel decode)
+        
+        Args:
+            file_data: PNG file data
+            
+        Returns:
+            (width, height, mode) from IHDR if the chunk chain is intact, else None.
+            mode is the Pillow mode name, or None for colour types it can't be derived for
+        """
+        view = memoryview(file_data)
+        size = None
+        offset = 8  # Skip the PNG signature
+        
+        while offset + 12 <= len(file_data):
+            chunk_len, chunk_type = _PNG_CHUNK_HEADER.unpack_from(file_data, offset)
+            crc_pos = offset + 8 + chunk_len
+            if crc_pos + 4 > len(file_data):
+                return None
+            if zlib.crc32(view[offset + 4:crc_pos]) != int.from_bytes(file_data[crc_pos:crc_pos + 4], 'big'):
+                return None
+            
+            if chunk_type == b'IHDR' and chunk_len >= 10:
+                width, height, bit_depth, color_type = _PNG_IHDR.unpack_from(file_data, offset + 8)
+                if color_type == 0 and bit_depth in (1, 16):
+                    mode = '1' if bit_depth == 1 else 'I;16'
                 else:
-                    # STRICT: No %%EOF = incomplete PDF
-                    logger.debug(f"Rejecting PDF at {absolute_offset} - no %%EOF marker found")
-                    return None
-            
-            elif file_ext == 'rar':
-                # RAR: Look for RAR end marker (not always reliable)
-                # For now, limit to 5MB
-                end_pos = min(start_pos + 5 * 1024 * 1024, len(buffer))
-                return buffer[start_pos:end_pos]
-            
-            elif file_ext in ['sqlite', 'db', 'sqlite3']:
-                # CONSERVATIVE: Database files - 5MB limit
-                end_pos = min(start_pos + 5 * 1024 * 1024, len(buffer))
-                return buffer[start_pos:end_pos]
-            
-            elif file_ext == 'csv':
-                # CONSERVATIVE: CSV files - 1MB limit
-                end_pos = min(start_pos + 1 * 1024 * 1024, len(buffer))
-                return buffer[start_pos:end_pos]
+                    mode = _PNG_COLOR_MODES.get(color_type)
+                size = (width, height, mode)
+            elif chunk_type == b'IEND':
+                return size
+            offset = crc_pos + 4
+        
+        return None
+    
+    def _quick_verify_jpeg(self, file_data: bytes) -> Optional[Tuple[int, int, Optional[str]]]:
+        """
+        Walk JPEG marker segments from SOI to SOS and require a trailing EOI
+        
+        Only segment lengths are checked - Huffman data is never decoded.
+        
+        Args:
+            file_data: JPEG file data
+            
+        Returns:
+            (width, height, mode) from the SOF segment if the structure is intact, else None.
+            mode is the Pillow mode name for the component count, or None if unusual
+        """
+        if not file_data.startswith(b'\xFF\xD8') or not file_data.endswith(b'\xFF\xD9'):
+            return None
+        
+        size = None
+        offset = 2
+        
+        while offset + 4 <= len(file_data):
+            prefix, marker, seg_len = _JPEG_SEGMENT_HEADER.unpack_from(file_data, offset)
+            if prefix != 0xFF:
+                return None
+            if marker == 0xFF:
+                offset += 1  # Fill byte
+                continue
+            if marker == 0x01 or 0xD0 <= marker <= 0xD7:
+                offset += 2  # Standalone markers carry no length
+                continue
+            if marker in (0xD8, 0xD9):
+                return None  # A second SOI or an EOI before the scan - not a well-formed image
+            if seg_len < 2 or offset + 2 + seg_len > len(file_data):
+                return None
             
-            else:
-                # CONSERVATIVE: Default - 1MB for unknown types
-                default_size = 1 * 1024 * 1024  # 1MB default
-                end_pos = min(start_pos + default_size, len(buffer))
-                return buffer[start_pos:end_pos]
+            if marker in _JPEG_SOF_MARKERS and seg_len >= 7:
+                height, width = struct.unpack_from('>HH', file_data, offset + 5)
+                mode = _JPEG_COMPONENT_MODES.get(file_data[offset + 9]) if seg_len >= 8 else None
+                size = (width, height, mode)
+            elif marker == 0xDA:
+                # Start of scan - entropy-coded data runs to the EOI checked above
+                return size
+            offset += 2 + seg_len
+        
+        return None
     
     def _advanced_image_validation(self, file_data: bytes, file_ext: str) -> Dict:
         """
-        Advanced image validation using Pillow
+        Advanced image validation by structural header walk
+        
+        PNG chunk CRCs and JPEG segment lengths are checked directly instead of
+        Image.verify(), so no decoder state is built. The image mode comes from
+        IHDR/SOF as well; Pillow (if available) is only asked for it when the
+        header doesn't map to a mode.
         
         Args:
             file_data: Image file data
@@ -2840,42 +4258,57 @@ class PythonRecoveryService:
             'format': None,
             'size': None,
             'mode': None,
-            'reason': 'Pillow not available'
+            'reason': 'Unsupported image type'
         }
         
-        if not PILLOW_AVAILABLE:
-            return result
-        
         try:
-            # Try to open image with Pillow
-            img = Image.open(io.BytesIO(file_data))
+            if file_ext == 'png':
+                result['format'] = 'PNG'
+                result['can_open'] = file_data.startswith(b'\x89PNG\r\n\x1a\n')
+                size = self._quick_verify_png(file_data)
+            elif file_ext in ['jpg', 'jpeg']:
+                result['format'] = 'JPEG'
+                result['can_open'] = file_data.startswith(b'\xFF\xD8\xFF')
+                size = self._quick_verify_jpeg(file_data)
+            else:
+                return result
             
-            result['can_open'] = True
-            result['format'] = img.format
-            result['size'] = img.size
-            result['mode'] = img.mode
+            if size is None:
+                result['reason'] = f'{result["format"]} structure check failed'
+                return result
             
-            # Verify image can be loaded (not just opened)
-            img.verify()
+            width, height, mode = size
+            size = (width, height)
+            result['size'] = size
+            result['mode'] = mode
             result['is_valid'] = True
-            result['reason'] = f'Valid {img.format} image: {img.size[0]}x{img.size[1]}'
+            result['reason'] = f'Valid {result["format"]} image: {size[0]}x{size[1]}'
             
             # Additional checks
-            if img.size[0] < 1 or img.size[1] < 1:
+            if size[0] < 1 or size[1] < 1:
                 result['is_valid'] = False
                 result['reason'] = 'Invalid image dimensions'
             
+            if mode is None and PILLOW_AVAILABLE:
+                # Mode is informational only - a Pillow failure must not change the structural verdict.
+                # Image.open only parses the header, so hand it a bounded prefix instead of the whole file
+                try:
+                    result['mode'] = Image.open(io.BytesIO(file_data[:_IMAGE_MODE_PROBE])).mode
+                except Exception as e:
+                    logger.debug(f"Could not read image mode: {e}")
+            
         except Exception as e:
-            result['reason'] = f'Pillow validation failed: {str(e)}'
+            result['reason'] = f'Image validation failed: {str(e)}'
         
         return result
     
-    def _advanced_mime_validation(self, file_data: bytes) -> Dict:
+    def _advanced_mime_validation(self, file_data: bytes, describe: bool = True) -> Dict:
         """
         Advanced MIME type validation using python-magic
         
         Args:
             file_data: File data
+            describe: Also get the libmagic description (a second scan of the data)
             
         Returns:
             Dictionary with MIME type information:
@@ -2895,19 +4328,51 @@ class PythonRecoveryService:
             return result
         
         try:
+            # Each Magic() loads the magic database from disk - build each one once
+            head = file_data[:8192]
+            if self._magic_mime is None:
+                self._magic_mime = magic.Magic(mime=True)
+            
             # Get MIME type
-            mime = magic.Magic(mime=True)
-            result['mime_type'] = mime.from_buffer(file_data[:8192])
+            result['mime_type'] = self._magic_mime.from_buffer(head)
             
             # Get file description
-            desc = magic.Magic()
-            result['description'] = desc.from_buffer(file_data[:8192])
+            if describe:
+                if self._magic_desc is None:
+                    self._magic_desc = magic.Magic()
+                result['description'] = self._magic_desc.from_buffer(head)
             
         except Exception as e:
             logger.debug(f"Magic validation error: {e}")
         
         return result
     
+    def _validate_cached(self, file_data: bytes, sig_info: Dict, sig_name: str, dedup_key: bytes) -> Dict:
+        """
+        Validate file data, reusing the verdict for content seen before
+        
+        Repeated copies of the same file (backups, caches, slack space) are common
+        on real drives. The dedup key already covers the whole content, so a hit
+        returns exactly what _validate_file_with_score would.
+        
+        Args:
+            file_data: The file data to validate
+            sig_info: Signature information for the file type
+            sig_name: Signature name the data was carved for
+            dedup_key: Content digest from _dedup_key
+            
+        Returns:
+            Validation result dictionary (see _validate_file_with_score)
+        """
+        memo_key = (sig_name, dedup_key)
+        result = self._validate_memo.get(memo_key)
+        if result is None:
+            result = self._validate_file_with_score(file_data, sig_info)
+            self._validate_memo[memo_key] = result
+            if len(self._validate_memo) > _VALIDATE_MEMO_SIZE:
+                self._validate_memo.popitem(last=False)
+        return dict(result)
+    
     def _validate_file_with_score(self, file_data: bytes, sig_info: Dict) -> Dict:
         """
         Validate file and return detailed validation result with scoring
@@ -2944,7 +4409,9 @@ class PythonRecoveryService:
         
         try:
             # Use existing strict validation
-            is_valid = self._validate_file(file_data, sig_info)
+            # Byte counts gathered by the strict checks, reused for scoring below
+            summary = {}
+            is_valid = self._validate_file(file_data, sig_info, summary)
             
             if not is_valid:
                 result['reason'] = 'Failed strict validation checks'
@@ -2956,7 +4423,7 @@ class PythonRecoveryService:
             # Check for footer presence (indicates complete file)
             footer = sig_info.get('footer')
             if footer:
-                has_footer = file_data.endswith(footer) or footer in file_data[-100:]
+                has_footer = file_data.endswith(footer) or file_data.find(footer, -100) != -1
                 if has_footer:
                     score += 30  # Complete file with footer
                 else:
@@ -2967,37 +4434,15 @@ class PythonRecoveryService:
                 score += 30
             
             # Additional scoring based on file type specifics
-            if file_ext in ['jpg', 'jpeg']:
-                # JPEG: Check for EOI marker
-                if file_data.endswith(b'\xFF\xD9') or b'\xFF\xD9' in file_data[-10:]:
-                    score += 20  # Complete JPEG
-                else:
-                    is_partial = True
-                    score -= 10  # Missing EOI
-                    
-            elif file_ext == 'png':
-                # PNG: Check for IEND chunk
-                if file_data.endswith(b'IEND\xae\x42\x60\x82'):
-                    score += 20  # Complete PNG
-                else:
-                    is_partial = True
-                    score -= 10  # Missing IEND
-                    
-            elif file_ext == 'pdf':
-                # PDF: Check for %%EOF
-                if b'%%EOF' in file_data[-100:]:
-                    score += 20  # Complete PDF
-                else:
-                    is_partial = True
-                    score -= 10  # Missing EOF
-                    
-            elif file_ext in ['docx', 'xlsx', 'pptx', 'zip']:
-                # ZIP-based: Check for end of central directory
-                if b'PK\x05\x06' in file_data[-1000:]:
-                    score += 20  # Complete ZIP
+            completeness = _COMPLETENESS_TAILS.get(file_ext)
+            if completeness is not None:
+                # End marker must sit in the tail (EOI, IEND, %%EOF, end of central directory)
+                marker, tail_len = completeness
+                if file_data.find(marker, -tail_len) != -1:
+                    score += 20  # Complete file
                 else:
                     is_partial = True
-                    score -= 10  # Incomplete ZIP
+                    score -= 10  # Missing end marker
                     
             elif file_ext in ['mp4', 'mov', 'avi', 'wav']:
                 # Video/audio: Check for reasonable size ratio
@@ -3008,8 +4453,10 @@ class PythonRecoveryService:
                     score += 10  # Small media file
                     
             elif file_ext == 'mp3':
-                # MP3: Check frame count
-                frame_count = file_data.count(b'\xFF\xFB')
+                # MP3: Check frame count (whole file - counted by the strict check)
+                frame_count = summary.get('mp3_frames')
+                if frame_count is None:
+                    frame_count = len(_MP3_FRAME_HEADER.findall(file_data))
                 if frame_count > 1000:
                     score += 20  # Many frames, likely complete
                 elif frame_count > 500:
@@ -3020,36 +4467,28 @@ class PythonRecoveryService:
             # Ensure score is in range [0, 100]
             score = max(0, min(100, score))
             
-            # PHASE 3: Advanced validation with Pillow (if available)
-            if file_ext in ['jpg', 'jpeg', 'png'] and PILLOW_AVAILABLE:
+            # PHASE 3: Advanced image validation (structural PNG/JPEG walk)
+            if file_ext in ['jpg', 'jpeg', 'png']:
                 image_validation = self._advanced_image_validation(file_data, file_ext)
                 if image_validation['can_open']:
                     if image_validation['is_valid']:
-                        score = min(100, score + 5)  # Bonus for Pillow validation
+                        score = min(100, score + 5)  # Bonus for structural validation
                         result['reason'] = f"Validated: {image_validation['reason']}"
                     else:
-                        score = max(0, score - 10)  # Penalty if Pillow can't validate
-                        result['reason'] = f"Pillow validation failed: {image_validation['reason']}"
-            
-            # PHASE 3: Advanced MIME validation (if available)
-            if MAGIC_AVAILABLE:
-                mime_validation = self._advanced_mime_validation(file_data)
+                        score = max(0, score - 10)  # Penalty if structure is broken
+                        result['reason'] = f"Image validation failed: {image_validation['reason']}"
+            
+            # PHASE 3: Advanced MIME validation (if available) - only types with a known
+            # MIME type can get the bonus, so libmagic is not run for the others
+            expected_mime = _EXPECTED_MIMES.get(file_ext)
+            if MAGIC_AVAILABLE and expected_mime is not None:
+                mime_validation = self._advanced_mime_validation(file_data, describe=False)
                 if mime_validation['mime_type']:
                     # Verify MIME type matches expected file type
-                    expected_mimes = {
-                        'jpg': 'image/jpeg',
-                        'jpeg': 'image/jpeg',
-                        'png': 'image/png',
-                        'pdf': 'application/pdf',
-                        'zip': 'application/zip',
-                        'mp4': 'video/mp4',
-                        'mp3': 'audio/mpeg',
-                    }
-                    if file_ext in expected_mimes:
-                        if mime_validation['mime_type'] == expected_mimes[file_ext]:
-                            score = min(100, score + 3)  # Bonus for MIME match
-                        else:
-                            logger.debug(f"MIME mismatch: expected {expected_mimes[file_ext]}, got {mime_validation['mime_type']}")
+                    if mime_validation['mime_type'] == expected_mime:
+                        score = min(100, score + 3)  # Bonus for MIME match
+                    else:
+                        logger.debug(f"MIME mismatch: expected {expected_mime}, got {mime_validation['mime_type']}")
             
             # Final score adjustment
             score = max(0, min(100, score))
@@ -3068,7 +4507,7 @@ class PythonRecoveryService:
         
         return result
     
-    def _validate_file(self, file_data: bytes, sig_info: Dict) -> bool:
+    def _validate_file(self, file_data: bytes, sig_info: Dict, summary: Optional[Dict] = None) -> bool:
         """
         Validate if the recovered file is actually readable and not corrupted
         STRICT VALIDATION - Only accept files in perfect condition
@@ -3076,6 +4515,8 @@ class PythonRecoveryService:
         Args:
             file_data: The file data to validate
             sig_info: Signature information for the file type
+            summary: Optional dict that receives whole-file counts computed on the way
+                     ('mp3_frames'), so callers don't walk the data again
             
         Returns:
             True if file appears valid, False if corrupted
@@ -3092,213 +4533,9 @@ class PythonRecoveryService:
                     return False
             
             # STRICT validation based on file type
-            if file_ext in ['jpg', 'jpeg']:
-                # JPEG STRICT validation
-                if not file_data.startswith(b'\xFF\xD8\xFF'):
-                    return False
-                # MUST have End of Image marker
-                if not file_data.endswith(b'\xFF\xD9') and b'\xFF\xD9' not in file_data[-10:]:
-                    return False
-                # Must have multiple valid JPEG segments (SOF, DHT, DQT, SOS, etc.)
-                if file_data.count(b'\xFF') < 10:  # Strict: need many markers
-                    return False
-                # Check for JFIF or Exif marker (standard JPEG)
-                if b'JFIF' not in file_data[:50] and b'Exif' not in file_data[:50]:
-                    return False
-                # Check file has reasonable structure (not just header+footer)
-                if len(file_data) < 2048:  # Real JPEGs are usually > 2KB
-                    return False
-            
-            elif file_ext == 'png':
-                # PNG STRICT validation
-                if not file_data.startswith(b'\x89PNG\r\n\x1a\n'):
-                    return False
-                # MUST have IHDR chunk immediately after header
-                if b'IHDR' not in file_data[8:25]:
-                    return False
-                # MUST end with IEND chunk
-                if not file_data.endswith(b'IEND\xae\x42\x60\x82'):
-                    # Check if IEND is near the end
-                    if b'IEND\xae\x42\x60\x82' not in file_data[-50:]:
-                        return False
-                # Must have IDAT chunk (actual image data)
-                if b'IDAT' not in file_data:
-                    return False
-                # Check for CRC after IHDR
-                if len(file_data) < 50:
-                    return False
-            
-            elif file_ext == 'pdf':
-                # PDF STRICT validation
-                if not file_data.startswith(b'%PDF-'):
-                    return False
-                # MUST end with %%EOF
-                if b'%%EOF' not in file_data[-100:]:  # EOF should be near end
-                    return False
-                # Must have catalog
-                if b'/Catalog' not in file_data:
-                    return False
-                # Must have at least one page
-                if b'/Page' not in file_data:
-                    return False
-                # Must have xref table or stream
-                if b'xref' not in file_data and b'/XRef' not in file_data:
-                    return False
-                # Check for proper object structure
-                if file_data.count(b'obj') < 2:  # Need multiple objects
-                    return False
-            
-            elif file_ext in ['docx', 'xlsx', 'pptx']:
-                # Office files STRICT validation (ZIP-based)
-                if not file_data.startswith(b'PK\x03\x04'):
-                    return False
-                # MUST have proper ZIP end marker
-                if b'PK\x05\x06' not in file_data[-1000:]:  # End of central directory
-                    return False
-                # MUST have central directory records
-                if b'PK\x01\x02' not in file_data:
-                    return False
-                # Check for Office-specific content
-                if file_ext == 'docx':
-                    if b'word/' not in file_data[:5000]:
-                        return False
-                    # Must have document.xml
-                    if b'document.xml' not in file_data[:10000]:
-                        return False
-                elif file_ext == 'xlsx':
-                    if b'xl/' not in file_data[:5000]:
-                        return False
-                    # Must have workbook
-                    if b'workbook.xml' not in file_data[:10000]:
-                        return False
-                elif file_ext == 'pptx':
-                    if b'ppt/' not in file_data[:5000]:
-                        return False
-                    # Must have presentation
-                    if b'presentation.xml' not in file_data[:10000]:
-                        return False
-                # Must have [Content_Types].xml
-                if b'[Content_Types].xml' not in file_data[:5000]:
-                    return False
-            
-            elif file_ext == 'zip':
-                # ZIP STRICT validation
-                if not file_data.startswith(b'PK\x03\x04'):
-                    return False
-                # MUST have end of central directory
-                if b'PK\x05\x06' not in file_data[-1000:]:
-                    return False
-                # Must have at least one central directory entry
-                if b'PK\x01\x02' not in file_data:
-                    return False
-                # Check for valid local file header
-                if len(file_data) < 100:
-                    return False
-            
-            elif file_ext == 'rar':
-                # RAR STRICT validation
-                if not file_data.startswith(b'Rar!\x1a\x07'):
-                    return False
-                # Check for RAR block headers
-                if file_data.count(b'\x74') < 1:  # RAR file header block
-                    return False
-                # Minimum size for valid RAR
-                if len(file_data) < 100:
-                    return False
-            
-            elif file_ext == 'mp3':
-                # MP3 STRICT validation
-                frame_count = 0
-                if file_data.startswith(b'ID3'):
-                    # Has ID3 tag - skip it to find audio frames
-                    if len(file_data) < 10:
-                        return False
-                    # ID3v2 tag size
-                    tag_size = ((file_data[6] & 0x7F) << 21) | ((file_data[7] & 0x7F) << 14) | \
-                               ((file_data[8] & 0x7F) << 7) | (file_data[9] & 0x7F)
-                    audio_start = 10 + tag_size
-                    if audio_start >= len(file_data):
-                        return False
-                    # Check for valid MP3 frames after ID3
-                    frame_count = file_data[audio_start:].count(b'\xFF\xFB')
-                else:
-                    frame_count = file_data.count(b'\xFF\xFB')
-                
-                # Must have many frames for valid MP3 (at least 100 for real audio)
-                if frame_count < 100:
-                    return False
-                # Check file size reasonable for MP3
-                if len(file_data) < 32768:  # Real MP3s are > 32KB
-                    return False
-            
-            elif file_ext == 'wav':
-                # WAV STRICT validation
-                if not file_data.startswith(b'RIFF'):
-                    return False
-                if b'WAVE' not in file_data[8:12]:
-                    return False
-                # Must have fmt chunk
-                if b'fmt ' not in file_data[12:100]:
-                    return False
-                # Must have data chunk
-                if b'data' not in file_data[:1000]:
-                    return False
-                # Check RIFF size field
-                if len(file_data) < 44:  # Minimum WAV header size
-                    return False
-                # Validate RIFF chunk size
-                riff_size = int.from_bytes(file_data[4:8], 'little')
-                if riff_size < 36:  # Minimum valid size
-                    return False
-            
-            elif file_ext in ['mp4', 'mov']:
-                # MP4/MOV STRICT validation
-                if b'ftyp' not in file_data[:32]:
-                    return False
-                # Must have moov atom (movie metadata)
-                if b'moov' not in file_data:
-                    return False
-                # Must have mdat atom (media data) or skip (modern files)
-                has_mdat = b'mdat' in file_data[:50000]
-                has_skip = b'skip' in file_data[:50000]
-                if not has_mdat and not has_skip:
-                    return False
-                # Check for valid brand
-                valid_brands = [b'mp41', b'mp42', b'isom', b'qt  ', b'M4V ', b'M4A ']
-                has_valid_brand = any(brand in file_data[:32] for brand in valid_brands)
-                if not has_valid_brand:
-                    return False
-            
-            elif file_ext == 'avi':
-                # AVI STRICT validation
-                if not file_data.startswith(b'RIFF'):
-                    return False
-                if b'AVI ' not in file_data[8:12]:
-                    return False
-                # Must have hdrl (header list)
-                if b'hdrl' not in file_data[:1000]:
-                    return False
-                # Must have movi (movie data)
-                if b'movi' not in file_data[:10000]:
-                    return False
-                # Check RIFF size
-                if len(file_data) < 1024:  # Real AVIs are larger
-                    return False
-            
-            elif file_ext == 'sqlite':
-                # SQLite STRICT validation
-                if not file_data.startswith(b'SQLite format 3\x00'):
-                    return False
-                # Check page size (must be power of 2, between 512 and 65536)
-                page_size = int.from_bytes(file_data[16:18], 'big')
-                if page_size < 512 or page_size > 65536 or (page_size & (page_size - 1)) != 0:
-                    return False
-                # Must have proper database header
-                if len(file_data) < page_size:
-                    return False
-                # Check for valid schema
-                if b'sqlite_master' not in file_data[:page_size * 2]:
-                    return False
+            validator = self._validators.get(file_ext)
+            if validator is not None and not validator(file_data, file_ext, summary):
+                return False
             
             # If we got here, file passed STRICT validation
             return True
@@ -3307,6 +4544,217 @@ class PythonRecoveryService:
             logger.debug(f"Validation error for {file_ext}: {e}")
             return False
     
+    def _validate_jpeg(self, file_data: bytes, file_ext: str, summary: Optional[Dict]) -> bool:
+        """JPEG STRICT validation (see _validate_file)"""
+        # Cheapest checks first: most false candidates are rejected before any search
+        if not file_data.startswith(b'\xFF\xD8\xFF'):
+            return False
+        # Check file has reasonable structure (not just header+footer)
+        if len(file_data) < 2048:  # Real JPEGs are usually > 2KB
+            return False
+        # Check for JFIF or Exif marker (standard JPEG)
+        if file_data.find(b'JFIF', 0, 50) == -1 and file_data.find(b'Exif', 0, 50) == -1:
+            return False
+        # MUST have End of Image marker
+        if not file_data.endswith(b'\xFF\xD9') and file_data.find(b'\xFF\xD9', -10) == -1:
+            return False
+        # Must have multiple valid JPEG segments (SOF, DHT, DQT, SOS, etc.)
+        if not _count_at_least(file_data, b'\xFF', 10):  # Strict: need many markers
+            return False
+        return True
+    
+    def _validate_png(self, file_data: bytes, file_ext: str, summary: Optional[Dict]) -> bool:
+        """PNG STRICT validation (see _validate_file)"""
+        if not file_data.startswith(b'\x89PNG\r\n\x1a\n'):
+            return False
+        # MUST have IHDR chunk immediately after header
+        if b'IHDR' not in file_data[8:25]:
+            return False
+        # MUST end with IEND chunk
+        if not file_data.endswith(b'IEND\xae\x42\x60\x82'):
+            # Check if IEND is near the end
+            if file_data.find(b'IEND\xae\x42\x60\x82', -50) == -1:
+                return False
+        # Must have IDAT chunk (actual image data)
+        if b'IDAT' not in file_data:
+            return False
+        # Check for CRC after IHDR
+        if len(file_data) < 50:
+            return False
+        return True
+    
+    def _validate_pdf(self, file_data: bytes, file_ext: str, summary: Optional[Dict]) -> bool:
+        """PDF STRICT validation (see _validate_file)"""
+        if not file_data.startswith(b'%PDF-'):
+            return False
+        # MUST end with %%EOF
+        if file_data.find(b'%%EOF', -100) == -1:  # EOF should be near end
+            return False
+        # Check for proper object structure (objects start right after the header)
+        if not _count_at_least(file_data, b'obj', 2):  # Need multiple objects
+            return False
+        # Must have xref table or stream
+        if not _contains_near_ends(file_data, b'xref') and not _contains_near_ends(file_data, b'/XRef'):
+            return False
+        # Must have catalog
+        if not _contains_near_ends(file_data, b'/Catalog'):
+            return False
+        # Must have at least one page
+        if b'/Page' not in file_data:
+            return False
+        return True
+    
+    def _validate_office(self, file_data: bytes, file_ext: str, summary: Optional[Dict]) -> bool:
+        """Office (ZIP-based) STRICT validation (see _validate_file)"""
+        if not file_data.startswith(b'PK\x03\x04'):
+            return False
+        # MUST have proper ZIP end marker
+        if file_data.find(b'PK\x05\x06', -1000) == -1:  # End of central directory
+            return False
+        # Must have [Content_Types].xml
+        if file_data.find(b'[Content_Types].xml', 0, 5000) == -1:
+            return False
+        # Check for Office-specific content: the application folder and its main part
+        folder, main_part = _OFFICE_PARTS[file_ext]
+        if file_data.find(folder, 0, 5000) == -1:
+            return False
+        if file_data.find(main_part, 0, 10000) == -1:
+            return False
+        # MUST have central directory records (the only unbounded search, so last)
+        if not _contains_near_ends(file_data, b'PK\x01\x02'):
+            return False
+        return True
+    
+    def _validate_zip(self, file_data: bytes, file_ext: str, summary: Optional[Dict]) -> bool:
+        """ZIP STRICT validation (see _validate_file)"""
+        if not file_data.startswith(b'PK\x03\x04'):
+            return False
+        # Check for valid local file header
+        if len(file_data) < 100:
+            return False
+        # MUST have end of central directory
+        if file_data.find(b'PK\x05\x06', -1000) == -1:
+            return False
+        # Must have at least one central directory entry
+        if not _contains_near_ends(file_data, b'PK\x01\x02'):
+            return False
+        return True
+    
+    def _validate_rar(self, file_data: bytes, file_ext: str, summary: Optional[Dict]) -> bool:
+        """RAR STRICT validation (see _validate_file)"""
+        if not file_data.startswith(b'Rar!\x1a\x07'):
+            return False
+        # Minimum size for valid RAR
+        if len(file_data) < 100:
+            return False
+        # Check for RAR block headers
+        if b'\x74' not in file_data:  # RAR file header block
+            return False
+        return True
+    
+    def _validate_mp3(self, file_data: bytes, file_ext: str, summary: Optional[Dict]) -> bool:
+        """MP3 STRICT validation (see _validate_file)"""
+        # Check file size reasonable for MP3 before counting frames over the whole file
+        if len(file_data) < 32768:  # Real MP3s are > 32KB
+            return False
+        frame_count = 0
+        if file_data.startswith(b'ID3'):
+            # Has ID3 tag - skip it to find audio frames
+            if len(file_data) < 10:
+                return False
+            # ID3v2 tag size (syncsafe: drop the top bit of each byte)
+            raw_size, = _ID3_SIZE.unpack_from(file_data)
+            tag_size = ((raw_size & 0x7F) | (raw_size >> 1 & 0x3F80) |
+                        (raw_size >> 2 & 0x1FC000) | (raw_size >> 3 & 0xFE00000))
+            audio_start = 10 + tag_size
+            if audio_start >= len(file_data):
+                return False
+            # Check for valid MP3 frames after ID3 (counted in place, no tail copy).
+            # Frame headers cannot overlap, so the two counts add up exactly
+            frame_count = len(_MP3_FRAME_HEADER.findall(file_data, audio_start))
+            if summary is not None:
+                summary['mp3_frames'] = frame_count + len(_MP3_FRAME_HEADER.findall(file_data, 0, audio_start + 2))
+        else:
+            frame_count = len(_MP3_FRAME_HEADER.findall(file_data))
+            if summary is not None:
+                summary['mp3_frames'] = frame_count
+        
+        # Must have many frames for valid MP3 (at least 100 for real audio)
+        if frame_count < 100:
+            return False
+        return True
+    
+    def _validate_wav(self, file_data: bytes, file_ext: str, summary: Optional[Dict]) -> bool:
+        """WAV STRICT validation (see _validate_file)"""
+        # Check RIFF size field
+        if len(file_data) < 44:  # Minimum WAV header size
+            return False
+        riff, riff_size, form = _RIFF_HDR.unpack_from(file_data)
+        if riff != b'RIFF' or form != b'WAVE':
+            return False
+        # Validate RIFF chunk size
+        if riff_size < 36:  # Minimum valid size
+            return False
+        # Must have fmt chunk
+        if file_data.find(b'fmt ', 12, 100) == -1:
+            return False
+        # Must have data chunk
+        if file_data.find(b'data', 0, 1000) == -1:
+            return False
+        return True
+    
+    def _validate_mp4(self, file_data: bytes, file_ext: str, summary: Optional[Dict]) -> bool:
+        """MP4/MOV STRICT validation (see _validate_file)"""
+        if file_data.find(b'ftyp', 0, 32) == -1:
+            return False
+        # Check for valid brand: the major brand right after ftyp is a set lookup;
+        # otherwise one of the compatible brands that follow must be listed
+        if (bytes(file_data[8:12]) not in _MP4_BRANDS
+                and not any(file_data.find(brand, 0, 32) != -1 for brand in _MP4_BRANDS)):
+            return False
+        # Must have mdat atom (media data) or skip (modern files)
+        if file_data.find(b'mdat', 0, 50000) == -1 and file_data.find(b'skip', 0, 50000) == -1:
+            return False
+        # Must have moov atom (movie metadata) - may need the whole file, so last
+        if not _contains_near_ends(file_data, b'moov'):
+            return False
+        return True
+    
+    def _validate_avi(self, file_data: bytes, file_ext: str, summary: Optional[Dict]) -> bool:
+        """AVI STRICT validation (see _validate_file)"""
+        # Check RIFF size
+        if len(file_data) < 1024:  # Real AVIs are larger
+            return False
+        riff, _, form = _RIFF_HDR.unpack_from(file_data)
+        if riff != b'RIFF' or form != b'AVI ':
+            return False
+        # Must have hdrl (header list)
+        if file_data.find(b'hdrl', 0, 1000) == -1:
+            return False
+        # Must have movi (movie data)
+        if file_data.find(b'movi', 0, 10000) == -1:
+            return False
+        return True
+    
+    def _validate_sqlite(self, file_data: bytes, file_ext: str, summary: Optional[Dict]) -> bool:
+        """SQLite STRICT validation (see _validate_file)"""
+        if not file_data.startswith(b'SQLite format 3\x00'):
+            return False
+        # Check page size (must be power of 2, between 512 and 65536;
+        # 65536 does not fit the 16-bit field and is stored as 1)
+        page_size = (file_data[16] << 8) | file_data[17]
+        if page_size == 1:
+            page_size = 65536
+        elif page_size < 512 or (page_size & (page_size - 1)) != 0:
+            return False
+        # Must have proper database header
+        if len(file_data) < page_size:
+            return False
+        # Check for valid schema (searched in place - the window can be 128 KiB)
+        if file_data.find(b'sqlite_master', 0, page_size * 2) == -1:
+            return False
+        return True
+    
     def _get_file_size_from_header(self, header_data: bytes, file_type: str) -> Optional[int]:
         """
         Try to determine file size from header data
@@ -3367,14 +4815,14 @@ class PythonRecoveryService:
             physical_drive = self._get_physical_drive(drive_path)
             drive_size = self._get_drive_size(drive_path)
             
-            # Open drive
-            drive_handle = self._open_drive(physical_drive)
-            
             # Cluster scan parameters
             cluster_size = 4096  # 4KB clusters (typical)
             total_clusters = drive_size // cluster_size
             sample_rate = max(1, total_clusters // 1000)  # Sample 1000 clusters max
             
+            # Open drive (sparse samples: readahead would only fetch data that is skipped)
+            drive_handle = self._open_drive(physical_drive, random_access=sample_rate > 1)
+            
             logger.info(f"Drive size: {drive_size / (1024**3):.2f} GB")
             logger.info(f"Total clusters: {total_clusters:,}")
             logger.info(f"Sampling every {sample_rate} cluster(s)")
@@ -3397,7 +4845,8 @@ class PythonRecoveryService:
                 'sampled_clusters': 0,
                 'empty_clusters': 0,
                 'used_clusters': 0,
-                'start_time': datetime.now().isoformat()
+                'start_time': datetime.now().isoformat(),
+                'start_time_monotonic': time.monotonic()  # For elapsed time; start_time is for display
             }
             
             # Sample clusters across the drive
@@ -3408,6 +4857,27 @@ class PythonRecoveryService:
             sampled_count = 0
             expected_samples = total_clusters // sample_rate
             loop_iterations = 0
+            zero_cluster = bytes(cluster_size)  # Empty clusters compare equal (memcmp, stops at the first data byte)
+            
+            # Positioned reads: one syscall per sample instead of seek + read. When every
+            # cluster is sampled, 64 adjacent clusters are fetched per read and sliced.
+            drive_fd = self._get_drive_fd(drive_handle) if hasattr(os, 'pread') else None
+            batch_size = cluster_size * 64 if sample_rate == 1 else cluster_size
+            read_stride = max(batch_size, sample_rate * cluster_size)  # Distance between consecutive reads
+            drive_end = total_clusters * cluster_size
+            batch = b''
+            batch_start = 0
+            
+            def read_batch(batch_offset: int) -> bytes:
+                if drive_fd is not None:
+                    return os.pread(drive_fd, batch_size, batch_offset)
+                drive_handle.seek(batch_offset)
+                return drive_handle.read(batch_size)
+            
+            # The next read runs on the I/O pool while the current batch is analysed and
+            # progress is sent, so slow drives are not idle between samples. Only one
+            # read is in flight at a time (the seek + read fallback shares the handle).
+            pending_read = None  # (offset, future) of the prefetched read
             
             for i in range(0, total_clusters, sample_rate):
                 loop_iterations += 1
@@ -3424,8 +4894,17 @@ class PythonRecoveryService:
                 try:
                     # Read cluster
                     offset = i * cluster_size
-                    drive_handle.seek(offset)
-                    cluster_data = drive_handle.read(cluster_size)
+                    if not batch_start <= offset < batch_start + len(batch):
+                        if pending_read is None or pending_read[0] != offset:
+                            pending_read = (offset, _IO_POOL.submit(read_batch, offset))
+                        batch_start, future = pending_read
+                        pending_read = None
+                        batch = b''
+                        batch = await asyncio.wrap_future(future)
+                        next_offset = offset + read_stride
+                        if next_offset < drive_end:
+                            pending_read = (next_offset, _IO_POOL.submit(read_batch, next_offset))
+                    cluster_data = batch[offset - batch_start:offset - batch_start + cluster_size]
                     
                     if loop_iterations <= 3:
                         logger.info(f"  Read {len(cluster_data) if cluster_data else 0} bytes from offset {offset}")
@@ -3435,8 +4914,14 @@ class PythonRecoveryService:
                             logger.warning(f"No data read at cluster {i}, offset {offset} - iteration {loop_iterations}")
                         continue
                     
-                    # Analyze cluster
-                    is_empty = all(b == 0 for b in cluster_data)
+                    # Analyze cluster: probe the first, middle and last byte before the
+                    # full comparison, so most clusters with data never get compared
+                    if cluster_data[0] or cluster_data[-1] or cluster_data[len(cluster_data) // 2]:
+                        is_empty = False
+                    elif len(cluster_data) == cluster_size:
+                        is_empty = cluster_data == zero_cluster
+                    else:
+                        is_empty = cluster_data.count(0) == len(cluster_data)
                     
                     # Create hex preview (first 256 bytes)
                     preview_size = min(256, len(cluster_data))
@@ -3447,7 +4932,7 @@ class PythonRecoveryService:
                         'offset': offset,
                         'is_empty': is_empty,
                         'hex_preview': hex_preview,
-                        'ascii_preview': ''.join(chr(b) if 32 <= b < 127 else '.' for b in cluster_data[:preview_size])
+                        'ascii_preview': cluster_data[:preview_size].translate(_ASCII_PREVIEW).decode('ascii')
                     }
                     
                     cluster_map.append(cluster_info)
@@ -3462,7 +4947,7 @@ class PythonRecoveryService:
                     # Update progress more frequently for better UX
                     if sampled_count % 5 == 0 or sampled_count >= expected_samples:
                         progress = min(95, 5 + (sampled_count / expected_samples) * 90)
-                        elapsed = (datetime.now() - datetime.fromisoformat(stats['start_time'])).total_seconds()
+                        elapsed = _elapsed_since_start(stats)
                         expected_time = self._calculate_expected_time(elapsed, progress)
                         if progress_callback:
                             await progress_callback({
@@ -3482,11 +4967,15 @@ class PythonRecoveryService:
             
             logger.info(f"Cluster sampling loop completed. Loop iterations: {loop_iterations}, Total sampled: {sampled_count}")
             
+            # A prefetch left over after cancellation must finish before the handle closes
+            if pending_read is not None:
+                concurrent.futures.wait([pending_read[1]])
             drive_handle.close()
             
             end_time = datetime.now()
             stats['end_time'] = end_time.isoformat()
-            stats['duration'] = (end_time - datetime.fromisoformat(stats['start_time'])).total_seconds()
+            stats['duration'] = _elapsed_since_start(stats)
+            stats.pop('start_time_monotonic', None)  # Process-local clock - not meaningful in saved/returned stats
             
             # Final progress before saving
             if progress_callback:
@@ -3498,13 +4987,19 @@ class PythonRecoveryService:
                     'expected_time': 'Almost done...'
                 })
             
-            # Save cluster map to JSON
+            # Save cluster map to compact JSON - it is only read back by the report
+            # endpoint, and indentation would triple its size (orjson emits UTF-8 bytes directly)
             cluster_map_file = os.path.join(output_dir, 'cluster_map.json')
-            with open(cluster_map_file, 'w') as f:
-                json.dump({
-                    'statistics': stats,
-                    'cluster_map': cluster_map
-                }, f, indent=2)
+            cluster_report = {
+                'statistics': stats,
+                'cluster_map': cluster_map
+            }
+            if ORJSON_AVAILABLE:
+                with open(cluster_map_file, 'wb') as f:
+                    f.write(orjson.dumps(cluster_report))
+            else:
+                with open(cluster_map_file, 'w') as f:
+                    json.dump(cluster_report, f, separators=(',', ':'))
             
             logger.info(f"✅ Cluster scan complete: {stats['sampled_clusters']} clusters sampled")
             logger.info(f"   Empty: {stats['empty_clusters']}, Used: {stats['used_clusters']}")
@@ -3565,7 +5060,7 @@ class PythonRecoveryService:
             # Check if drive is removable - skip SMART for removable drives
             is_removable = False
             try:
-                if platform.system() == 'Windows' and ':' in drive_path:
+                if IS_WINDOWS and ':' in drive_path:
                     import psutil
                     drive_letter = drive_path.split(':')[0].upper() + ':'
                     
@@ -3589,7 +5084,7 @@ class PythonRecoveryService:
                     'status': 'skip',
                     'details': 'SMART data not available for removable drives'
                 })
-            elif platform.system() == 'Windows':
+            elif IS_WINDOWS:
                 try:
                     logger.info("Reading SMART data...")
                     smart_data = await self._read_smart_data_wmi(drive_path)
@@ -3682,83 +5177,36 @@ class PythonRecoveryService:
             
             # Deduct based on SMART data (only if available and not null/error)
             if health_data['smart_data'] and isinstance(health_data['smart_data'], dict) and 'error' not in health_data['smart_data']:
-                # Check for Reallocated Sectors (SATA/ATA drives) - value is now a string
-                if 'Reallocated_Sector_Count' in health_data['smart_data']:
-                    try:
-                        reallocated_str = health_data['smart_data'].get('Reallocated_Sector_Count', '0')
-                        # Remove commas and convert to int
-                        reallocated = int(reallocated_str.replace(',', ''))
-                        if reallocated > 0:
-                            health_score -= min(20, reallocated)
-                            health_data['recommendations'].append(f"⚠️ {reallocated:,} reallocated sectors")
-                            checks.append({
-                                'name': 'Reallocated Sectors',
-                                'status': 'warning',
-                                'details': f"{reallocated:,} sectors have been reallocated"
-                            })
-                    except (ValueError, AttributeError):
-                        pass  # Skip if value can't be parsed
-                
-                # Check for Pending Sectors (SATA/ATA drives) - value is now a string
-                if 'Current_Pending_Sector' in health_data['smart_data']:
-                    try:
-                        pending_str = health_data['smart_data'].get('Current_Pending_Sector', '0')
-                        # Remove commas and convert to int
-                        pending = int(pending_str.replace(',', ''))
-                        if pending > 0:
-                            health_score -= min(15, pending * 2)
-                            health_data['recommendations'].append(f"⚠️ {pending:,} pending sectors")
-                            checks.append({
-                                'name': 'Pending Sectors',
-                                'status': 'fail',
-                                'details': f"{pending:,} sectors are pending reallocation"
-                            })
-                    except (ValueError, AttributeError):
-                        pass  # Skip if value can't be parsed
+                # Counter attributes (reallocated/pending sectors on SATA, media errors on NVMe)
+                for attr, cap, weight, rec_fmt, check_name, status, details_fmt in _SMART_COUNTER_RULES:
+                    count = _parse_smart_int(health_data['smart_data'].get(attr, '0'))
+                    if count and count > 0:
+                        health_score -= min(cap, count * weight)
+                        health_data['recommendations'].append(rec_fmt.format(count))
+                        checks.append({
+                            'name': check_name,
+                            'status': status,
+                            'details': details_fmt.format(count)
+                        })
                 
                 # Check temperature - value is now a string like "40°C"
                 if 'Temperature_Celsius' in health_data['smart_data']:
-                    try:
-                        temp_value = health_data['smart_data'].get('Temperature_Celsius', '')
-                        # Extract numeric temperature from string like "40°C"
-                        if isinstance(temp_value, str) and '°C' in temp_value:
-                            temp = int(temp_value.replace('°C', '').strip())
-                        elif isinstance(temp_value, str):
-                            temp = int(temp_value)
-                        else:
-                            temp = 0
-                        
-                        if temp > 60:
-                            health_score -= 5
-                            health_data['recommendations'].append(f"⚠️ High temperature: {temp}°C")
-                            checks.append({
-                                'name': 'Drive Temperature',
-                                'status': 'warning',
-                                'details': f"Temperature is {temp}°C (recommended < 60°C)"
-                            })
-                        elif temp > 0:
-                            checks.append({
-                                'name': 'Drive Temperature',
-                                'status': 'pass',
-                                'details': f"Temperature is normal: {temp}°C"
-                            })
-                    except (ValueError, AttributeError):
-                        pass  # Skip if temperature can't be parsed
-                
-                # Check for Media Errors (NVMe drives) - value is now a string
-                if 'Media_Errors' in health_data['smart_data']:
-                    try:
-                        media_errors = int(health_data['smart_data'].get('Media_Errors', '0'))
-                        if media_errors > 0:
-                            health_score -= min(30, media_errors * 10)
-                            health_data['recommendations'].append(f"⚠️ {media_errors} media errors detected")
-                            checks.append({
-                                'name': 'Media Errors',
-                                'status': 'fail',
-                                'details': f"{media_errors} media errors detected on NVMe drive"
-                            })
-                    except (ValueError, AttributeError):
-                        pass
+                    # Unparseable temperatures count as 0 and are skipped
+                    temp = _parse_smart_int(health_data['smart_data'].get('Temperature_Celsius', '')) or 0
+                    if temp > 60:
+                        health_score -= 5
+                        health_data['recommendations'].append(f"⚠️ High temperature: {temp}°C")
+                        checks.append({
+                            'name': 'Drive Temperature',
+                            'status': 'warning',
+                            'details': f"Temperature is {temp}°C (recommended < 60°C)"
+                        })
+                    elif temp > 0:
+                        checks.append({
+                            'name': 'Drive Temperature',
+                            'status': 'pass',
+                            'details': f"Temperature is normal: {temp}°C"
+                        })
                 
                 # Check for Critical Warning (NVMe drives)
                 if 'Critical_Warning' in health_data['smart_data']:
@@ -3789,10 +5237,14 @@ class PythonRecoveryService:
                 health_data['status'] = 'Poor'
                 health_data['recommendations'].insert(0, "❌ Drive may fail soon - backup immediately!")
             
-            # Save health report
+            # Save health report (orjson emits UTF-8 bytes directly)
             health_report_file = os.path.join(output_dir, 'health_report.json')
-            with open(health_report_file, 'w') as f:
-                json.dump(health_data, f, indent=2)
+            if ORJSON_AVAILABLE:
+                with open(health_report_file, 'wb') as f:
+                    f.write(orjson.dumps(health_data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(health_report_file, 'w') as f:
+                    json.dump(health_data, f, indent=2)
             
             logger.info(f"✅ Health scan complete")
             logger.info(f"   Health Score: {health_data['health_score']}/100 ({health_data['status']})")
@@ -3822,17 +5274,33 @@ class PythonRecoveryService:
         try:
             logger.info("Attempting to read SMART data...")
             
-            # Method 1: Try smartmontools (smartctl.exe) - most detailed data
-            smart_result = await self._try_smartctl(drive_path)
-            if smart_result and 'error' not in smart_result:
-                logger.info("✅ Successfully read SMART data using smartctl")
-                return smart_result
-            
-            # Method 2: Try pySMART library (fallback)
-            smart_result = await self._try_pysmart(drive_path)
-            if smart_result and 'error' not in smart_result:
-                logger.info("✅ Successfully read SMART data using pySMART")
-                return smart_result
+            # Method 1: Try smartmontools (smartctl.exe) - most detailed data.
+            # pySMART (which runs its own smartctl probes) is only started if smartctl
+            # fails or is still busy after a short grace window
+            smartctl_task = asyncio.create_task(self._try_smartctl(drive_path))
+            pysmart_task = None
+            try:
+                done, _ = await asyncio.wait({smartctl_task}, timeout=_PYSMART_GRACE)
+                if not done:
+                    pysmart_task = asyncio.create_task(self._try_pysmart(drive_path))
+                
+                smart_result = await smartctl_task
+                if smart_result and 'error' not in smart_result:
+                    logger.info("✅ Successfully read SMART data using smartctl")
+                    return smart_result
+                
+                # Method 2: Try pySMART library (fallback)
+                if pysmart_task is None:
+                    pysmart_task = asyncio.create_task(self._try_pysmart(drive_path))
+                smart_result = await pysmart_task
+                if smart_result and 'error' not in smart_result:
+                    logger.info("✅ Successfully read SMART data using pySMART")
+                    return smart_result
+            finally:
+                if pysmart_task is not None:
+                    # Only stops waiting - a probe already running in a worker thread
+                    # finishes in the background and its result is dropped
+                    pysmart_task.cancel()
             
             # Method 3: Try using wmi module
             try:
@@ -3863,78 +5331,24 @@ class PythonRecoveryService:
                     smart_instances = list(c.MSStorageDriver_ATAPISmartData())
                     logger.info(f"Found {len(smart_instances)} SMART data instances")
                     
+                    # WMI properties are fetched from the provider on access - only
+                    # read InstanceName when it is actually going to be logged
+                    debug_enabled = logger.isEnabledFor(logging.DEBUG)
                     for idx, disk in enumerate(smart_instances):
                         try:
                             # Try to match the correct drive
-                            instance_name = getattr(disk, 'InstanceName', '')
-                            logger.debug(f"Instance {idx}: {instance_name}")
+                            if debug_enabled:
+                                logger.debug(f"Instance {idx}: {getattr(disk, 'InstanceName', '')}")
                             
                             vendor_specific = disk.VendorSpecific
                             if not vendor_specific or len(vendor_specific) < 362:
-                                logger.debug(f"Instance {idx}: No or insufficient vendor specific data")
+                                if debug_enabled:
+                                    logger.debug(f"Instance {idx}: No or insufficient vendor specific data")
                                 continue
                             
                             logger.info(f"Parsing SMART attributes from instance {idx}...")
                             
-                            # SMART attributes start at offset 2 in vendor specific data
-                            # Each attribute is 12 bytes
-                            attributes = {}
-                            
-                            # Parse SMART attributes
-                            for i in range(2, min(len(vendor_specific), 362), 12):
-                                if i + 11 < len(vendor_specific):
-                                    attr_id = vendor_specific[i]
-                                    if attr_id == 0 or attr_id == 0xFF:
-                                        continue
-                                    
-                                    try:
-                                        # Parse attribute data
-                                        flags = (vendor_specific[i+1] << 8) | vendor_specific[i+2]
-                                        current = vendor_specific[i+3]
-                                        worst = vendor_specific[i+4]
-                                        
-                                        # Raw value is 6 bytes little-endian
-                                        raw_bytes = bytes(vendor_specific[i+5:i+11])
-                                        raw_value = struct.unpack('<Q', raw_bytes + b'\x00\x00')[0]
-                                        
-                                        # Map common SMART attribute IDs
-                                        attr_names = {
-                                            1: 'Read_Error_Rate',
-                                            5: 'Reallocated_Sector_Count',
-                                            9: 'Power_On_Hours',
-                                            12: 'Power_Cycle_Count',
-                                            187: 'Reported_Uncorrectable_Errors',
-                                            188: 'Command_Timeout',
-                                            194: 'Temperature_Celsius',
-                                            196: 'Reallocation_Event_Count',
-                                            197: 'Current_Pending_Sector',
-                                            198: 'Offline_Uncorrectable',
-                                            199: 'UDMA_CRC_Error_Count',
-                                            200: 'Write_Error_Rate'
-                                        }
-                                        
-                                        if attr_id in attr_names:
-                                            attr_name = attr_names[attr_id]
-                                            
-                                            # Special handling for temperature
-                                            display_value = raw_value
-                                            if attr_id == 194:  # Temperature
-                                                # Temperature is usually in the lower byte
-                                                display_value = raw_value & 0xFF
-                                                if display_value > 100:  # Sanity check
-                                                    display_value = raw_value & 0xFFFF
-                                            
-                                            attributes[attr_name] = {
-                                                'id': attr_id,
-                                                'current': current,
-                                                'worst': worst,
-                                                'value': display_value,
-                                                'raw': raw_value,
-                                                'flags': flags
-                                            }
-                                    except Exception as attr_parse_error:
-                                        logger.debug(f"Error parsing attribute {attr_id}: {attr_parse_error}")
-                                        continue
+                            attributes = _parse_smart_vendor_specific(vendor_specific)
                             
                             if len(attributes) > 0:
                                 smart_data = attributes
@@ -4040,11 +5454,15 @@ class PythonRecoveryService:
                 # Try to get physical drive from volume
                 drive_letter = drive_path.split(':')[0].upper()
                 # pySMART uses /dev/sdX on Linux, but on Windows we need drive number
-                # For now, try 0-3 (most common range)
-                for i in range(4):
+                # For now, try 0-3 (most common range) - each probe runs smartctl, so all
+                # four run at once and the lowest-numbered drive that answers wins
+                devices = await asyncio.gather(
+                    *(asyncio.to_thread(Device, f'/dev/pd{i}') for i in range(4)),  # Windows physical drives
+                    return_exceptions=True
+                )
+                for i, device in enumerate(devices):
                     try:
-                        device = Device(f'/dev/pd{i}')  # Windows physical drive
-                        if device and device.assessment:
+                        if device and not isinstance(device, BaseException) and device.assessment:
                             drive_num = i
                             break
                     except:
@@ -4056,7 +5474,7 @@ class PythonRecoveryService:
             logger.info(f"Trying pySMART for drive number {drive_num}")
             
             # Try to read device
-            device = Device(f'/dev/pd{drive_num}')
+            device = await asyncio.to_thread(Device, f'/dev/pd{drive_num}')
             
             if not device or not device.attributes:
                 return {'error': 'pySMART: No device data available'}
@@ -4096,101 +5514,150 @@ class PythonRecoveryService:
             logger.debug(f"pySMART failed: {e}")
             return {'error': f'pySMART error: {str(e)}'}
     
+    def _find_smartctl(self) -> Optional[str]:
+        """
+        Path of the smartctl executable, resolved once per service
+        
+        A miss is only remembered for _SMARTCTL_SCAN_TTL seconds, so installing
+        smartmontools while the app runs is picked up by the next health scan.
+        
+        Returns:
+            Executable path, or None if smartctl is not installed
+        """
+        cached = self._smartctl_path
+        if cached is not None and (cached[1] is not None or time.monotonic() - cached[0] < _SMARTCTL_SCAN_TTL):
+            return cached[1]
+        
+        import shutil
+        smartctl_path = shutil.which('smartctl')
+        if not smartctl_path:
+            # Try common installation paths
+            common_paths = [
+                r'C:\Program Files\smartmontools\bin\smartctl.exe',
+                r'C:\Program Files (x86)\smartmontools\bin\smartctl.exe',
+                r'C:\smartmontools\bin\smartctl.exe',
+            ]
+            for path in common_paths:
+                if os.path.exists(path):
+                    smartctl_path = path
+                    break
+        
+        self._smartctl_path = (time.monotonic(), smartctl_path or None)
+        return smartctl_path or None
+    
+    def _smartctl_scan(self, smartctl_path: str) -> Optional[List[str]]:
+        """
+        Output lines of `smartctl --scan`, reused for _SMARTCTL_SCAN_TTL seconds
+        
+        Args:
+            smartctl_path: smartctl executable to run
+            
+        Returns:
+            List of output lines, or None if the scan failed (failures are not cached)
+        """
+        cached = self._smartctl_scan_cache
+        if cached is not None and cached[1] == smartctl_path and time.monotonic() - cached[0] < _SMARTCTL_SCAN_TTL:
+            return cached[2]
+        
+        scan_result = subprocess.run(
+            [smartctl_path, '--scan'],
+            capture_output=True,
+            timeout=10,
+            creationflags=_SUBPROC_FLAGS
+        )
+        if scan_result.returncode != 0:
+            return None
+        
+        # Raw bytes decoded in one call (splitlines also drops the \r of Windows line ends)
+        lines = scan_result.stdout.decode('utf-8', errors='replace').splitlines()
+        self._smartctl_scan_cache = (time.monotonic(), smartctl_path, lines)
+        return lines
+    
+    async def _resolve_smartctl_device(self, smartctl_path: str, drive_path: str) -> Tuple[str, Optional[str]]:
+        """
+        Map a drive path to the smartctl device and its -d type using `smartctl --scan`
+        
+        Args:
+            smartctl_path: smartctl executable
+            drive_path: Drive letter (e.g. 'E:') or device path
+            
+        Returns:
+            Tuple of (device path, device type or None to let smartctl detect it)
+        """
+        # Map drive letter to device for smartctl
+        device_path = None
+        
+        if ':' in drive_path:
+            # Drive letter format (e.g., "E:")
+            drive_letter = drive_path.split(':')[0].upper()
+            
+            # First, scan for all drives and find which one matches
+            lines = await asyncio.to_thread(self._smartctl_scan, smartctl_path)
+            
+            if lines is not None:
+                # Parse scan output to find drives
+                logger.info(f"Scanning for drive {drive_letter}:")
+                logger.info(f"Available devices: {lines}")
+                
+                # Try each device found
+                for line in lines:
+                    if line.strip() and not line.startswith('#'):
+                        parts = line.split()
+                        if len(parts) >= 1:
+                            dev = parts[0]  # e.g., "/dev/sda"
+                            # For now, map drive letters to devices sequentially
+                            # E: is often the second partition/drive
+                            if 'sda' in dev or 'pd0' in dev:
+                                if drive_letter == 'C':
+                                    device_path = dev
+                                    break
+                            elif 'sdb' in dev or 'pd1' in dev:
+                                if drive_letter == 'E':
+                                    device_path = dev
+                                    break
+            
+            # Fallback: try common mappings
+            if not device_path:
+                drive_mappings = {'C': '/dev/sda', 'D': '/dev/sda', 'E': '/dev/sdb'}
+                device_path = drive_mappings.get(drive_letter, '/dev/sda')
+            
+            logger.info(f"Mapped drive {drive_letter}: to {device_path}")
+        else:
+            # Use path as-is
+            device_path = drive_path
+        
+        # Detect device type from scan (same device list as the drive letter mapping)
+        device_type = None
+        scan_lines = await asyncio.to_thread(self._smartctl_scan, smartctl_path)
+        
+        if scan_lines is not None:
+            for line in scan_lines:
+                if device_path in line:
+                    if 'nvme' in line:
+                        device_type = 'nvme'
+                    elif 'scsi' in line:
+                        device_type = 'scsi'
+                    elif 'ata' in line:
+                        device_type = 'ata'
+                    break
+        
+        return device_path, device_type
+    
     async def _try_smartctl(self, drive_path: str) -> dict:
         """Try reading SMART data using smartmontools (smartctl.exe)"""
         try:
-            import subprocess
             import json
-            import shutil
             
             # Check if smartctl is available
-            smartctl_path = shutil.which('smartctl')
-            if not smartctl_path:
-                # Try common installation paths
-                common_paths = [
-                    r'C:\Program Files\smartmontools\bin\smartctl.exe',
-                    r'C:\Program Files (x86)\smartmontools\bin\smartctl.exe',
-                    r'C:\smartmontools\bin\smartctl.exe',
-                ]
-                for path in common_paths:
-                    if os.path.exists(path):
-                        smartctl_path = path
-                        break
-            
+            smartctl_path = self._find_smartctl()
             if not smartctl_path:
                 return {'error': 'smartctl not found'}
             
-            # Map drive letter to device for smartctl
-            device_path = None
-            
-            if ':' in drive_path:
-                # Drive letter format (e.g., "E:")
-                drive_letter = drive_path.split(':')[0].upper()
-                
-                # First, scan for all drives and find which one matches
-                scan_cmd = [smartctl_path, '--scan']
-                scan_result = subprocess.run(
-                    scan_cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
-                    creationflags=subprocess.CREATE_NO_WINDOW if platform.system() == 'Windows' else 0
-                )
-                
-                if scan_result.returncode == 0:
-                    # Parse scan output to find drives
-                    lines = scan_result.stdout.split('\n')
-                    logger.info(f"Scanning for drive {drive_letter}:")
-                    logger.info(f"Available devices: {lines}")
-                    
-                    # Try each device found
-                    for line in lines:
-                        if line.strip() and not line.startswith('#'):
-                            parts = line.split()
-                            if len(parts) >= 1:
-                                dev = parts[0]  # e.g., "/dev/sda"
-                                # For now, map drive letters to devices sequentially
-                                # E: is often the second partition/drive
-                                if 'sda' in dev or 'pd0' in dev:
-                                    if drive_letter == 'C':
-                                        device_path = dev
-                                        break
-                                elif 'sdb' in dev or 'pd1' in dev:
-                                    if drive_letter == 'E':
-                                        device_path = dev
-                                        break
-                
-                # Fallback: try common mappings
-                if not device_path:
-                    drive_mappings = {'C': '/dev/sda', 'D': '/dev/sda', 'E': '/dev/sdb'}
-                    device_path = drive_mappings.get(drive_letter, '/dev/sda')
-                
-                logger.info(f"Mapped drive {drive_letter}: to {device_path}")
-            else:
-                # Use path as-is
-                device_path = drive_path
-            
-            # Detect device type from scan
-            device_type = None
-            scan_cmd = [smartctl_path, '--scan']
-            scan_result = subprocess.run(
-                scan_cmd,
-                capture_output=True,
-                text=True,
-                timeout=10,
-                creationflags=subprocess.CREATE_NO_WINDOW if platform.system() == 'Windows' else 0
-            )
-            
-            if scan_result.returncode == 0:
-                for line in scan_result.stdout.split('\n'):
-                    if device_path in line:
-                        if 'nvme' in line:
-                            device_type = 'nvme'
-                        elif 'scsi' in line:
-                            device_type = 'scsi'
-                        elif 'ata' in line:
-                            device_type = 'ata'
-                        break
+            # Device and type for this drive - remembered once smartctl has accepted them
+            device = self._smartctl_devices.get(drive_path)
+            if device is None:
+                device = await self._resolve_smartctl_device(smartctl_path, drive_path)
+            device_path, device_type = device
             
             # Build command
             cmd = [smartctl_path, '-a', device_path]
@@ -4200,26 +5667,29 @@ class PythonRecoveryService:
             
             logger.info(f"Running smartctl command: {' '.join(cmd)}")
             
-            result = subprocess.run(
+            result = await asyncio.to_thread(
+                subprocess.run,
                 cmd,
                 capture_output=True,
-                text=True,
                 timeout=30,
-                creationflags=subprocess.CREATE_NO_WINDOW if platform.system() == 'Windows' else 0
+                creationflags=_SUBPROC_FLAGS
             )
             
             if result.returncode not in [0, 4]:  # 0=success, 4=SMART threshold exceeded (still valid)
+                self._smartctl_devices.pop(drive_path, None)  # Re-detect next time (drive may have moved)
                 logger.debug(f"smartctl failed with code {result.returncode}")
-                logger.debug(f"Output: {result.stdout}")
-                logger.debug(f"Error: {result.stderr}")
+                logger.debug(f"Output: {result.stdout.decode('utf-8', errors='replace')}")
+                logger.debug(f"Error: {result.stderr.decode('utf-8', errors='replace')}")
                 return {'error': f'smartctl returned code {result.returncode}'}
+            self._smartctl_devices[drive_path] = device
             
-            # Parse JSON output
+            # Parse JSON output straight from the bytes (orjson's decode error subclasses
+            # json.JSONDecodeError)
             try:
-                data = json.loads(result.stdout)
-            except json.JSONDecodeError:
+                data = orjson.loads(result.stdout) if ORJSON_AVAILABLE else json.loads(result.stdout)
+            except (json.JSONDecodeError, UnicodeDecodeError):
                 # Try non-JSON parsing
-                return await self._parse_smartctl_text(result.stdout)
+                return await self._parse_smartctl_text(result.stdout.decode('utf-8', errors='replace'))
             
             # Extract SMART data
             smart_data = {}
@@ -4261,14 +5731,10 @@ class PythonRecoveryService:
                     smart_data['Percentage_Used'] = f"{nvme_health['percentage_used']}%"
                 
                 if 'data_units_read' in nvme_health:
-                    # Data units are in 512KB blocks, convert to TB
-                    data_read_tb = (nvme_health['data_units_read'] * 512 * 1000) / (1024 ** 4)
-                    smart_data['Data_Units_Read'] = f"{data_read_tb:.2f} TB"
+                    smart_data['Data_Units_Read'] = f"{nvme_health['data_units_read'] * _NVME_UNIT_TB:.2f} TB"
                 
                 if 'data_units_written' in nvme_health:
-                    # Data units are in 512KB blocks, convert to TB
-                    data_written_tb = (nvme_health['data_units_written'] * 512 * 1000) / (1024 ** 4)
-                    smart_data['Data_Units_Written'] = f"{data_written_tb:.2f} TB"
+                    smart_data['Data_Units_Written'] = f"{nvme_health['data_units_written'] * _NVME_UNIT_TB:.2f} TB"
                 
                 if 'host_reads' in nvme_health:
                     smart_data['Host_Read_Commands'] = f"{nvme_health['host_reads']:,}"
@@ -4303,7 +5769,7 @@ class PythonRecoveryService:
             # ATA SMART attributes (for SATA drives)
             if 'ata_smart_attributes' in data and 'table' in data['ata_smart_attributes']:
                 for attr in data['ata_smart_attributes']['table']:
-                    attr_name = attr.get('name', f"Attr_{attr.get('id', 'Unknown')}").replace(' ', '_').replace('-', '_')
+                    attr_name = attr.get('name', f"Attr_{attr.get('id', 'Unknown')}").translate(_NAME_TRANS)
                     # Store human-readable value
                     raw_value = attr.get('raw', {}).get('value', 0)
                     smart_data[attr_name] = f"{raw_value:,}" if isinstance(raw_value, int) else str(raw_value)
@@ -4376,7 +5842,7 @@ class PythonRecoveryService:
                     if len(parts) >= 10:
                         try:
                             attr_id = int(parts[0])
-                            attr_name = parts[1].replace('-', '_')
+                            attr_name = parts[1].translate(_NAME_TRANS)
                             current = int(parts[3])
                             worst = int(parts[4])
                             raw = int(parts[9])
@@ -4411,7 +5877,7 @@ class PythonRecoveryService:
             
             # Get actual usable drive size
             try:
-                if platform.system() == 'Windows' and ':' in drive_path:
+                if IS_WINDOWS and ':' in drive_path:
                     import psutil
                     drive_letter = drive_path.split(':')[0].upper() + ':'
                     
@@ -4434,9 +5900,9 @@ class PythonRecoveryService:
                     'error': 'Could not determine drive size'
                 }
             
-            # Open drive for reading
+            # Open drive for reading (samples are spread out - no readahead)
             try:
-                drive_handle = self._open_drive(physical_drive)
+                drive_handle = self._open_drive(physical_drive, random_access=True)
             except Exception as e:
                 logger.error(f"Could not open drive: {e}")
                 return {
@@ -4465,6 +5931,37 @@ class PythonRecoveryService:
             
             logger.info(f"Total sectors: {total_sectors:,}, Testing every {test_interval} sector (~{sectors_to_test} samples)")
             
+            # With positional reads (one syscall per sample, no seek) the samples are
+            # independent, so up to _SURFACE_QUEUE_DEPTH of them are in flight on worker
+            # threads and the device sees a queue instead of one round trip per sample
+            drive_fd = self._get_drive_fd(drive_handle) if hasattr(os, 'pread') else None
+            
+            # Optional O_DIRECT descriptor: samples bypass the page cache instead of
+            # filling it with blocks nobody reads again (POSIX only)
+            direct_fd = None
+            if options.get('direct_io') and drive_fd is not None and hasattr(os, 'O_DIRECT'):
+                try:
+                    direct_fd = os.open(physical_drive, os.O_RDONLY | os.O_DIRECT)
+                    logger.info("Surface scan reading with O_DIRECT (page cache bypassed)")
+                except OSError as e:
+                    logger.warning(f"⚠️ O_DIRECT not supported for {physical_drive} ({e}) - using cached reads")
+            
+            if direct_fd is not None:
+                def read_at(length: int, at: int) -> bytes:
+                    return _pread_direct(direct_fd, length, at)
+            elif drive_fd is not None:
+                def read_at(length: int, at: int) -> bytes:
+                    return os.pread(drive_fd, length, at)
+            elif isinstance(drive_handle, Win32FileWrapper):
+                read_at = drive_handle.pread
+            else:
+                read_at = None  # Python file object on Windows: seek + read one sample at a time
+            probe_pool = None
+            if read_at is not None:
+                probe_pool = ThreadPoolExecutor(max_workers=_SURFACE_QUEUE_DEPTH, thread_name_prefix='surface-scan')
+            in_flight = deque()  # Futures of reads submitted ahead of the loop, in sector order
+            next_probe = 0  # Next sector to submit
+            
             for sector_num in range(0, total_sectors, test_interval):
                 # Check for cancellation
                 if options.get('is_cancelled') and options['is_cancelled']():
@@ -4474,17 +5971,25 @@ class PythonRecoveryService:
                 try:
                     offset = sector_num * sector_size
                     
-                    # Seek to position
-                    try:
-                        drive_handle.seek(offset)
-                    except OSError as seek_error:
-                        # Seek beyond end of file
-                        logger.debug(f"Seek error at sector {sector_num}: {seek_error}")
-                        break  # Stop scanning, we've reached the end
+                    if probe_pool is None:
+                        # Seek to position
+                        try:
+                            drive_handle.seek(offset)
+                        except OSError as seek_error:
+                            # Seek beyond end of file
+                            logger.debug(f"Seek error at sector {sector_num}: {seek_error}")
+                            break  # Stop scanning, we've reached the end
                     
                     # Try to read sector
                     try:
-                        data = drive_handle.read(sector_size)
+                        if probe_pool is not None:
+                            while len(in_flight) < _SURFACE_QUEUE_DEPTH and next_probe < total_sectors:
+                                in_flight.append(probe_pool.submit(
+                                    read_at, sector_size, next_probe * sector_size))
+                                next_probe += test_interval
+                            data = await asyncio.wrap_future(in_flight.popleft())
+                        else:
+                            data = drive_handle.read(sector_size)
                         
                         if len(data) == sector_size:
                             surface_map.append({'sector': sector_num, 'status': 'good'})
@@ -4523,6 +6028,11 @@ class PythonRecoveryService:
                     bad_sectors += 1
                     tested += 1
             
+            # Reads still queued after a cancel must not outlive the handle
+            if probe_pool is not None:
+                probe_pool.shutdown(wait=True, cancel_futures=True)
+            if direct_fd is not None:
+                os.close(direct_fd)
             drive_handle.close()
             
             logger.info(f"✅ Surface scan complete: Tested {tested:,} sectors, found {bad_sectors} bad sectors")
@@ -4709,8 +6219,9 @@ class PythonRecoveryService:
                                 await asyncio.sleep(0.1)
                             continue
                         
-                        # Extract the actual file data from aligned buffer
-                        file_data = aligned_data[offset_adjustment:offset_adjustment + size]
+                        # Extract the actual file data from aligned buffer (a view - hashed and
+                        # written straight from the read buffer without another copy)
+                        file_data = memoryview(aligned_data)[offset_adjustment:offset_adjustment + size]
                         
                         if len(file_data) != size:
                             logger.warning(f"⚠️ Read size mismatch: expected {size}, got {len(file_data)} bytes")
@@ -4815,8 +6326,7 @@ class PythonRecoveryService:
                     
                     # Write file to disk
                     try:
-                        with open(output_path, 'wb') as f:
-                            f.write(file_data)
+                        _write_preallocated(output_path, file_data)
                         logger.info(f"✅ File written successfully: {len(file_data)} bytes")
                     except Exception as write_error:
                         logger.error(f"❌ Failed to write file: {write_error}")